@@ -0,0 +1,86 @@
+"""
+Loading active votes with their ballot totals: one query per vote vs one aggregated query.
+
+    python benchmarks/bench_active_votes.py
+"""
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.map_voting import MAP_OPTIONS, VoteDatabase  # noqa: E402
+from utils.database import EventDatabase  # noqa: E402
+
+ACTIVE_VOTES = 500
+BALLOTS = 10_000
+INACTIVE_VOTES = 3_000
+INACTIVE_BALLOTS = 60_000
+ROUNDS = 20
+
+
+def seed(db: EventDatabase):
+    rng = random.Random(18)
+    maps = [option['value'] for option in MAP_OPTIONS]
+    votes = [
+        (vote_id, vote_id, 1, 1, '2030-01-01T00:00:00', '2030-01-08T00:00:00', 10080, int(vote_id <= ACTIVE_VOTES))
+        for vote_id in range(1, ACTIVE_VOTES + INACTIVE_VOTES + 1)
+    ]
+    ballots = {}
+    while len(ballots) < BALLOTS:
+        ballots[(rng.randint(1, ACTIVE_VOTES), rng.randint(1, 10 ** 6))] = rng.choice(maps)
+    while len(ballots) < BALLOTS + INACTIVE_BALLOTS:
+        ballots[(rng.randint(ACTIVE_VOTES + 1, ACTIVE_VOTES + INACTIVE_VOTES), rng.randint(1, 10 ** 6))] = rng.choice(maps)
+    with db.pool.writer() as conn:
+        conn.executemany('''
+            INSERT INTO votes (id, message_id, channel_id, guild_id, start_time, end_time, duration_minutes, active)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', votes)
+        conn.executemany(
+            'INSERT INTO user_votes (vote_id, user_id, map_choice) VALUES (?, ?, ?)',
+            [(vote_id, user_id, choice) for (vote_id, user_id), choice in ballots.items()],
+        )
+        conn.execute('ANALYZE')
+
+
+def per_vote(vote_db: VoteDatabase):
+    """The pre-aggregation shape: list the active votes, then count each one's ballots."""
+    with vote_db.pool.reader() as conn:
+        message_ids = [row[0] for row in conn.execute('SELECT message_id FROM vote_details WHERE active = 1')]
+    totals = {}
+    for message_id in message_ids:
+        with vote_db.pool.reader() as conn:
+            totals[message_id] = conn.execute('''
+                SELECT COUNT(*) FROM user_votes uv JOIN votes v ON uv.vote_id = v.id WHERE v.message_id = ?
+            ''', (message_id,)).fetchone()[0]
+    return totals
+
+
+def aggregated(vote_db: VoteDatabase):
+    return {vote['message_id']: vote['total_votes'] for vote in vote_db.get_active_votes()}
+
+
+def best(call) -> float:
+    return min(timeit.repeat(call, number=1, repeat=ROUNDS))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = EventDatabase(os.path.join(tmp, 'bench.db'))
+        seed(db)
+        vote_db = VoteDatabase(db.pool, db.writes)
+
+        assert per_vote(vote_db) == aggregated(vote_db)
+        n_plus_one = best(lambda: per_vote(vote_db))
+        one_query = best(lambda: aggregated(vote_db))
+        db.close()
+
+    print(f"{ACTIVE_VOTES} active votes, {BALLOTS:,} ballots ({INACTIVE_BALLOTS:,} more on inactive votes):")
+    print(f"  query per vote:   {n_plus_one * 1e3:7.2f} ms  ({ACTIVE_VOTES + 1} statements)")
+    print(f"  aggregated query: {one_query * 1e3:7.2f} ms  (1 statement)")
+
+
+if __name__ == '__main__':
+    main()
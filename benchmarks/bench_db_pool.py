@@ -0,0 +1,48 @@
+"""
+Guild settings read: a fresh sqlite3 connection per call vs the shared pool.
+
+    python benchmarks/bench_db_pool.py
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.database import EventDatabase  # noqa: E402
+
+QUERY = 'SELECT * FROM guild_settings WHERE guild_id = ?'
+ROUNDS = 2000
+
+
+def connect_per_call(path: str, guild_id: int):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(QUERY, (guild_id,)).fetchone()
+    finally:
+        conn.close()
+
+
+def pooled(db: EventDatabase, guild_id: int):
+    with db.pool.reader() as conn:
+        return conn.execute(QUERY, (guild_id,)).fetchone()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        db = EventDatabase(path)
+        db.get_guild_settings(1)  # creates the default row
+
+        per_call = min(timeit.repeat(lambda: connect_per_call(path, 1), number=ROUNDS, repeat=5)) / ROUNDS
+        shared = min(timeit.repeat(lambda: pooled(db, 1), number=ROUNDS, repeat=5)) / ROUNDS
+        db.close()
+
+    print(f"connect per call: {per_call * 1e6:7.1f} us per read")
+    print(f"pooled reader:    {shared * 1e6:7.1f} us per read")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Per-guild leaderboard with and without the (guild_id, stat DESC, user_id) indexes.
+
+    python benchmarks/bench_leaderboard.py
+"""
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.database import EventDatabase  # noqa: E402
+
+USERS = 100_000
+GUILDS = 50
+ROUNDS = 200
+LEADERBOARD_INDEXES = (
+    'idx_user_stats_participated', 'idx_user_stats_commanded', 'idx_user_stats_created', 'idx_user_stats_elo',
+)
+
+
+def seed(db: EventDatabase):
+    rng = random.Random(7)
+    rows = [
+        (user_id, user_id % GUILDS + 1, rng.randint(1, 200), rng.randint(0, 50), rng.randint(0, 20))
+        for user_id in range(USERS)
+    ]
+    with db.pool.writer() as conn:
+        conn.executemany('''
+            INSERT INTO user_stats (user_id, guild_id, events_participated, events_commanded, events_created)
+            VALUES (?, ?, ?, ?, ?)
+        ''', rows)
+        conn.execute('ANALYZE')
+
+
+def per_leaderboard(db: EventDatabase) -> float:
+    guilds = iter(range(ROUNDS))
+    best = min(timeit.repeat(lambda: db.get_leaderboard(next(guilds) % GUILDS + 1), number=ROUNDS, repeat=1))
+    return best / ROUNDS
+
+
+def plan(db: EventDatabase) -> str:
+    # A fresh connection: a cached EXPLAIN statement is not re-prepared after DROP INDEX
+    conn = sqlite3.connect(db.db_path)
+    try:
+        rows = conn.execute('''
+            EXPLAIN QUERY PLAN SELECT user_id, events_participated FROM user_stats
+            WHERE guild_id = ? AND events_participated > 0 ORDER BY events_participated DESC LIMIT ?
+        ''', (1, 10)).fetchall()
+    finally:
+        conn.close()
+    return '; '.join(row[3] for row in rows)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = EventDatabase(os.path.join(tmp, 'bench.db'))
+        seed(db)
+
+        indexed, indexed_plan = per_leaderboard(db), plan(db)
+        with db.pool.writer() as conn:
+            for index in LEADERBOARD_INDEXES:
+                conn.execute(f'DROP INDEX {index}')
+        unindexed, unindexed_plan = per_leaderboard(db), plan(db)
+        db.close()
+
+    print(f"{USERS:,} users over {GUILDS} guilds, top 10 of one guild:")
+    print(f"  without indexes: {unindexed * 1e3:8.3f} ms  ({unindexed_plan})")
+    print(f"  with indexes:    {indexed * 1e3:8.3f} ms  ({indexed_plan})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Roster lookups by scanning every slot (the pre-index code) vs the user ID index.
+
+    python benchmarks/bench_roster_index.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cogs.armor_events  # noqa: E402
+from cogs.armor_events import EventRoster  # noqa: E402
+
+RECRUITS = 20
+NUMBER = 20_000
+
+
+class Member:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.mention = f"<@{user_id}>"
+
+
+def full_roster(slots_per_team: int) -> EventRoster:
+    cogs.armor_events.MAX_CREWS_PER_TEAM = slots_per_team
+    roster = EventRoster("Bench", "", event_id=1)
+    roster.set_commander("A", Member(1))
+    roster.set_commander("B", Member(2))
+    user_id = 100
+    for team in ("A", "B"):
+        for _ in range(slots_per_team):
+            commander, gunner, driver = Member(user_id), Member(user_id + 1), Member(user_id + 2)
+            roster.place_crew(team, {"commander": commander, "gunner": gunner, "driver": driver, "crew_name": "Crew"})
+            user_id += 3
+    for _ in range(RECRUITS):
+        roster.add_recruit(Member(user_id))
+        user_id += 1
+    return roster
+
+
+def scan_registered(roster: EventRoster, user) -> bool:
+    if user in [roster.commander_a, roster.commander_b]:
+        return True
+    for crew_list in [roster.crews_a, roster.crews_b]:
+        for crew in crew_list:
+            if isinstance(crew, dict) and user in [crew["commander"], crew["gunner"], crew["driver"]]:
+                return True
+    return user in roster.recruits.values()
+
+
+def scan_crew(roster: EventRoster, user):
+    for team, crew_list in [("A", roster.crews_a), ("B", roster.crews_b)]:
+        for i, crew in enumerate(crew_list):
+            if isinstance(crew, dict) and crew["commander"] == user:
+                return crew, team, i
+    return None, None, None
+
+
+def per_call(call) -> float:
+    return min(timeit.repeat(call, number=NUMBER, repeat=5)) / NUMBER
+
+
+def main():
+    print(f"One registration miss plus one crew lookup for the last slot, {RECRUITS} recruits:")
+    for slots in (12, 64):
+        roster = full_roster(slots // 2)
+        stranger = Member(10 ** 9)
+        last_commander = roster.crews_b[-1]["commander"]
+        assert scan_crew(roster, last_commander) == roster.get_user_crew(last_commander)
+
+        scanned = per_call(lambda: (scan_registered(roster, stranger), scan_crew(roster, last_commander)))
+        indexed = per_call(lambda: (roster.is_user_registered(stranger), roster.get_user_crew(last_commander)))
+        print(f"  {slots:2}-slot roster: {scanned * 1e6:6.2f} us scan -> {indexed * 1e6:5.2f} us indexed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Memory held by 10k crew rows as dicts (the old row shape) vs Crew NamedTuples.
+
+    python benchmarks/bench_row_models.py
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.models import Crew  # noqa: E402
+
+ROWS = 10_000
+
+
+def raw_rows():
+    # Values are built up front so only the per-row containers are measured
+    return [
+        (crew_id, f"Crew {crew_id}", 1000 + crew_id, 2000 + crew_id, None, crew_id % 7, crew_id % 5, None)
+        for crew_id in range(ROWS)
+    ]
+
+
+def measure(build) -> int:
+    rows = raw_rows()
+    tracemalloc.start()
+    built = build(rows)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def main():
+    as_dicts = measure(lambda rows: [dict(zip(Crew._fields, row)) for row in rows])
+    as_tuples = measure(lambda rows: [Crew._make(row) for row in rows])
+
+    print(f"{ROWS:,} crew rows, container overhead only:")
+    print(f"  dicts:      {as_dicts / 1e6:5.2f} MB ({as_dicts / ROWS:.0f} bytes per row)")
+    print(f"  NamedTuple: {as_tuples / 1e6:5.2f} MB ({as_tuples / ROWS:.0f} bytes per row)")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,11 +3,14 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from discord.ui import View, Button, Select, Modal, TextInput
+import asyncio
 import logging
-from typing import Optional, List, Dict
+import time
+from typing import Optional, List
 
-from utils.database import EventDatabase
+from utils.async_db import AsyncDatabase
 from utils.config import *
+from utils.models import GuildSettings
 from utils.permissions import (
     has_scheduler_privileges,
     PERMISSION_DENIED_MESSAGE,
@@ -21,10 +24,10 @@ class AdminTools(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
-        self.db = EventDatabase()
+        self.db = bot.db
         logger.info("Admin Tools cog initialized")
 
-    def has_admin_permissions(self, user: discord.Member) -> bool:
+    async def has_admin_permissions(self, user: discord.Member) -> bool:
         """Check if user has the required elevated permissions"""
         if not isinstance(user, discord.Member):
             return False
@@ -32,8 +35,8 @@ class AdminTools(commands.Cog):
         allowed_roles = None
         if getattr(user, "guild", None):
             try:
-                guild_settings = self.db.get_guild_settings(user.guild.id)
-                allowed_roles = guild_settings.get('admin_roles')
+                guild_settings = await self.db.get_guild_settings(user.guild.id)
+                allowed_roles = guild_settings.admin_roles
             except Exception as exc:
                 logger.error(f"Failed to load guild settings for permissions: {exc}")
 
@@ -43,7 +46,7 @@ class AdminTools(commands.Cog):
     async def server_settings(self, interaction: discord.Interaction):
         """Configure bot settings for this server"""
         
-        if not self.has_admin_permissions(interaction.user):
+        if not await self.has_admin_permissions(interaction.user):
             await interaction.response.send_message(
                 PERMISSION_DENIED_MESSAGE,
                 ephemeral=True
@@ -51,7 +54,7 @@ class AdminTools(commands.Cog):
             return
         
         # Get current settings
-        settings = self.db.get_guild_settings(interaction.guild.id)
+        settings = await self.db.get_guild_settings(interaction.guild.id)
         
         embed = discord.Embed(
             title="⚙️ Bot Configuration",
@@ -62,23 +65,23 @@ class AdminTools(commands.Cog):
         # Display current settings
         embed.add_field(
             name="🛡️ Admin Roles",
-            value=", ".join(settings['admin_roles']) or "None set",
+            value=", ".join(settings.admin_roles) or "None set",
             inline=False
         )
         
         embed.add_field(
             name="📅 Event Settings",
-            value=f"**Auto Map Votes:** {'✅' if settings.get('auto_map_votes', True) else '❌'}\n"
-                  f"**Auto Role Assignment:** {'✅' if settings.get('auto_role_assignment', True) else '❌'}\n"
-                  f"**Recruitment System:** {'✅' if settings.get('recruitment_enabled', True) else '❌'}\n"
-                  f"**Max Crews per Team:** {settings.get('max_crews_per_team', 6)}\n"
-                  f"**Timezone:** {settings.get('timezone', DEFAULT_TIMEZONE)}",
+            value=f"**Auto Map Votes:** {'✅' if settings.auto_map_votes else '❌'}\n"
+                  f"**Auto Role Assignment:** {'✅' if settings.auto_role_assignment else '❌'}\n"
+                  f"**Recruitment System:** {'✅' if settings.recruitment_enabled else '❌'}\n"
+                  f"**Max Crews per Team:** {settings.max_crews_per_team}\n"
+                  f"**Timezone:** {settings.timezone}",
             inline=False
         )
         
         embed.add_field(
             name="⏰ Reminder Times",
-            value=f"{', '.join(map(str, settings.get('reminder_times', [60, 30, 10])))} minutes before events",
+            value=f"{', '.join(map(str, settings.reminder_times))} minutes before events",
             inline=False
         )
         
@@ -96,7 +99,7 @@ class AdminTools(commands.Cog):
     async def event_roles(self, interaction: discord.Interaction, action: app_commands.Choice[str]):
         """Manage event-specific roles for notifications and access control"""
         
-        if not self.has_admin_permissions(interaction.user):
+        if not await self.has_admin_permissions(interaction.user):
             await interaction.response.send_message(PERMISSION_DENIED_MESSAGE, ephemeral=True)
             return
         
@@ -182,7 +185,7 @@ class AdminTools(commands.Cog):
     async def purge_messages(self, interaction: discord.Interaction, amount: int, user: discord.Member = None):
         """Delete multiple messages at once"""
         
-        if not self.has_admin_permissions(interaction.user):
+        if not await self.has_admin_permissions(interaction.user):
             await interaction.response.send_message("❌ You don't have permission to use this command.", ephemeral=True)
             return
         
@@ -231,7 +234,7 @@ class AdminTools(commands.Cog):
                           role: discord.Role, user: discord.Member = None):
         """Manage server roles"""
         
-        if not self.has_admin_permissions(interaction.user):
+        if not await self.has_admin_permissions(interaction.user):
             await interaction.response.send_message("❌ You don't have permission to use this command.", ephemeral=True)
             return
         
@@ -308,7 +311,7 @@ class AdminTools(commands.Cog):
     async def event_cleanup(self, interaction: discord.Interaction, days_old: int = 90):
         """Clean up old completed events from the database"""
         
-        if not self.has_admin_permissions(interaction.user):
+        if not await self.has_admin_permissions(interaction.user):
             await interaction.response.send_message("❌ You don't have permission to use this command.", ephemeral=True)
             return
         
@@ -319,17 +322,33 @@ class AdminTools(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         
         try:
-            # Get count before cleanup
-            stats_before = self.db.get_database_stats()
-            
-            # Perform cleanup
-            self.db.cleanup_old_data(days_old)
-            
-            # Get count after cleanup
-            stats_after = self.db.get_database_stats()
-            
-            events_cleaned = stats_before.get('events', 0) - stats_after.get('events', 0)
-            signups_cleaned = stats_before.get('signups', 0) - stats_after.get('signups', 0)
+            progress_message = await interaction.followup.send(
+                f"{EMOJIS['loading']} Cleaning up completed events older than {days_old} days...",
+                ephemeral=True,
+                wait=True
+            )
+
+            # cleanup_old_data runs on a database thread; hop back to the loop to
+            # edit the progress message, at most once every couple of seconds
+            loop = asyncio.get_running_loop()
+            last_report = 0.0
+            pending_edits = []
+
+            def report_progress(done: int, total: int):
+                nonlocal last_report
+                now = time.monotonic()
+                if now - last_report < 2 and done < total:
+                    return
+                last_report = now
+                pending_edits.append(asyncio.run_coroutine_threadsafe(
+                    progress_message.edit(content=f"{EMOJIS['loading']} Purged {done:,} / {total:,} events..."),
+                    loop
+                ))
+
+            result = await self.db.cleanup_old_data(days_old, progress=report_progress)
+            # Let in-flight progress edits land before the final embed replaces them
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in pending_edits), return_exceptions=True)
+            stats_after = await self.db.get_database_stats()
             
             embed = discord.Embed(
                 title="🧹 Database Cleanup Complete",
@@ -338,17 +357,24 @@ class AdminTools(commands.Cog):
             
             embed.add_field(
                 name="Cleaned Up",
-                value=f"**Events:** {events_cleaned}\n**Signups:** {signups_cleaned}",
+                value=f"**Events:** {result['events']:,}\n**Signups:** {result['signups']:,}\n"
+                      f"**History:** {result['event_history']:,}\n**Reminders:** {result['reminder_queue']:,}",
                 inline=True
             )
             
             embed.add_field(
                 name="Remaining",
-                value=f"**Events:** {stats_after.get('events', 0)}\n**Signups:** {stats_after.get('signups', 0)}",
+                value=f"**Events:** {stats_after.get('events', 0):,}\n**Signups:** {stats_after.get('signups', 0):,}",
+                inline=True
+            )
+
+            embed.add_field(
+                name="Disk Reclaimed",
+                value=f"{result['bytes_reclaimed'] / (1024 * 1024):.2f} MB",
                 inline=True
             )
             
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await progress_message.edit(content=None, embed=embed)
             
         except Exception as e:
             await interaction.followup.send(f"❌ Error during cleanup: {e}", ephemeral=True)
@@ -357,11 +383,12 @@ class AdminTools(commands.Cog):
     async def database_stats(self, interaction: discord.Interaction):
         """Show database statistics"""
         
-        if not self.has_admin_permissions(interaction.user):
+        if not await self.has_admin_permissions(interaction.user):
             await interaction.response.send_message("❌ You don't have permission to use this command.", ephemeral=True)
             return
         
-        stats = self.db.get_database_stats()
+        stats = await self.db.get_database_stats()
+        storage = await self.db.get_storage_stats()
         
         embed = discord.Embed(
             title="📊 Database Statistics",
@@ -374,7 +401,46 @@ class AdminTools(commands.Cog):
                 value=f"{count:,}",
                 inline=True
             )
-        
+
+        def mb(size: int) -> str:
+            return f"{size / (1024 * 1024):.2f} MB"
+
+        embed.add_field(
+            name="💾 Storage",
+            value=f"**File:** {mb(storage['file_size'])} (+{mb(storage['wal_size'])} WAL)\n"
+                  f"**Pages:** {storage['page_count']:,} × {storage['page_size']:,} B\n"
+                  f"**Free Pages:** {storage['freelist_count']:,}",
+            inline=False
+        )
+
+        for group, title in (('tables', "🗃️ Largest Tables"), ('indexes', "🔎 Largest Indexes")):
+            sizes = sorted(storage[group].items(), key=lambda item: item[1]['bytes'], reverse=True)[:8]
+            if sizes:
+                embed.add_field(
+                    name=title,
+                    value="\n".join(
+                        f"`{name}`: {mb(info['bytes'])} ({info['pages']:,} pages)" for name, info in sizes
+                    ),
+                    inline=True
+                )
+
+        edits = interaction.client.edit_scheduler.stats()
+        embed.add_field(
+            name="✏️ Message Edit Queue",
+            value=f"**Queued:** {edits['queue_depth']:,} in {edits['busy_channels']:,} channels\n"
+                  f"**Sent:** {edits['performed']:,} • **Coalesced:** {edits['coalesced']:,} • "
+                  f"**Failed:** {edits['failed']:,}\n"
+                  f"**Latency:** avg {edits['latency_avg_ms']:.0f} ms • p95 {edits['latency_p95_ms']:.0f} ms • "
+                  f"max {edits['latency_max_ms']:.0f} ms",
+            inline=False
+        )
+
+        cache_stats = self.db.settings_cache.stats()
+        embed.set_footer(
+            text=f"Settings cache: {cache_stats['hits']:,} hits / {cache_stats['misses']:,} misses "
+                 f"({cache_stats['entries']} guilds cached)"
+        )
+
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @commands.Cog.listener()
@@ -385,7 +451,7 @@ class AdminTools(commands.Cog):
 # UI Components for Bot Settings and Role Management
 
 class BotSettingsView(View):
-    def __init__(self, settings: Dict, db: EventDatabase):
+    def __init__(self, settings: GuildSettings, db: AsyncDatabase):
         super().__init__(timeout=TIMEOUTS["admin_controls"])
         self.settings = settings
         self.db = db
@@ -399,7 +465,7 @@ class BotSettingsView(View):
 
 class ToggleAutoMapVotesButton(Button):
     def __init__(self, parent):
-        current_state = parent.settings.get('auto_map_votes', True)
+        current_state = parent.settings.auto_map_votes
         label = "🗳️ Disable Auto Map Votes" if current_state else "🗳️ Enable Auto Map Votes"
         style = discord.ButtonStyle.danger if current_state else discord.ButtonStyle.success
         
@@ -407,12 +473,12 @@ class ToggleAutoMapVotesButton(Button):
         self.parent = parent
 
     async def callback(self, interaction: discord.Interaction):
-        current_state = self.parent.settings.get('auto_map_votes', True)
+        current_state = self.parent.settings.auto_map_votes
         new_state = not current_state
         
         # Update database
-        self.parent.db.update_guild_setting(interaction.guild.id, 'auto_map_votes', new_state)
-        self.parent.settings['auto_map_votes'] = new_state
+        await self.parent.db.update_guild_setting(interaction.guild.id, 'auto_map_votes', new_state)
+        self.parent.settings = self.parent.settings._replace(auto_map_votes=new_state)
         
         # Update button
         self.label = "🗳️ Disable Auto Map Votes" if new_state else "🗳️ Enable Auto Map Votes"
@@ -426,7 +492,7 @@ class ToggleAutoMapVotesButton(Button):
 
 class ToggleAutoRolesButton(Button):
     def __init__(self, parent):
-        current_state = parent.settings.get('auto_role_assignment', True)
+        current_state = parent.settings.auto_role_assignment
         label = "🎭 Disable Auto Roles" if current_state else "🎭 Enable Auto Roles"
         style = discord.ButtonStyle.danger if current_state else discord.ButtonStyle.success
         
@@ -434,11 +500,11 @@ class ToggleAutoRolesButton(Button):
         self.parent = parent
 
     async def callback(self, interaction: discord.Interaction):
-        current_state = self.parent.settings.get('auto_role_assignment', True)
+        current_state = self.parent.settings.auto_role_assignment
         new_state = not current_state
         
-        self.parent.db.update_guild_setting(interaction.guild.id, 'auto_role_assignment', new_state)
-        self.parent.settings['auto_role_assignment'] = new_state
+        await self.parent.db.update_guild_setting(interaction.guild.id, 'auto_role_assignment', new_state)
+        self.parent.settings = self.parent.settings._replace(auto_role_assignment=new_state)
         
         self.label = "🎭 Disable Auto Roles" if new_state else "🎭 Enable Auto Roles"
         self.style = discord.ButtonStyle.danger if new_state else discord.ButtonStyle.success
@@ -451,7 +517,7 @@ class ToggleAutoRolesButton(Button):
 
 class ToggleRecruitmentButton(Button):
     def __init__(self, parent):
-        current_state = parent.settings.get('recruitment_enabled', True)
+        current_state = parent.settings.recruitment_enabled
         label = "🎯 Disable Recruitment" if current_state else "🎯 Enable Recruitment"
         style = discord.ButtonStyle.danger if current_state else discord.ButtonStyle.success
         
@@ -459,11 +525,11 @@ class ToggleRecruitmentButton(Button):
         self.parent = parent
 
     async def callback(self, interaction: discord.Interaction):
-        current_state = self.parent.settings.get('recruitment_enabled', True)
+        current_state = self.parent.settings.recruitment_enabled
         new_state = not current_state
         
-        self.parent.db.update_guild_setting(interaction.guild.id, 'recruitment_enabled', new_state)
-        self.parent.settings['recruitment_enabled'] = new_state
+        await self.parent.db.update_guild_setting(interaction.guild.id, 'recruitment_enabled', new_state)
+        self.parent.settings = self.parent.settings._replace(recruitment_enabled=new_state)
         
         self.label = "🎯 Disable Recruitment" if new_state else "🎯 Enable Recruitment"
         self.style = discord.ButtonStyle.danger if new_state else discord.ButtonStyle.success
@@ -495,7 +561,7 @@ class EditAdminRolesModal(Modal):
         super().__init__(title="Edit Admin Roles")
         self.settings_view = settings_view
         
-        current_roles = ", ".join(self.settings_view.settings.get('admin_roles', []))
+        current_roles = ", ".join(self.settings_view.settings.admin_roles)
         
         self.roles_input = TextInput(
             label="Admin Role Names",
@@ -514,8 +580,8 @@ class EditAdminRolesModal(Modal):
             return
         
         # Update database
-        self.settings_view.db.update_guild_setting(interaction.guild.id, 'admin_roles', role_names)
-        self.settings_view.settings['admin_roles'] = role_names
+        await self.settings_view.db.update_guild_setting(interaction.guild.id, 'admin_roles', role_names)
+        self.settings_view.settings = self.settings_view.settings._replace(admin_roles=tuple(role_names))
         
         await interaction.response.send_message(
             f"✅ Admin roles updated: {', '.join(role_names)}", 
@@ -527,7 +593,7 @@ class EditReminderTimesModal(Modal):
         super().__init__(title="Edit Reminder Times")
         self.settings_view = settings_view
         
-        current_times = ", ".join(map(str, self.settings_view.settings.get('reminder_times', [60, 30, 10])))
+        current_times = ", ".join(map(str, self.settings_view.settings.reminder_times))
         
         self.times_input = TextInput(
             label="Reminder Times (minutes)",
@@ -550,8 +616,8 @@ class EditReminderTimesModal(Modal):
                 return
             
             # Update database
-            self.settings_view.db.update_guild_setting(interaction.guild.id, 'reminder_times', time_values)
-            self.settings_view.settings['reminder_times'] = time_values
+            await self.settings_view.db.update_guild_setting(interaction.guild.id, 'reminder_times', time_values)
+            self.settings_view.settings = self.settings_view.settings._replace(reminder_times=tuple(time_values))
             
             await interaction.response.send_message(
                 f"✅ Reminder times updated: {', '.join(map(str, time_values))} minutes", 
@@ -712,7 +778,7 @@ class EditTimezoneModal(Modal):
         super().__init__(title='Set Event Timezone')
         self.settings_view = settings_view
 
-        current_tz = self.settings_view.settings.get('timezone', DEFAULT_TIMEZONE)
+        current_tz = self.settings_view.settings.timezone
         self.timezone_input = TextInput(
             label='IANA Timezone (e.g., America/New_York)',
             placeholder='Use a timezone from https://momentjs.com/timezone/',
@@ -738,12 +804,13 @@ class EditTimezoneModal(Modal):
             )
             return
 
-        settings_data = self.settings_view.settings.get('settings_data', {}).copy()
+        settings_data = dict(self.settings_view.settings.settings_data)
         settings_data['timezone'] = canonical
 
-        self.settings_view.db.update_guild_setting(interaction.guild.id, 'settings_data', settings_data)
-        self.settings_view.settings['settings_data'] = settings_data
-        self.settings_view.settings['timezone'] = canonical
+        await self.settings_view.db.update_guild_setting(interaction.guild.id, 'settings_data', settings_data)
+        self.settings_view.settings = self.settings_view.settings._replace(
+            settings_data=settings_data, timezone=canonical
+        )
 
         await interaction.response.send_message(
             f'✅ Timezone updated to **{canonical}**.',
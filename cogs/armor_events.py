@@ -2,12 +2,16 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from discord.ui import View, Button, UserSelect, Select, Modal, TextInput
+from discord.ui import View, Button, UserSelect, Select, Modal, TextInput, DynamicItem
+import asyncio
 import logging
 import datetime
-from typing import Optional, Dict, List
+import weakref
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Iterable, List, Set, Tuple
 
-from utils.database import EventDatabase
+from utils.models import Signup, SignupPanel
+from utils.roster_cache import RosterCache
 from utils.config import *
 from utils.timezone_utils import get_timezone, parse_event_datetime
 from utils.permissions import (
@@ -20,18 +24,62 @@ logger = logging.getLogger(__name__)
 class ArmorEvents(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = EventDatabase()
+        self.db = bot.db
+        self.rosters = RosterCache()
+        # Per-event, not per-roster: an evicted roster and its reloaded copy share one lock.
+        # Weak values: a lock goes away once no roster refers to it and no click holds or awaits it
+        self._roster_locks: 'weakref.WeakValueDictionary[int, asyncio.Lock]' = weakref.WeakValueDictionary()
         logger.info("Armor Events cog initialized")
 
-    def _has_privileges(self, member: discord.Member) -> bool:
+    async def cog_load(self):
+        """Route every signup panel's components, old and new, through one handler per action"""
+        self.bot.add_dynamic_items(*SIGNUP_COMPONENTS)
+
+    async def cog_unload(self):
+        self.bot.remove_dynamic_items(*SIGNUP_COMPONENTS)
+
+    def roster_lock(self, event_id: int) -> asyncio.Lock:
+        """The lock that serializes every change to one event's roster"""
+        lock = self._roster_locks.get(event_id)
+        if lock is None:
+            lock = self._roster_locks[event_id] = asyncio.Lock()
+        return lock
+
+    async def get_roster(self, interaction: discord.Interaction, event_id: int) -> Optional["EventRoster"]:
+        """
+        The roster behind a signup panel: from the cache, or rebuilt from the
+        database on a miss. Returns None when the event is no longer open.
+        """
+        roster = self.rosters.get(event_id)
+        if roster is not None:
+            return roster
+
+        # An evicted copy may be mid-change; its lock waits that change out, and
+        # the flush commits its queued writes so the reload sees them
+        async with self.roster_lock(event_id):
+            await self.db.flush()
+            panel = await self.db.get_signup_panel(event_id)
+        if panel is None:
+            return None
+
+        roster = EventRoster.from_panel(panel, interaction.guild)
+        roster.lock = self.roster_lock(event_id)
+        # Menus opened from the panel are ephemeral messages, so use the panel's own IDs
+        roster.message = self.bot.get_partial_messageable(
+            panel.channel_id, guild_id=panel.guild_id
+        ).get_partial_message(panel.message_id)
+        # Another click may have loaded it while this one waited on the database
+        return self.rosters.setdefault(event_id, roster)
+
+    async def _has_privileges(self, member: discord.Member) -> bool:
         """Return True when the member can manage events."""
         allowed_roles = None
         guild = getattr(member, "guild", None)
 
         if guild:
             try:
-                guild_settings = self.db.get_guild_settings(guild.id)
-                allowed_roles = guild_settings.get("admin_roles")
+                guild_settings = await self.db.get_guild_settings(guild.id)
+                allowed_roles = guild_settings.admin_roles
             except Exception as exc:
                 logger.error(f"Failed to load guild settings for permissions: {exc}")
 
@@ -54,12 +102,12 @@ class ArmorEvents(commands.Cog):
     async def schedule_event(self, interaction: discord.Interaction, event_type: app_commands.Choice[str],
                            date: str = None, time: str = None, map_vote_channel: discord.TextChannel = None):
         
-        if not self._has_privileges(interaction.user):
+        if not await self._has_privileges(interaction.user):
             await interaction.response.send_message(PERMISSION_DENIED_MESSAGE, ephemeral=True)
             return
 
-        guild_settings = self.db.get_guild_settings(interaction.guild.id)
-        timezone_name = guild_settings.get("timezone", DEFAULT_TIMEZONE)
+        guild_settings = await self.db.get_guild_settings(interaction.guild.id)
+        timezone_name = guild_settings.timezone
         
         event_datetime = None
         if date or time:
@@ -78,7 +126,7 @@ class ArmorEvents(commands.Cog):
         
         # Create event in database (with error handling)
         try:
-            event_id = self.db.create_event(
+            event_id = await self.db.create_event(
                 guild_id=interaction.guild.id,
                 channel_id=interaction.channel.id,
                 creator_id=interaction.user.id,
@@ -93,10 +141,17 @@ class ArmorEvents(commands.Cog):
             event_id = 99999  # Fake ID
         
         # Create event signup with full functionality
-        view = EventSignupView(preset["title"], preset["description"], event_datetime, event_type.value, event_id)
-        embed = view.build_embed(interaction.user)
-        message = await interaction.channel.send(embed=embed, view=view)
-        view.message = message
+        roster = EventRoster(preset["title"], preset["description"], event_datetime, event_type.value, event_id)
+        embed = roster.build_embed(interaction.user)
+        message = await interaction.channel.send(embed=embed, view=EventSignupView(event_id))
+        roster.message = message
+        roster.lock = self.roster_lock(event_id)
+        self.rosters.put(event_id, roster)
+
+        try:
+            await self.db.update_event_message(event_id, message.id)
+        except Exception as e:
+            logger.error(f"Database error: {e}")
         
         # Auto-create map vote (separate message) - Use selected channel or current channel
         vote_channel = map_vote_channel if map_vote_channel else interaction.channel
@@ -314,7 +369,7 @@ class ArmorEvents(commands.Cog):
     @app_commands.command(name="list_roles")
     async def list_roles(self, interaction: discord.Interaction):
         """List all event roles in the server"""
-        if not self._has_privileges(interaction.user):
+        if not await self._has_privileges(interaction.user):
             await interaction.response.send_message(PERMISSION_DENIED_MESSAGE, ephemeral=True)
             return
         
@@ -337,8 +392,25 @@ class ArmorEvents(commands.Cog):
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 class EventSignupView(View):
-    def __init__(self, title, description, event_time=None, event_type="custom", event_id=None):
+    """
+    A signup panel's components. Each one carries the event ID in its
+    custom_id and is dispatched as a dynamic item, so no view is kept per
+    message and panels keep working across restarts.
+    """
+    def __init__(self, event_id: int):
         super().__init__(timeout=None)
+        self.add_item(CommanderSelect(event_id))
+        self.add_item(JoinCrewAButton(event_id))
+        self.add_item(JoinCrewBButton(event_id))
+        self.add_item(JoinWithCrewButton(event_id))  # NEW: Join with persistent crew
+        self.add_item(RecruitMeButton(event_id))
+        self.add_item(RecruitPlayersButton(event_id))
+        self.add_item(EditCrewButton(event_id))
+        self.add_item(LeaveEventButton(event_id))
+
+class EventRoster:
+    """One event's signup state, cached by the cog and loaded on demand"""
+    def __init__(self, title, description, event_time=None, event_type="custom", event_id=None):
         self.title = title
         self.description = description
         self.event_time = event_time
@@ -351,17 +423,132 @@ class EventSignupView(View):
         self.commander_b = None
         self.crews_a = [None] * MAX_CREWS_PER_TEAM
         self.crews_b = [None] * MAX_CREWS_PER_TEAM
-        self.recruits = []  # Changed from solo_players to recruits
-        
-        # Add buttons WITH persistent crew integration
-        self.add_item(CommanderSelect(self))
-        self.add_item(JoinCrewAButton(self))
-        self.add_item(JoinCrewBButton(self))
-        self.add_item(JoinWithCrewButton(self))  # NEW: Join with persistent crew
-        self.add_item(RecruitMeButton(self))
-        self.add_item(RecruitPlayersButton(self))
-        self.add_item(EditCrewButton(self))
-        self.add_item(LeaveEventButton(self))
+        self.recruits: Dict[int, discord.Member] = {}  # Changed from solo_players to recruits
+
+        # user_id -> (position, team, crew slot); every mutation below keeps it in step,
+        # so registration checks never scan the roster
+        self.positions: Dict[int, Tuple[str, Optional[str], Optional[int]]] = {}
+
+        # Held from the registration check through the mutation and its save, so concurrent
+        # clicks apply one at a time; role changes and replies happen after it is released.
+        # The cog hands out one lock per event (ArmorEvents.roster_lock)
+        self.lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def from_panel(cls, panel: SignupPanel, guild: discord.Guild) -> "EventRoster":
+        """Rebuild a roster from an event row and its saved signups"""
+        event_time = datetime.datetime.fromisoformat(panel.event_time) if panel.event_time else None
+        view = cls(panel.title, panel.description, event_time, panel.event_type, panel.event_id)
+        view.restore_roster(panel.signups, guild)
+        return view
+
+    def restore_roster(self, signups: Iterable[Signup], guild: discord.Guild):
+        """Fill the roster from saved signups; members who left the guild are skipped"""
+        crews = {}
+        for signup in signups:
+            member = guild.get_member(signup.user_id)
+            if member is None:
+                continue
+            if signup.signup_type == "commander":
+                self.set_commander(signup.team, member)
+            elif signup.signup_type == "solo":
+                self.add_recruit(member)
+            elif signup.signup_type == "crew":
+                crews.setdefault((signup.team, signup.crew_slot), {})[signup.role] = (member, signup)
+
+        for (team, slot_index), seats in crews.items():
+            slot_list = self.crew_slots(team)
+            if "commander" not in seats or slot_index is None or not 0 <= slot_index < len(slot_list):
+                continue
+
+            commander, signup = seats["commander"]
+            crew = {
+                "commander": commander,
+                "crew_name": signup.crew_name,
+                # A seat without its own row is filled by the commander
+                "gunner": seats.get("gunner", seats["commander"])[0],
+                "driver": seats.get("driver", seats["commander"])[0],
+            }
+            if signup.persistent_crew_id:
+                crew["persistent_crew_id"] = signup.persistent_crew_id
+            self.place_crew(team, crew, slot_index)
+
+    def crew_slots(self, team) -> list:
+        return self.crews_a if team == "A" else self.crews_b
+
+    def set_commander(self, team, member):
+        """Make ``member`` the team's commander"""
+        previous = self.commander_a if team == "A" else self.commander_b
+        if previous is not None:
+            self.positions.pop(previous.id, None)
+        if team == "A":
+            self.commander_a = member
+        else:
+            self.commander_b = member
+        self.positions[member.id] = ("commander", team, None)
+
+    def add_recruit(self, member):
+        self.recruits[member.id] = member
+        self.positions[member.id] = ("recruit", None, None)
+
+    def take_recruit(self, user_id: int) -> Optional[discord.Member]:
+        """Remove a recruit from the pool, e.g. to seat them in a crew"""
+        member = self.recruits.pop(user_id, None)
+        if member is not None:
+            self.positions.pop(user_id, None)
+        return member
+
+    def place_crew(self, team, crew, slot_index=None) -> Optional[int]:
+        """Seat a crew in ``slot_index`` or the first free slot; returns the slot, or None if the team is full"""
+        slot_list = self.crew_slots(team)
+        if slot_index is None:
+            slot_index = next((i for i, slot in enumerate(slot_list) if slot is None), None)
+            if slot_index is None:
+                return None
+        slot_list[slot_index] = crew
+        for member in (crew["commander"], crew["gunner"], crew["driver"]):
+            if member:
+                self.positions[member.id] = ("crew", team, slot_index)
+        return slot_index
+
+    def holds_crew(self, crew, team, slot_index) -> bool:
+        """False once the crew an open edit menu refers to has left the event"""
+        return self.crew_slots(team)[slot_index] is crew
+
+    def set_crew_seat(self, crew, team, slot_index, role, member):
+        """Put ``member`` in a seated crew's gunner or driver seat; returns whoever sat there before"""
+        replaced = crew[role]
+        crew[role] = member
+        if replaced is not None and replaced not in (crew["commander"], crew["gunner"], crew["driver"]):
+            self.positions.pop(replaced.id, None)
+        self.positions[member.id] = ("crew", team, slot_index)
+        return replaced
+
+    def remove_user(self, user) -> Set[int]:
+        """
+        Take ``user`` off the roster and return the IDs of everyone removed:
+        a crew leaves as a unit. Empty when the user was not registered.
+        """
+        position = self.positions.pop(user.id, None)
+        if position is None:
+            return set()
+
+        kind, team, slot_index = position
+        if kind == "commander":
+            if team == "A":
+                self.commander_a = None
+            else:
+                self.commander_b = None
+        elif kind == "recruit":
+            del self.recruits[user.id]
+        else:
+            slot_list = self.crew_slots(team)
+            crew, slot_list[slot_index] = slot_list[slot_index], None
+            removed = {member.id for member in (crew["commander"], crew["gunner"], crew["driver"]) if member}
+            for user_id in removed:
+                self.positions.pop(user_id, None)
+            return removed | {user.id}
+        return {user.id}
 
     def build_embed(self, author=None):
         embed = discord.Embed(title=self.title, description=self.description, color=0xFF0000)
@@ -395,7 +582,7 @@ class EventSignupView(View):
         embed.add_field(name="🔵 Axis Crews", value=axis_text, inline=True)
         
         # Available recruits (changed from solo players)
-        recruit_text = "\n".join([f"- {user.mention}" for user in self.recruits]) or "[None Available]"
+        recruit_text = "\n".join([f"- {user.mention}" for user in self.recruits.values()]) or "[None Available]"
         embed.add_field(name="🎯 Available Recruits", value=recruit_text, inline=False)
         
         # Add legend
@@ -408,20 +595,16 @@ class EventSignupView(View):
 
     def is_user_registered(self, user):
         """Check if user is already registered"""
-        if user in [self.commander_a, self.commander_b]:
-            return True
-        for crew_list in [self.crews_a, self.crews_b]:
-            for crew in crew_list:
-                if isinstance(crew, dict) and user in [crew["commander"], crew["gunner"], crew["driver"]]:
-                    return True
-        return user in self.recruits
+        return user.id in self.positions
 
     def get_user_crew(self, user):
         """Get the crew and team for a user"""
-        for team, crew_list in [("A", self.crews_a), ("B", self.crews_b)]:
-            for i, crew in enumerate(crew_list):
-                if isinstance(crew, dict) and crew["commander"] == user:
-                    return crew, team, i
+        position = self.positions.get(user.id)
+        if position is not None and position[0] == "crew":
+            _, team, slot_index = position
+            crew = self.crew_slots(team)[slot_index]
+            if crew["commander"].id == user.id:
+                return crew, team, slot_index
         return None, None, None
 
     def is_user_commander(self, user):
@@ -429,82 +612,167 @@ class EventSignupView(View):
         crew, team, slot_index = self.get_user_crew(user)
         return crew is not None
 
+    def crew_signups(self, crew, team, slot_index) -> List[Signup]:
+        """Signup rows for every member of a crew slot (a member filling two seats is saved once)"""
+        signups = {}
+        for role in ("driver", "gunner", "commander"):
+            member = crew.get(role)
+            if member:
+                signups[member.id] = Signup(
+                    member.id, "crew", team, role, crew["crew_name"], slot_index, crew.get("persistent_crew_id")
+                )
+        return list(signups.values())
+
+    async def save_signups(self, client, signups: List[Signup]):
+        """Persist roster changes so the panel survives a restart"""
+        if self.event_id:
+            await client.db.save_signups_bulk(self.event_id, signups)
+
+    async def remove_signups(self, client, user_ids: Iterable[int]):
+        """Delete the saved signups of users who left the roster"""
+        if self.event_id:
+            await client.db.remove_signups_bulk(self.event_id, user_ids)
+
+    async def save_crew(self, client, crew, team, slot_index, replaced=None):
+        """Persist a crew slot; ``replaced`` is a member who just lost their seat in it"""
+        seated = {member.id for member in (crew["commander"], crew["gunner"], crew["driver"]) if member}
+        if replaced is not None and replaced.id not in seated:
+            await self.remove_signups(client, [replaced.id])
+        await self.save_signups(client, self.crew_signups(crew, team, slot_index))
+
     async def update_embed(self, interaction):
         if self.message:
-            embed = self.build_embed()
-            await self.message.edit(embed=embed, view=self)
+            # Changes within the debounce window share one edit, rendered from the roster as it is then;
+            # nothing is awaited, so the interaction is acknowledged right away
+            interaction.client.edit_scheduler.defer(
+                self.message, lambda: {"embed": self.build_embed()}, SIGNUP_EDIT_DEBOUNCE
+            )
+
+async def current_roster(interaction: discord.Interaction, event_id: int) -> Optional[EventRoster]:
+    """
+    The event's roster as the cog holds it now. Panel components and the menus
+    they open keep only the event ID and look the roster up on every click, so
+    none of them acts on a copy the cache has since evicted and reloaded.
+    Replies and returns None when the event is no longer open for signups.
+    """
+    armor_events_cog = interaction.client.get_cog('ArmorEvents')
+    roster = await armor_events_cog.get_roster(interaction, event_id) if armor_events_cog else None
+    if roster is None:
+        await interaction.response.send_message("❌ This event is no longer open for signups.", ephemeral=True)
+    return roster
 
 # UI Components with Role Assignment
-class CommanderSelect(Select):
-    def __init__(self, view):
+class SignupComponent(ABC):
+    """
+    Mixin for the signup panel's dynamic items: rebuilt from the custom_id
+    on every click, then handed the event's roster.
+    """
+    def __init__(self, event_id: int, item):
+        super().__init__(item)
+        self.event_id = event_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item, match):
+        return cls(int(match["event_id"]))
+
+    async def callback(self, interaction: discord.Interaction):
+        roster = await current_roster(interaction, self.event_id)
+        if roster is not None:
+            await self.handle(interaction, roster)
+
+    @abstractmethod
+    async def handle(self, interaction: discord.Interaction, roster: EventRoster):
+        """Act on a click against the event's current roster"""
+
+def signup_custom_id(event_id: int, action: str) -> str:
+    """custom_id of one of an event's signup components"""
+    return f"event_signup:{event_id}:{action}"
+
+class CommanderSelect(SignupComponent, DynamicItem[Select], template=r"event_signup:(?P<event_id>\d+):commander"):
+    def __init__(self, event_id: int):
         options = [
             discord.SelectOption(label="Allies Commander", value="A", emoji="🗾"),
             discord.SelectOption(label="Axis Commander", value="B", emoji="🔵")
         ]
-        super().__init__(placeholder="Become a Team Commander", options=options)
-        self.view_ref = view
+        super().__init__(event_id, Select(
+            placeholder="Become a Team Commander", options=options,
+            custom_id=signup_custom_id(event_id, "commander")
+        ))
 
-    async def callback(self, interaction: discord.Interaction):
-        if self.view_ref.is_user_registered(interaction.user):
-            await interaction.response.send_message("❌ Already registered!", ephemeral=True)
+    async def handle(self, interaction: discord.Interaction, roster: EventRoster):
+        team = self.item.values[0]  # "A" or "B"
+        team_name = "Allies" if team == "A" else "Axis"
+
+        async with roster.lock:
+            if roster.is_user_registered(interaction.user):
+                error = "❌ Already registered!"
+            elif (roster.commander_a if team == "A" else roster.commander_b) is not None:
+                error = f"❌ {team_name} already has a commander!"
+            else:
+                error = None
+                roster.set_commander(team, interaction.user)
+                await roster.save_signups(
+                    interaction.client, [Signup(interaction.user.id, "commander", team, "commander", None, None)]
+                )
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
             return
         
-        team = self.values[0]  # "A" or "B"
-        if team == "A":
-            self.view_ref.commander_a = interaction.user
-        else:
-            self.view_ref.commander_b = interaction.user
-        
         # Assign team role
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
         if armor_events_cog:
-            await armor_events_cog.assign_event_role(interaction.user, self.view_ref.event_type, team)
+            await armor_events_cog.assign_event_role(interaction.user, roster.event_type, team)
         
-        await self.view_ref.update_embed(interaction)
-        team_name = "Allies" if team == "A" else "Axis"
+        await roster.update_embed(interaction)
         await interaction.response.send_message(f"✅ You are now {team_name} Commander! Team role assigned.", ephemeral=True)
 
-class JoinCrewAButton(Button):
-    def __init__(self, view):
-        super().__init__(label="🗾 Join Allies Crew", style=discord.ButtonStyle.primary)
-        self.view_ref = view
+class JoinCrewAButton(SignupComponent, DynamicItem[Button], template=r"event_signup:(?P<event_id>\d+):join_crew_a"):
+    def __init__(self, event_id: int):
+        super().__init__(event_id, Button(
+            label="🗾 Join Allies Crew", style=discord.ButtonStyle.primary,
+            custom_id=signup_custom_id(event_id, "join_crew_a")
+        ))
 
-    async def callback(self, interaction: discord.Interaction):
-        if self.view_ref.is_user_registered(interaction.user):
+    async def handle(self, interaction: discord.Interaction, roster: EventRoster):
+        if roster.is_user_registered(interaction.user):
             await interaction.response.send_message("❌ Already registered!", ephemeral=True)
             return
         
         # Pre-assign Allies role before crew selection
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
         if armor_events_cog:
-            await armor_events_cog.assign_event_role(interaction.user, self.view_ref.event_type, "A")
+            await armor_events_cog.assign_event_role(interaction.user, roster.event_type, "A")
         
-        await interaction.response.send_message(view=CrewSelectView(self.view_ref, "A", interaction.user), ephemeral=True)
+        await interaction.response.send_message(view=CrewSelectView(roster, "A", interaction.user), ephemeral=True)
 
-class JoinCrewBButton(Button):
-    def __init__(self, view):
-        super().__init__(label="🔵 Join Axis Crew", style=discord.ButtonStyle.danger)
-        self.view_ref = view
+class JoinCrewBButton(SignupComponent, DynamicItem[Button], template=r"event_signup:(?P<event_id>\d+):join_crew_b"):
+    def __init__(self, event_id: int):
+        super().__init__(event_id, Button(
+            label="🔵 Join Axis Crew", style=discord.ButtonStyle.danger,
+            custom_id=signup_custom_id(event_id, "join_crew_b")
+        ))
 
-    async def callback(self, interaction: discord.Interaction):
-        if self.view_ref.is_user_registered(interaction.user):
+    async def handle(self, interaction: discord.Interaction, roster: EventRoster):
+        if roster.is_user_registered(interaction.user):
             await interaction.response.send_message("❌ Already registered!", ephemeral=True)
             return
         
         # Pre-assign Axis role before crew selection  
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
         if armor_events_cog:
-            await armor_events_cog.assign_event_role(interaction.user, self.view_ref.event_type, "B")
+            await armor_events_cog.assign_event_role(interaction.user, roster.event_type, "B")
         
-        await interaction.response.send_message(view=CrewSelectView(self.view_ref, "B", interaction.user), ephemeral=True)
+        await interaction.response.send_message(view=CrewSelectView(roster, "B", interaction.user), ephemeral=True)
 
-class JoinWithCrewButton(Button):
-    def __init__(self, view):
-        super().__init__(label="🔗 Join with My Crew", style=discord.ButtonStyle.success, row=1)
-        self.view_ref = view
+class JoinWithCrewButton(SignupComponent, DynamicItem[Button], template=r"event_signup:(?P<event_id>\d+):join_with_crew"):
+    def __init__(self, event_id: int):
+        super().__init__(event_id, Button(
+            label="🔗 Join with My Crew", style=discord.ButtonStyle.success, row=1,
+            custom_id=signup_custom_id(event_id, "join_with_crew")
+        ))
 
-    async def callback(self, interaction: discord.Interaction):
-        if self.view_ref.is_user_registered(interaction.user):
+    async def handle(self, interaction: discord.Interaction, roster: EventRoster):
+        if roster.is_user_registered(interaction.user):
             await interaction.response.send_message("❌ Already registered!", ephemeral=True)
             return
         
@@ -514,8 +782,8 @@ class JoinWithCrewButton(Button):
             await interaction.response.send_message("❌ Crew management system not available.", ephemeral=True)
             return
         
-        user_crews = crew_cog.db.get_user_crews(interaction.user.id, interaction.guild.id)
-        commander_crews = [crew for crew in user_crews if crew['commander_id'] == interaction.user.id]
+        user_crews = await crew_cog.db.get_user_crews(interaction.user.id, interaction.guild.id)
+        commander_crews = [crew for crew in user_crews if crew.commander_id == interaction.user.id]
         
         if not commander_crews:
             await interaction.response.send_message(
@@ -526,132 +794,129 @@ class JoinWithCrewButton(Button):
         
         # Check if any crew members are already registered
         for crew in commander_crews:
-            members = [crew['commander_id'], crew['gunner_id'], crew['driver_id']]
-            for member_id in members:
-                if member_id:
-                    member = interaction.guild.get_member(member_id)
-                    if member and self.view_ref.is_user_registered(member):
-                        await interaction.response.send_message(
-                            f"❌ Crew member {member.mention} is already registered for this event!",
-                            ephemeral=True
-                        )
-                        return
+            for member_id in (crew.commander_id, crew.gunner_id, crew.driver_id):
+                if member_id in roster.positions:
+                    await interaction.response.send_message(
+                        f"❌ Crew member <@{member_id}> is already registered for this event!",
+                        ephemeral=True
+                    )
+                    return
         
         if len(commander_crews) == 1:
             await interaction.response.send_message(
-                view=PersistentCrewTeamSelectView(self.view_ref, commander_crews[0]),
+                view=PersistentCrewTeamSelectView(roster.event_id, commander_crews[0]),
                 ephemeral=True
             )
         else:
             await interaction.response.send_message(
                 "Select which crew to join with:",
-                view=PersistentCrewSelectionView(self.view_ref, commander_crews),
+                view=PersistentCrewSelectionView(roster.event_id, commander_crews),
                 ephemeral=True
             )
 
-class RecruitMeButton(Button):
-    def __init__(self, view):
-        super().__init__(label="🎯 Recruit Me", style=discord.ButtonStyle.secondary, row=1)
-        self.view_ref = view
-
-    async def callback(self, interaction: discord.Interaction):
-        if self.view_ref.is_user_registered(interaction.user):
-            await interaction.response.send_message("❌ Already registered!", ephemeral=True)
+class RecruitMeButton(SignupComponent, DynamicItem[Button], template=r"event_signup:(?P<event_id>\d+):recruit_me"):
+    def __init__(self, event_id: int):
+        super().__init__(event_id, Button(
+            label="🎯 Recruit Me", style=discord.ButtonStyle.secondary, row=1,
+            custom_id=signup_custom_id(event_id, "recruit_me")
+        ))
+
+    async def handle(self, interaction: discord.Interaction, roster: EventRoster):
+        async with roster.lock:
+            if roster.is_user_registered(interaction.user):
+                error = "❌ Already registered!"
+            else:
+                error = None
+                roster.add_recruit(interaction.user)
+                await roster.save_signups(
+                    interaction.client, [Signup(interaction.user.id, "solo", None, "solo", None, None)]
+                )
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
             return
         
-        self.view_ref.recruits.append(interaction.user)
-        
         # Assign general participant role (no team)
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
         if armor_events_cog:
-            await armor_events_cog.assign_event_role(interaction.user, self.view_ref.event_type)
+            await armor_events_cog.assign_event_role(interaction.user, roster.event_type)
         
-        await self.view_ref.update_embed(interaction)
+        await roster.update_embed(interaction)
         await interaction.response.send_message("✅ Added to recruit pool! Event role assigned.", ephemeral=True)
 
-class RecruitPlayersButton(Button):
-    def __init__(self, view):
-        super().__init__(label="👥 Recruit Players", style=discord.ButtonStyle.secondary, row=1)
-        self.view_ref = view
+class RecruitPlayersButton(SignupComponent, DynamicItem[Button], template=r"event_signup:(?P<event_id>\d+):recruit_players"):
+    def __init__(self, event_id: int):
+        super().__init__(event_id, Button(
+            label="👥 Recruit Players", style=discord.ButtonStyle.secondary, row=1,
+            custom_id=signup_custom_id(event_id, "recruit_players")
+        ))
 
-    async def callback(self, interaction: discord.Interaction):
+    async def handle(self, interaction: discord.Interaction, roster: EventRoster):
         # Check if user is a crew commander
-        if not self.view_ref.is_user_commander(interaction.user):
+        if not roster.is_user_commander(interaction.user):
             await interaction.response.send_message("⚠️ Only crew commanders can recruit players.", ephemeral=True)
             return
         
         # Check if there are any recruits available
-        if not self.view_ref.recruits:
+        if not roster.recruits:
             await interaction.response.send_message("⚠️ No recruits available to recruit.", ephemeral=True)
             return
         
-        await interaction.response.send_message(view=RecruitSelectionView(self.view_ref, interaction.user), ephemeral=True)
+        await interaction.response.send_message(view=RecruitSelectionView(roster, interaction.user), ephemeral=True)
 
-class EditCrewButton(Button):
-    def __init__(self, view):
-        super().__init__(label="✏️ Edit My Crew", style=discord.ButtonStyle.secondary, row=2)
-        self.view_ref = view
+class EditCrewButton(SignupComponent, DynamicItem[Button], template=r"event_signup:(?P<event_id>\d+):edit_crew"):
+    def __init__(self, event_id: int):
+        super().__init__(event_id, Button(
+            label="✏️ Edit My Crew", style=discord.ButtonStyle.secondary, row=2,
+            custom_id=signup_custom_id(event_id, "edit_crew")
+        ))
 
-    async def callback(self, interaction: discord.Interaction):
-        crew, team, slot_index = self.view_ref.get_user_crew(interaction.user)
+    async def handle(self, interaction: discord.Interaction, roster: EventRoster):
+        crew, team, slot_index = roster.get_user_crew(interaction.user)
         
         if not crew:
             await interaction.response.send_message("⚠️ You must be a crew commander to edit your crew.", ephemeral=True)
             return
         
-        await interaction.response.send_message(view=EditCrewView(self.view_ref, crew, team, slot_index), ephemeral=True)
+        await interaction.response.send_message(view=EditCrewView(roster.event_id, interaction.user), ephemeral=True)
 
-class LeaveEventButton(Button):
-    def __init__(self, view):
-        super().__init__(label="❌ Leave Event", style=discord.ButtonStyle.danger, row=2)
-        self.view_ref = view
+class LeaveEventButton(SignupComponent, DynamicItem[Button], template=r"event_signup:(?P<event_id>\d+):leave"):
+    def __init__(self, event_id: int):
+        super().__init__(event_id, Button(
+            label="❌ Leave Event", style=discord.ButtonStyle.danger, row=2,
+            custom_id=signup_custom_id(event_id, "leave")
+        ))
 
-    async def callback(self, interaction: discord.Interaction):
-        view = self.view_ref
+    async def handle(self, interaction: discord.Interaction, roster: EventRoster):
         user = interaction.user
-        removed = False
-
-        # Remove from all positions
-        if user == view.commander_a:
-            view.commander_a = None
-            removed = True
-        elif user == view.commander_b:
-            view.commander_b = None
-            removed = True
-
-        for i in range(MAX_CREWS_PER_TEAM):
-            if isinstance(view.crews_a[i], dict):
-                crew = view.crews_a[i]
-                if user in [crew["commander"], crew["gunner"], crew["driver"]]:
-                    view.crews_a[i] = None
-                    removed = True
-            if isinstance(view.crews_b[i], dict):
-                crew = view.crews_b[i]
-                if user in [crew["commander"], crew["gunner"], crew["driver"]]:
-                    view.crews_b[i] = None
-                    removed = True
-
-        if user in view.recruits:
-            view.recruits.remove(user)
-            removed = True
+
+        # A crew leaves the roster as a unit, so every member's signup goes with it
+        async with roster.lock:
+            removed = roster.remove_user(user)
+            if removed:
+                await roster.remove_signups(interaction.client, removed)
 
         if removed:
             # Remove all event roles when leaving
             armor_events_cog = interaction.client.get_cog('ArmorEvents')
             if armor_events_cog:
-                await armor_events_cog.remove_event_role(interaction.user, view.event_type)
+                await armor_events_cog.remove_event_role(interaction.user, roster.event_type)
             
-            await view.update_embed(interaction)
+            await roster.update_embed(interaction)
             await interaction.response.send_message("❌ Removed from event! All event roles removed.", ephemeral=True)
         else:
             await interaction.response.send_message("⚠️ Not registered!", ephemeral=True)
 
+SIGNUP_COMPONENTS = (
+    CommanderSelect, JoinCrewAButton, JoinCrewBButton, JoinWithCrewButton,
+    RecruitMeButton, RecruitPlayersButton, EditCrewButton, LeaveEventButton,
+)
+
 # NEW: Persistent Crew Integration Components
 
 class PersistentCrewSelectionView(View):
-    def __init__(self, main_view, crews):
+    def __init__(self, event_id, crews):
         super().__init__(timeout=300)
-        self.main_view = main_view
+        self.event_id = event_id
         self.crews = crews
         self.add_item(PersistentCrewDropdown(self))
 
@@ -659,9 +924,9 @@ class PersistentCrewDropdown(Select):
     def __init__(self, parent):
         options = [
             discord.SelectOption(
-                label=crew['crew_name'],
-                value=str(crew['id']),
-                description=f"W:{crew['wins']} L:{crew['losses']} - Join with this crew"
+                label=crew.crew_name,
+                value=str(crew.id),
+                description=f"W:{crew.wins} L:{crew.losses} - Join with this crew"
             )
             for crew in parent.crews[:25]
         ]
@@ -674,21 +939,21 @@ class PersistentCrewDropdown(Select):
         selected_crew = None
         
         for crew in self.parent.crews:
-            if crew['id'] == crew_id:
+            if crew.id == crew_id:
                 selected_crew = crew
                 break
         
         if selected_crew:
             await interaction.response.send_message(
-                f"Selected crew: **{selected_crew['crew_name']}**\nChoose your team:",
-                view=PersistentCrewTeamSelectView(self.parent.main_view, selected_crew),
+                f"Selected crew: **{selected_crew.crew_name}**\nChoose your team:",
+                view=PersistentCrewTeamSelectView(self.parent.event_id, selected_crew),
                 ephemeral=True
             )
 
 class PersistentCrewTeamSelectView(View):
-    def __init__(self, main_view, crew):
+    def __init__(self, event_id, crew):
         super().__init__(timeout=300)
-        self.main_view = main_view
+        self.event_id = event_id
         self.crew = crew
         
         self.add_item(JoinAlliesWithCrewButton(self))
@@ -704,57 +969,51 @@ class JoinAlliesWithCrewButton(Button):
 
     async def join_with_crew(self, interaction, team):
         crew = self.parent.crew
-        main_view = self.parent.main_view
         
         # Get guild members
         guild = interaction.guild
-        commander = guild.get_member(crew['commander_id'])
-        gunner = guild.get_member(crew['gunner_id']) if crew['gunner_id'] else commander
-        driver = guild.get_member(crew['driver_id']) if crew['driver_id'] else commander
-        
-        # Check if any are already registered
-        for member in [commander, gunner, driver]:
-            if member and main_view.is_user_registered(member):
-                await interaction.response.send_message(
-                    f"❌ {member.mention} is already registered for this event!",
-                    ephemeral=True
-                )
-                return
+        commander = guild.get_member(crew.commander_id)
+        gunner = guild.get_member(crew.gunner_id) if crew.gunner_id else commander
+        driver = guild.get_member(crew.driver_id) if crew.driver_id else commander
         
-        # Find empty slot
-        slot_list = main_view.crews_a if team == "A" else main_view.crews_b
-        empty_slot = None
-        
-        for i in range(MAX_CREWS_PER_TEAM):
-            if slot_list[i] is None:
-                empty_slot = i
-                break
-        
-        if empty_slot is None:
-            team_name = "Allies" if team == "A" else "Axis"
-            await interaction.response.send_message(f"❌ {team_name} team is full!", ephemeral=True)
-            return
-        
-        # Create crew entry
-        slot_list[empty_slot] = {
+        # Create crew entry in the first empty slot
+        crew_entry = {
             "commander": commander,
-            "crew_name": crew['crew_name'],
+            "crew_name": crew.crew_name,
             "gunner": gunner,
             "driver": driver,
-            "persistent_crew_id": crew['id']  # Link to persistent crew
+            "persistent_crew_id": crew.id  # Link to persistent crew
         }
-        
+        team_name = "Allies" if team == "A" else "Axis"
+
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
+        async with roster.lock:
+            # Check if any are already registered
+            taken = next((m for m in (commander, gunner, driver) if m and roster.is_user_registered(m)), None)
+            empty_slot = None if taken else roster.place_crew(team, crew_entry)
+            if taken:
+                error = f"❌ {taken.mention} is already registered for this event!"
+            elif empty_slot is None:
+                error = f"❌ {team_name} team is full!"
+            else:
+                error = None
+                await roster.save_crew(interaction.client, crew_entry, team, empty_slot)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+            return
+
         # Assign roles to all crew members
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
         if armor_events_cog:
             for member in [commander, gunner, driver]:
                 if member:
-                    await armor_events_cog.assign_event_role(member, main_view.event_type, team)
+                    await armor_events_cog.assign_event_role(member, roster.event_type, team)
         
-        await main_view.update_embed(interaction)
-        team_name = "Allies" if team == "A" else "Axis"
+        await roster.update_embed(interaction)
         await interaction.response.send_message(
-            f"✅ Crew **{crew['crew_name']}** joined {team_name} team! All members assigned team roles.",
+            f"✅ Crew **{crew.crew_name}** joined {team_name} team! All members assigned team roles.",
             ephemeral=True
         )
 
@@ -768,57 +1027,51 @@ class JoinAxisWithCrewButton(Button):
 
     async def join_with_crew(self, interaction, team):
         crew = self.parent.crew
-        main_view = self.parent.main_view
         
         # Get guild members
         guild = interaction.guild
-        commander = guild.get_member(crew['commander_id'])
-        gunner = guild.get_member(crew['gunner_id']) if crew['gunner_id'] else commander
-        driver = guild.get_member(crew['driver_id']) if crew['driver_id'] else commander
-        
-        # Check if any are already registered
-        for member in [commander, gunner, driver]:
-            if member and main_view.is_user_registered(member):
-                await interaction.response.send_message(
-                    f"❌ {member.mention} is already registered for this event!",
-                    ephemeral=True
-                )
-                return
-        
-        # Find empty slot
-        slot_list = main_view.crews_a if team == "A" else main_view.crews_b
-        empty_slot = None
-        
-        for i in range(MAX_CREWS_PER_TEAM):
-            if slot_list[i] is None:
-                empty_slot = i
-                break
+        commander = guild.get_member(crew.commander_id)
+        gunner = guild.get_member(crew.gunner_id) if crew.gunner_id else commander
+        driver = guild.get_member(crew.driver_id) if crew.driver_id else commander
         
-        if empty_slot is None:
-            team_name = "Allies" if team == "A" else "Axis"
-            await interaction.response.send_message(f"❌ {team_name} team is full!", ephemeral=True)
-            return
-        
-        # Create crew entry
-        slot_list[empty_slot] = {
+        # Create crew entry in the first empty slot
+        crew_entry = {
             "commander": commander,
-            "crew_name": crew['crew_name'],
+            "crew_name": crew.crew_name,
             "gunner": gunner,
             "driver": driver,
-            "persistent_crew_id": crew['id']  # Link to persistent crew
+            "persistent_crew_id": crew.id  # Link to persistent crew
         }
-        
+        team_name = "Allies" if team == "A" else "Axis"
+
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
+        async with roster.lock:
+            # Check if any are already registered
+            taken = next((m for m in (commander, gunner, driver) if m and roster.is_user_registered(m)), None)
+            empty_slot = None if taken else roster.place_crew(team, crew_entry)
+            if taken:
+                error = f"❌ {taken.mention} is already registered for this event!"
+            elif empty_slot is None:
+                error = f"❌ {team_name} team is full!"
+            else:
+                error = None
+                await roster.save_crew(interaction.client, crew_entry, team, empty_slot)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+            return
+
         # Assign roles to all crew members
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
         if armor_events_cog:
             for member in [commander, gunner, driver]:
                 if member:
-                    await armor_events_cog.assign_event_role(member, main_view.event_type, team)
+                    await armor_events_cog.assign_event_role(member, roster.event_type, team)
         
-        await main_view.update_embed(interaction)
-        team_name = "Allies" if team == "A" else "Axis"
+        await roster.update_embed(interaction)
         await interaction.response.send_message(
-            f"✅ Crew **{crew['crew_name']}** joined {team_name} team! All members assigned team roles.",
+            f"✅ Crew **{crew.crew_name}** joined {team_name} team! All members assigned team roles.",
             ephemeral=True
         )
 
@@ -827,22 +1080,19 @@ class JoinAxisWithCrewButton(Button):
 
 # NEW: Recruit Selection System
 class RecruitSelectionView(View):
-    def __init__(self, main_view, commander):
+    def __init__(self, roster, commander):
         super().__init__(timeout=300)
-        self.main_view = main_view
+        self.event_id = roster.event_id
         self.commander = commander
         self.selected_recruit = None
         
-        # Get commander's crew info
-        self.crew, self.team, self.slot_index = main_view.get_user_crew(commander)
-        
-        self.add_item(RecruitSelect(self))
+        self.add_item(RecruitSelect(self, roster.recruits.values()))
 
 class RecruitSelect(Select):
-    def __init__(self, parent):
+    def __init__(self, parent, recruits):
         # Create options from available recruits
         options = []
-        for recruit in parent.main_view.recruits:
+        for recruit in recruits:
             options.append(discord.SelectOption(
                 label=recruit.display_name,
                 value=str(recruit.id),
@@ -858,14 +1108,12 @@ class RecruitSelect(Select):
         self.parent = parent
 
     async def callback(self, interaction: discord.Interaction):
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
+
         # Find the selected recruit
-        selected_id = int(self.values[0])
-        selected_recruit = None
-        
-        for recruit in self.parent.main_view.recruits:
-            if recruit.id == selected_id:
-                selected_recruit = recruit
-                break
+        selected_recruit = roster.recruits.get(int(self.values[0]))
         
         if not selected_recruit:
             await interaction.response.send_message("❌ Recruit not found!", ephemeral=True)
@@ -895,21 +1143,33 @@ class AssignGunnerButton(Button):
 
     async def callback(self, interaction: discord.Interaction):
         recruit = self.parent.selected_recruit
-        crew = self.parent.crew
+
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
         
         # Assign recruit as gunner
-        crew['gunner'] = recruit
+        async with roster.lock:
+            crew, team, slot_index = roster.get_user_crew(self.parent.commander)
+            if crew is None:
+                error = "❌ Your crew is no longer registered!"
+            elif roster.take_recruit(recruit.id) is None:
+                error = "❌ Recruit is no longer available!"
+            else:
+                error = None
+                replaced = roster.set_crew_seat(crew, team, slot_index, 'gunner', recruit)
+                await roster.save_crew(interaction.client, crew, team, slot_index, replaced=replaced)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+            return
         
         # Assign team role to the recruit
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
         if armor_events_cog:
-            await armor_events_cog.assign_event_role(recruit, self.parent.main_view.event_type, self.parent.team)
+            await armor_events_cog.assign_event_role(recruit, roster.event_type, team)
         
-        # Remove from recruit pool
-        self.parent.main_view.recruits.remove(recruit)
-        
-        await self.parent.main_view.update_embed(interaction)
-        team_name = "Allies" if self.parent.team == "A" else "Axis"
+        await roster.update_embed(interaction)
+        team_name = "Allies" if team == "A" else "Axis"
         await interaction.response.send_message(
             f"✅ **{recruit.display_name}** recruited as gunner for **{crew['crew_name']}**! {team_name} role assigned.",
             ephemeral=True
@@ -922,21 +1182,33 @@ class AssignDriverButton(Button):
 
     async def callback(self, interaction: discord.Interaction):
         recruit = self.parent.selected_recruit
-        crew = self.parent.crew
+
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
         
         # Assign recruit as driver
-        crew['driver'] = recruit
+        async with roster.lock:
+            crew, team, slot_index = roster.get_user_crew(self.parent.commander)
+            if crew is None:
+                error = "❌ Your crew is no longer registered!"
+            elif roster.take_recruit(recruit.id) is None:
+                error = "❌ Recruit is no longer available!"
+            else:
+                error = None
+                replaced = roster.set_crew_seat(crew, team, slot_index, 'driver', recruit)
+                await roster.save_crew(interaction.client, crew, team, slot_index, replaced=replaced)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+            return
         
         # Assign team role to the recruit
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
         if armor_events_cog:
-            await armor_events_cog.assign_event_role(recruit, self.parent.main_view.event_type, self.parent.team)
-        
-        # Remove from recruit pool
-        self.parent.main_view.recruits.remove(recruit)
+            await armor_events_cog.assign_event_role(recruit, roster.event_type, team)
         
-        await self.parent.main_view.update_embed(interaction)
-        team_name = "Allies" if self.parent.team == "A" else "Axis"
+        await roster.update_embed(interaction)
+        team_name = "Allies" if team == "A" else "Axis"
         await interaction.response.send_message(
             f"✅ **{recruit.display_name}** recruited as driver for **{crew['crew_name']}**! {team_name} role assigned.",
             ephemeral=True
@@ -944,12 +1216,10 @@ class AssignDriverButton(Button):
 
 # Edit Crew System (unchanged)
 class EditCrewView(View):
-    def __init__(self, main_view, crew, team, slot_index):
+    def __init__(self, event_id, commander):
         super().__init__(timeout=300)
-        self.main_view = main_view
-        self.crew = crew
-        self.team = team
-        self.slot_index = slot_index
+        self.event_id = event_id
+        self.commander = commander
         
         self.add_item(EditGunnerButton(self))
         self.add_item(EditDriverButton(self))
@@ -983,7 +1253,7 @@ class EditGunnerView(View):
     def __init__(self, parent):
         super().__init__(timeout=300)
         self.parent = parent
-        self.add_item(UpdateGunnerSelect(self))
+        self.add_item(UpdateGunnerSelect(parent))
 
 class UpdateGunnerSelect(UserSelect):
     def __init__(self, parent):
@@ -991,31 +1261,43 @@ class UpdateGunnerSelect(UserSelect):
         self.parent = parent
 
     async def callback(self, interaction: discord.Interaction):
-        if self.values:
-            new_gunner = self.values[0]
-            if self.parent.main_view.is_user_registered(new_gunner):
-                await interaction.response.send_message("❌ User already registered!", ephemeral=True)
-                return
-            
+        new_gunner = self.values[0] if self.values else None
+
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
+        async with roster.lock:
+            crew, team, slot_index = roster.get_user_crew(self.parent.commander)
+            if crew is None:
+                error = "❌ Your crew is no longer registered!"
+            elif new_gunner is not None and roster.is_user_registered(new_gunner):
+                error = "❌ User already registered!"
+            else:
+                error = None
+                replaced = roster.set_crew_seat(crew, team, slot_index, 'gunner', new_gunner or crew['commander'])
+                await roster.save_crew(interaction.client, crew, team, slot_index, replaced=replaced)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+            return
+
+        if new_gunner is not None:
             # Assign team role to new gunner
             armor_events_cog = interaction.client.get_cog('ArmorEvents')
             if armor_events_cog:
-                await armor_events_cog.assign_event_role(new_gunner, self.parent.main_view.event_type, self.parent.team)
-            
-            self.parent.crew['gunner'] = new_gunner
-            team_name = "Allies" if self.parent.team == "A" else "Axis" 
+                await armor_events_cog.assign_event_role(new_gunner, roster.event_type, team)
+
+            team_name = "Allies" if team == "A" else "Axis"
             await interaction.response.send_message(f"✅ Gunner updated to {new_gunner.mention}! {team_name} role assigned.", ephemeral=True)
         else:
-            self.parent.crew['gunner'] = self.parent.crew['commander']
             await interaction.response.send_message("✅ Gunner cleared - commander will gun!", ephemeral=True)
         
-        await self.parent.main_view.update_embed(interaction)
+        await roster.update_embed(interaction)
 
 class EditDriverView(View):
     def __init__(self, parent):
         super().__init__(timeout=300)
         self.parent = parent
-        self.add_item(UpdateDriverSelect(self))
+        self.add_item(UpdateDriverSelect(parent))
 
 class UpdateDriverSelect(UserSelect):
     def __init__(self, parent):
@@ -1023,35 +1305,47 @@ class UpdateDriverSelect(UserSelect):
         self.parent = parent
 
     async def callback(self, interaction: discord.Interaction):
-        if self.values:
-            new_driver = self.values[0]
-            if self.parent.main_view.is_user_registered(new_driver):
-                await interaction.response.send_message("❌ User already registered!", ephemeral=True)
-                return
-            
+        new_driver = self.values[0] if self.values else None
+
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
+        async with roster.lock:
+            crew, team, slot_index = roster.get_user_crew(self.parent.commander)
+            if crew is None:
+                error = "❌ Your crew is no longer registered!"
+            elif new_driver is not None and roster.is_user_registered(new_driver):
+                error = "❌ User already registered!"
+            else:
+                error = None
+                replaced = roster.set_crew_seat(crew, team, slot_index, 'driver', new_driver or crew['commander'])
+                await roster.save_crew(interaction.client, crew, team, slot_index, replaced=replaced)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+            return
+
+        if new_driver is not None:
             # Assign team role to new driver
             armor_events_cog = interaction.client.get_cog('ArmorEvents')
             if armor_events_cog:
-                await armor_events_cog.assign_event_role(new_driver, self.parent.main_view.event_type, self.parent.team)
-                
-            self.parent.crew['driver'] = new_driver
-            team_name = "Allies" if self.parent.team == "A" else "Axis"
+                await armor_events_cog.assign_event_role(new_driver, roster.event_type, team)
+
+            team_name = "Allies" if team == "A" else "Axis"
             await interaction.response.send_message(f"✅ Driver updated to {new_driver.mention}! {team_name} role assigned.", ephemeral=True)
         else:
-            self.parent.crew['driver'] = self.parent.crew['commander']
             await interaction.response.send_message("✅ Driver cleared - commander will drive!", ephemeral=True)
         
-        await self.parent.main_view.update_embed(interaction)
+        await roster.update_embed(interaction)
 
 class EditCrewNameModal(Modal):
-    def __init__(self, parent):
+    def __init__(self, parent, crew_name):
         super().__init__(title="Edit Crew Name")
         self.parent = parent
         
         self.name_input = TextInput(
             label="New Crew Name",
             placeholder="Enter new crew name...",
-            default=self.parent.crew['crew_name'],
+            default=crew_name,
             max_length=30
         )
         self.add_item(self.name_input)
@@ -1062,15 +1356,29 @@ class EditCrewNameModal(Modal):
             await interaction.response.send_message("❌ Crew name cannot be empty!", ephemeral=True)
             return
         
-        self.parent.crew['crew_name'] = new_name
-        await self.parent.main_view.update_embed(interaction)
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
+        async with roster.lock:
+            crew, team, slot_index = roster.get_user_crew(self.parent.commander)
+            if crew is None:
+                error = "❌ Your crew is no longer registered!"
+            else:
+                error = None
+                crew['crew_name'] = new_name
+                await roster.save_crew(interaction.client, crew, team, slot_index)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+            return
+        await roster.update_embed(interaction)
         await interaction.response.send_message(f"✅ Crew name updated to '{new_name}'!", ephemeral=True)
 
 # Crew selection system with role assignment
 class CrewSelectView(View):
-    def __init__(self, main_view, team, commander):
+    def __init__(self, roster, team, commander):
         super().__init__(timeout=300)
-        self.main_view = main_view
+        self.event_id = roster.event_id
+        self.event_type = roster.event_type
         self.team = team
         self.commander = commander
         self.gunner = None
@@ -1082,7 +1390,10 @@ class GunnerSelect(UserSelect):
         self.parent = parent
 
     async def callback(self, interaction: discord.Interaction):
-        if self.parent.main_view.is_user_registered(self.values[0]):
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
+        if roster.is_user_registered(self.values[0]):
             await interaction.response.send_message("❌ User already registered!", ephemeral=True)
             return
         
@@ -1091,7 +1402,7 @@ class GunnerSelect(UserSelect):
         # Assign team role to gunner
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
         if armor_events_cog:
-            await armor_events_cog.assign_event_role(self.parent.gunner, self.parent.main_view.event_type, self.parent.team)
+            await armor_events_cog.assign_event_role(self.parent.gunner, self.parent.event_type, self.parent.team)
         
         await interaction.response.send_message(view=DriverSelectView(self.parent), ephemeral=True)
 
@@ -1107,7 +1418,10 @@ class DriverSelect(UserSelect):
         self.parent = parent
 
     async def callback(self, interaction: discord.Interaction):
-        if self.parent.main_view.is_user_registered(self.values[0]):
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
+        if roster.is_user_registered(self.values[0]):
             await interaction.response.send_message("❌ User already registered!", ephemeral=True)
             return
         
@@ -1116,7 +1430,7 @@ class DriverSelect(UserSelect):
         # Assign team role to driver
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
         if armor_events_cog:
-            await armor_events_cog.assign_event_role(driver, self.parent.main_view.event_type, self.parent.team)
+            await armor_events_cog.assign_event_role(driver, self.parent.event_type, self.parent.team)
         
         await interaction.response.send_modal(CrewNameModal(self.parent, driver))
 
@@ -1135,38 +1449,51 @@ class CrewNameModal(Modal):
 
     async def on_submit(self, interaction: discord.Interaction):
         crew_name = self.name_input.value.strip() or f"{self.parent.commander.display_name}'s Crew"
-        main_view = self.parent.main_view
-        slot_list = main_view.crews_a if self.parent.team == "A" else main_view.crews_b
 
         # Get the armor events cog for role assignment
         armor_events_cog = interaction.client.get_cog('ArmorEvents')
 
-        for i in range(MAX_CREWS_PER_TEAM):
-            if slot_list[i] is None:
-                slot_list[i] = {
-                    "commander": self.parent.commander,
-                    "crew_name": crew_name,
-                    "gunner": self.parent.gunner,
-                    "driver": self.driver
-                }
-                
-                # Assign team roles to all crew members
-                if armor_events_cog:
-                    # Assign role to commander
-                    await armor_events_cog.assign_event_role(self.parent.commander, main_view.event_type, self.parent.team)
-                    
-                    # Assign role to gunner  
-                    await armor_events_cog.assign_event_role(self.parent.gunner, main_view.event_type, self.parent.team)
-                    
-                    # Assign role to driver
-                    await armor_events_cog.assign_event_role(self.driver, main_view.event_type, self.parent.team)
-                
-                await main_view.update_embed(interaction)
-                team_name = "Allies" if self.parent.team == "A" else "Axis"
-                await interaction.response.send_message(f"✅ Crew '{crew_name}' registered for {team_name}! Team roles assigned to all members.", ephemeral=True)
-                return
+        crew = {
+            "commander": self.parent.commander,
+            "crew_name": crew_name,
+            "gunner": self.parent.gunner,
+            "driver": self.driver
+        }
 
-        await interaction.response.send_message("❌ Team is full!", ephemeral=True)
+        roster = await current_roster(interaction, self.parent.event_id)
+        if roster is None:
+            return
+
+        # The members were checked when picked; re-check now that the roster is locked
+        async with roster.lock:
+            taken = next((m for m in (crew["commander"], crew["gunner"], crew["driver"])
+                          if roster.is_user_registered(m)), None)
+            slot_index = None if taken else roster.place_crew(self.parent.team, crew)
+            if taken:
+                error = f"❌ {taken.mention} is already registered for this event!"
+            elif slot_index is None:
+                error = "❌ Team is full!"
+            else:
+                error = None
+                await roster.save_crew(interaction.client, crew, self.parent.team, slot_index)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+            return
+        
+        # Assign team roles to all crew members
+        if armor_events_cog:
+            # Assign role to commander
+            await armor_events_cog.assign_event_role(self.parent.commander, roster.event_type, self.parent.team)
+            
+            # Assign role to gunner  
+            await armor_events_cog.assign_event_role(self.parent.gunner, roster.event_type, self.parent.team)
+            
+            # Assign role to driver
+            await armor_events_cog.assign_event_role(self.driver, roster.event_type, self.parent.team)
+        
+        await roster.update_embed(interaction)
+        team_name = "Allies" if self.parent.team == "A" else "Axis"
+        await interaction.response.send_message(f"✅ Crew '{crew_name}' registered for {team_name}! Team roles assigned to all members.", ephemeral=True)
 
 async def setup(bot):
     await bot.add_cog(ArmorEvents(bot))
@@ -4,11 +4,11 @@ from discord.ext import commands
 from discord import app_commands
 from discord.ui import View, Button, Select, Modal, TextInput, UserSelect
 import logging
-from typing import Optional, List, Dict
-import sqlite3
+from typing import Optional, List
 
-from utils.database import EventDatabase
+from utils.async_db import AsyncDatabase
 from utils.config import *
+from utils.models import Crew
 from utils.permissions import (
     has_scheduler_privileges,
     PERMISSION_DENIED_MESSAGE,
@@ -21,18 +21,18 @@ class CrewManagement(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
-        self.db = EventDatabase()
+        self.db = bot.db
         logger.info("Crew Management cog initialized")
 
-    def _has_privileges(self, member: discord.Member) -> bool:
+    async def _has_privileges(self, member: discord.Member) -> bool:
         """Check whether the member can run privileged crew commands."""
         allowed_roles = None
         guild = getattr(member, "guild", None)
 
         if guild:
             try:
-                guild_settings = self.db.get_guild_settings(guild.id)
-                allowed_roles = guild_settings.get("admin_roles")
+                guild_settings = await self.db.get_guild_settings(guild.id)
+                allowed_roles = guild_settings.admin_roles
             except Exception as exc:
                 logger.error(f"Failed to load guild settings for permissions: {exc}")
 
@@ -56,7 +56,7 @@ class CrewManagement(commands.Cog):
             return
         
         try:
-            crew_id = self.db.create_persistent_crew(
+            crew_id = await self.db.create_persistent_crew(
                 guild_id=interaction.guild.id,
                 crew_name=name,
                 commander_id=interaction.user.id,
@@ -98,7 +98,7 @@ class CrewManagement(commands.Cog):
         
         if crew_name:
             # View specific crew
-            crew = self.get_crew_by_name(interaction.guild.id, crew_name)
+            crew = await self.get_crew_by_name(interaction.guild.id, crew_name)
             if not crew:
                 await interaction.response.send_message(f"❌ Crew '{crew_name}' not found.", ephemeral=True)
                 return
@@ -107,7 +107,7 @@ class CrewManagement(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
         else:
             # View user's crews
-            user_crews = self.db.get_user_crews(interaction.user.id, interaction.guild.id)
+            user_crews = await self.db.get_user_crews(interaction.user.id, interaction.guild.id)
             
             if not user_crews:
                 await interaction.response.send_message(
@@ -139,8 +139,8 @@ class CrewManagement(commands.Cog):
         """Invite a user to join your crew"""
         
         # Get user's crews where they're commander
-        user_crews = self.db.get_user_crews(interaction.user.id, interaction.guild.id)
-        commander_crews = [crew for crew in user_crews if crew['commander_id'] == interaction.user.id]
+        user_crews = await self.db.get_user_crews(interaction.user.id, interaction.guild.id)
+        commander_crews = [crew for crew in user_crews if crew.commander_id == interaction.user.id]
         
         if not commander_crews:
             await interaction.response.send_message(
@@ -162,8 +162,8 @@ class CrewManagement(commands.Cog):
     async def crew_edit(self, interaction: discord.Interaction):
         """Edit your crew details"""
         
-        user_crews = self.db.get_user_crews(interaction.user.id, interaction.guild.id)
-        commander_crews = [crew for crew in user_crews if crew['commander_id'] == interaction.user.id]
+        user_crews = await self.db.get_user_crews(interaction.user.id, interaction.guild.id)
+        commander_crews = [crew for crew in user_crews if crew.commander_id == interaction.user.id]
         
         if not commander_crews:
             await interaction.response.send_message(
@@ -187,7 +187,7 @@ class CrewManagement(commands.Cog):
     async def crew_leave(self, interaction: discord.Interaction):
         """Leave one of your crews"""
         
-        user_crews = self.db.get_user_crews(interaction.user.id, interaction.guild.id)
+        user_crews = await self.db.get_user_crews(interaction.user.id, interaction.guild.id)
         
         if not user_crews:
             await interaction.response.send_message("❌ You're not part of any crews.", ephemeral=True)
@@ -206,7 +206,7 @@ class CrewManagement(commands.Cog):
     async def crew_list(self, interaction: discord.Interaction, page: int = 1):
         """List all crews in the server"""
         
-        crews = self.get_all_guild_crews(interaction.guild.id, page)
+        crews = await self.get_all_guild_crews(interaction.guild.id, page)
         
         if not crews:
             await interaction.response.send_message("❌ No crews found in this server.", ephemeral=True)
@@ -219,7 +219,7 @@ class CrewManagement(commands.Cog):
     async def crew_panel(self, interaction: discord.Interaction):
         """Create a crew management panel in this channel"""
         
-        if not self._has_privileges(interaction.user):
+        if not await self._has_privileges(interaction.user):
             await interaction.response.send_message(PERMISSION_DENIED_MESSAGE, ephemeral=True)
             return
         
@@ -254,76 +254,26 @@ class CrewManagement(commands.Cog):
         await interaction.followup.send("✅ Crew management panel created in this channel!", ephemeral=True)
 
     # Helper methods
-    def get_crew_by_name(self, guild_id: int, crew_name: str) -> Optional[Dict]:
+    async def get_crew_by_name(self, guild_id: int, crew_name: str) -> Optional[Crew]:
         """Get crew by name"""
-        conn = sqlite3.connect(self.db.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, crew_name, commander_id, gunner_id, driver_id, wins, losses, description
-            FROM persistent_crews 
-            WHERE guild_id = ? AND crew_name = ? AND active = 1
-        ''', (guild_id, crew_name))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
-        if result:
-            return {
-                'id': result[0],
-                'crew_name': result[1],
-                'commander_id': result[2],
-                'gunner_id': result[3],
-                'driver_id': result[4],
-                'wins': result[5],
-                'losses': result[6],
-                'description': result[7]
-            }
-        return None
-
-    def get_all_guild_crews(self, guild_id: int, page: int = 1, per_page: int = 10) -> List[Dict]:
+        return await self.db.get_crew_by_name(guild_id, crew_name)
+
+    async def get_all_guild_crews(self, guild_id: int, page: int = 1, per_page: int = 10) -> List[Crew]:
         """Get all crews in a guild with pagination"""
-        conn = sqlite3.connect(self.db.db_path)
-        cursor = conn.cursor()
-        
         offset = (page - 1) * per_page
-        
-        cursor.execute('''
-            SELECT id, crew_name, commander_id, gunner_id, driver_id, wins, losses, description
-            FROM persistent_crews 
-            WHERE guild_id = ? AND active = 1
-            ORDER BY crew_name
-            LIMIT ? OFFSET ?
-        ''', (guild_id, per_page, offset))
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        return [
-            {
-                'id': row[0],
-                'crew_name': row[1],
-                'commander_id': row[2],
-                'gunner_id': row[3],
-                'driver_id': row[4],
-                'wins': row[5],
-                'losses': row[6],
-                'description': row[7]
-            }
-            for row in results
-        ]
+        return await self.db.get_guild_crews(guild_id, per_page, offset)
 
-    def build_crew_info_embed(self, crew: Dict, guild: discord.Guild) -> discord.Embed:
+    def build_crew_info_embed(self, crew: Crew, guild: discord.Guild) -> discord.Embed:
         """Build embed with crew information"""
         embed = discord.Embed(
-            title=f"{EMOJIS['commander']} {crew['crew_name']}",
+            title=f"{EMOJIS['commander']} {crew.crew_name}",
             color=COLORS["info"]
         )
         
         # Get member objects
-        commander = guild.get_member(crew['commander_id'])
-        gunner = guild.get_member(crew['gunner_id']) if crew['gunner_id'] else None
-        driver = guild.get_member(crew['driver_id']) if crew['driver_id'] else None
+        commander = guild.get_member(crew.commander_id)
+        gunner = guild.get_member(crew.gunner_id) if crew.gunner_id else None
+        driver = guild.get_member(crew.driver_id) if crew.driver_id else None
         
         members_text = f"**Commander:** {commander.mention if commander else 'Unknown'}\n"
         members_text += f"**Gunner:** {gunner.mention if gunner else '*Open Position*'}\n"
@@ -331,25 +281,25 @@ class CrewManagement(commands.Cog):
         
         embed.add_field(name="Members", value=members_text, inline=False)
         
-        if crew['description']:
-            embed.add_field(name="Description", value=crew['description'], inline=False)
+        if crew.description:
+            embed.add_field(name="Description", value=crew.description, inline=False)
         
         # Statistics
-        total_matches = crew['wins'] + crew['losses']
-        win_rate = (crew['wins'] / total_matches * 100) if total_matches > 0 else 0
+        total_matches = crew.wins + crew.losses
+        win_rate = (crew.wins / total_matches * 100) if total_matches > 0 else 0
         
         stats_text = f"**Matches:** {total_matches}\n"
-        stats_text += f"**Wins:** {crew['wins']}\n"
-        stats_text += f"**Losses:** {crew['losses']}\n"
+        stats_text += f"**Wins:** {crew.wins}\n"
+        stats_text += f"**Losses:** {crew.losses}\n"
         stats_text += f"**Win Rate:** {win_rate:.1f}%"
         
         embed.add_field(name="Statistics", value=stats_text, inline=True)
         
-        embed.set_footer(text=f"Crew ID: {crew['id']}")
+        embed.set_footer(text=f"Crew ID: {crew.id}")
         
         return embed
 
-    def build_crew_list_embed(self, crews: List[Dict], page: int, guild: discord.Guild) -> discord.Embed:
+    def build_crew_list_embed(self, crews: List[Crew], page: int, guild: discord.Guild) -> discord.Embed:
         """Build embed listing crews"""
         embed = discord.Embed(
             title=f"📋 Server Crews - Page {page}",
@@ -357,35 +307,35 @@ class CrewManagement(commands.Cog):
         )
         
         for crew in crews:
-            commander = guild.get_member(crew['commander_id'])
-            total_matches = crew['wins'] + crew['losses']
+            commander = guild.get_member(crew.commander_id)
+            total_matches = crew.wins + crew.losses
             
             crew_text = f"**Commander:** {commander.mention if commander else 'Unknown'}\n"
-            crew_text += f"**Record:** {crew['wins']}W - {crew['losses']}L"
+            crew_text += f"**Record:** {crew.wins}W - {crew.losses}L"
             
             embed.add_field(
-                name=crew['crew_name'],
+                name=crew.crew_name,
                 value=crew_text,
                 inline=True
             )
         
         return embed
 
-    async def process_crew_invite(self, interaction: discord.Interaction, crew: Dict, 
+    async def process_crew_invite(self, interaction: discord.Interaction, crew: Crew, 
                                 target_user: discord.Member, role: str):
         """Process crew invitation"""
         
         # Check if position is available
-        if role == "gunner" and crew['gunner_id']:
+        if role == "gunner" and crew.gunner_id:
             await interaction.response.send_message(
-                f"❌ The gunner position in {crew['crew_name']} is already filled.", 
+                f"❌ The gunner position in {crew.crew_name} is already filled.", 
                 ephemeral=True
             )
             return
         
-        if role == "driver" and crew['driver_id']:
+        if role == "driver" and crew.driver_id:
             await interaction.response.send_message(
-                f"❌ The driver position in {crew['crew_name']} is already filled.", 
+                f"❌ The driver position in {crew.crew_name} is already filled.", 
                 ephemeral=True
             )
             return
@@ -393,20 +343,20 @@ class CrewManagement(commands.Cog):
         # Send invitation
         embed = discord.Embed(
             title="🎯 Crew Invitation!",
-            description=f"You've been invited to join **{crew['crew_name']}**!",
+            description=f"You've been invited to join **{crew.crew_name}**!",
             color=COLORS["info"]
         )
         
         embed.add_field(
             name="Position Offered",
             value=f"**Role:** {role.title()}\n"
-                  f"**Crew:** {crew['crew_name']}\n"
+                  f"**Crew:** {crew.crew_name}\n"
                   f"**Commander:** {interaction.user.mention}",
             inline=False
         )
         
-        if crew['description']:
-            embed.add_field(name="Crew Description", value=crew['description'], inline=False)
+        if crew.description:
+            embed.add_field(name="Crew Description", value=crew.description, inline=False)
         
         try:
             view = CrewInvitationView(crew, role, interaction.user, target_user, self.db)
@@ -426,13 +376,13 @@ class CrewManagement(commands.Cog):
                 view=view
             )
 
-    async def process_crew_leave(self, interaction: discord.Interaction, crew: Dict):
+    async def process_crew_leave(self, interaction: discord.Interaction, crew: Crew):
         """Process leaving a crew"""
         
         user_id = interaction.user.id
-        crew_name = crew['crew_name']
+        crew_name = crew.crew_name
         
-        if crew['commander_id'] == user_id:
+        if crew.commander_id == user_id:
             # Commander leaving - need confirmation
             embed = discord.Embed(
                 title="⚠️ Disband Crew?",
@@ -445,18 +395,11 @@ class CrewManagement(commands.Cog):
         else:
             # Regular member leaving
             # Update database to remove user from crew
-            conn = sqlite3.connect(self.db.db_path)
-            cursor = conn.cursor()
-            
-            if crew['gunner_id'] == user_id:
-                cursor.execute('UPDATE persistent_crews SET gunner_id = NULL WHERE id = ?', (crew['id'],))
+            if crew.gunner_id == user_id:
                 position = "gunner"
-            elif crew['driver_id'] == user_id:
-                cursor.execute('UPDATE persistent_crews SET driver_id = NULL WHERE id = ?', (crew['id'],))
+            elif crew.driver_id == user_id:
                 position = "driver"
-            
-            conn.commit()
-            conn.close()
+            await self.db.set_crew_member(crew.id, position, None)
             
             embed = discord.Embed(
                 title="✅ Left Crew",
@@ -469,7 +412,7 @@ class CrewManagement(commands.Cog):
 # UI Components for Crew Management Panel
 
 class CrewManagementPanelView(View):
-    def __init__(self, db: EventDatabase):
+    def __init__(self, db: AsyncDatabase):
         super().__init__(timeout=None)  # Persistent panel - no timeout
         self.db = db
         
@@ -482,7 +425,7 @@ class CrewManagementPanelView(View):
         self.add_item(ListCrewsPanelButton(db))
 
 class CreateCrewPanelButton(Button):
-    def __init__(self, db: EventDatabase):
+    def __init__(self, db: AsyncDatabase):
         super().__init__(
             label="🆕 Create Crew", 
             style=discord.ButtonStyle.success, 
@@ -495,7 +438,7 @@ class CreateCrewPanelButton(Button):
         await interaction.response.send_modal(CreateCrewPanelModal(self.db))
 
 class CrewInfoPanelButton(Button):
-    def __init__(self, db: EventDatabase):
+    def __init__(self, db: AsyncDatabase):
         super().__init__(
             label="ℹ️ Crew Info", 
             style=discord.ButtonStyle.primary, 
@@ -507,7 +450,7 @@ class CrewInfoPanelButton(Button):
     async def callback(self, interaction: discord.Interaction):
         # Get user's crews
         cog = interaction.client.get_cog('CrewManagement')
-        user_crews = self.db.get_user_crews(interaction.user.id, interaction.guild.id)
+        user_crews = await self.db.get_user_crews(interaction.user.id, interaction.guild.id)
         
         if not user_crews:
             await interaction.response.send_message(
@@ -528,7 +471,7 @@ class CrewInfoPanelButton(Button):
             )
 
 class EditCrewPanelButton(Button):
-    def __init__(self, db: EventDatabase):
+    def __init__(self, db: AsyncDatabase):
         super().__init__(
             label="✏️ Edit Crew", 
             style=discord.ButtonStyle.secondary, 
@@ -538,8 +481,8 @@ class EditCrewPanelButton(Button):
         self.db = db
 
     async def callback(self, interaction: discord.Interaction):
-        user_crews = self.db.get_user_crews(interaction.user.id, interaction.guild.id)
-        commander_crews = [crew for crew in user_crews if crew['commander_id'] == interaction.user.id]
+        user_crews = await self.db.get_user_crews(interaction.user.id, interaction.guild.id)
+        commander_crews = [crew for crew in user_crews if crew.commander_id == interaction.user.id]
         
         if not commander_crews:
             await interaction.response.send_message(
@@ -561,7 +504,7 @@ class EditCrewPanelButton(Button):
             )
 
 class InvitePlayerPanelButton(Button):
-    def __init__(self, db: EventDatabase):
+    def __init__(self, db: AsyncDatabase):
         super().__init__(
             label="📨 Invite Player", 
             style=discord.ButtonStyle.secondary, 
@@ -572,8 +515,8 @@ class InvitePlayerPanelButton(Button):
 
     async def callback(self, interaction: discord.Interaction):
         # Get user's crews where they're commander
-        user_crews = self.db.get_user_crews(interaction.user.id, interaction.guild.id)
-        commander_crews = [crew for crew in user_crews if crew['commander_id'] == interaction.user.id]
+        user_crews = await self.db.get_user_crews(interaction.user.id, interaction.guild.id)
+        commander_crews = [crew for crew in user_crews if crew.commander_id == interaction.user.id]
         
         if not commander_crews:
             await interaction.response.send_message(
@@ -588,7 +531,7 @@ class InvitePlayerPanelButton(Button):
         )
 
 class LeaveCrewPanelButton(Button):
-    def __init__(self, db: EventDatabase):
+    def __init__(self, db: AsyncDatabase):
         super().__init__(
             label="🚪 Leave Crew", 
             style=discord.ButtonStyle.danger, 
@@ -598,7 +541,7 @@ class LeaveCrewPanelButton(Button):
         self.db = db
 
     async def callback(self, interaction: discord.Interaction):
-        user_crews = self.db.get_user_crews(interaction.user.id, interaction.guild.id)
+        user_crews = await self.db.get_user_crews(interaction.user.id, interaction.guild.id)
         
         if not user_crews:
             await interaction.response.send_message("❌ You're not part of any crews.", ephemeral=True)
@@ -615,7 +558,7 @@ class LeaveCrewPanelButton(Button):
             )
 
 class ListCrewsPanelButton(Button):
-    def __init__(self, db: EventDatabase):
+    def __init__(self, db: AsyncDatabase):
         super().__init__(
             label="📜 List Crews", 
             style=discord.ButtonStyle.primary, 
@@ -626,7 +569,7 @@ class ListCrewsPanelButton(Button):
 
     async def callback(self, interaction: discord.Interaction):
         cog = interaction.client.get_cog('CrewManagement')
-        crews = cog.get_all_guild_crews(interaction.guild.id, 1)
+        crews = await cog.get_all_guild_crews(interaction.guild.id, 1)
         
         if not crews:
             await interaction.response.send_message("❌ No crews found in this server.", ephemeral=True)
@@ -643,7 +586,7 @@ class ListCrewsPanelButton(Button):
 
 # Modal for creating crews from the panel
 class CreateCrewPanelModal(Modal):
-    def __init__(self, db: EventDatabase):
+    def __init__(self, db: AsyncDatabase):
         super().__init__(title="Create New Crew")
         self.db = db
         
@@ -677,7 +620,7 @@ class CreateCrewPanelModal(Modal):
             return
         
         try:
-            crew_id = self.db.create_persistent_crew(
+            crew_id = await self.db.create_persistent_crew(
                 guild_id=interaction.guild.id,
                 crew_name=name,
                 commander_id=interaction.user.id,
@@ -714,25 +657,25 @@ class CreateCrewPanelModal(Modal):
 
 # Selection views for crews
 class CrewInfoSelectionView(View):
-    def __init__(self, crews: List[Dict], guild: discord.Guild):
+    def __init__(self, crews: List[Crew], guild: discord.Guild):
         super().__init__(timeout=TIMEOUTS["view"])
         self.crews = crews
         self.guild = guild
         self.add_item(CrewInfoSelectDropdown(crews, guild))
 
 class CrewInfoSelectDropdown(Select):
-    def __init__(self, crews: List[Dict], guild: discord.Guild):
+    def __init__(self, crews: List[Crew], guild: discord.Guild):
         options = [
             discord.SelectOption(
-                label=crew['crew_name'],
-                value=str(crew['id']),
-                description=f"W: {crew['wins']} L: {crew['losses']}"
+                label=crew.crew_name,
+                value=str(crew.id),
+                description=f"W: {crew.wins} L: {crew.losses}"
             )
             for crew in crews[:25]  # Discord limit
         ]
         
         super().__init__(placeholder="Select a crew to view info", options=options)
-        self.crews = {crew['id']: crew for crew in crews}
+        self.crews = {crew.id: crew for crew in crews}
         self.guild = guild
 
     async def callback(self, interaction: discord.Interaction):
@@ -746,37 +689,37 @@ class CrewInfoSelectDropdown(Select):
 
 # Crew invitation setup from panel
 class CrewInviteSetupView(View):
-    def __init__(self, crews: List[Dict]):
+    def __init__(self, crews: List[Crew]):
         super().__init__(timeout=TIMEOUTS["view"])
         self.crews = crews
         self.add_item(CrewInviteCrewSelect(crews))
 
 class CrewInviteCrewSelect(Select):
-    def __init__(self, crews: List[Dict]):
+    def __init__(self, crews: List[Crew]):
         options = [
             discord.SelectOption(
-                label=crew['crew_name'],
-                value=str(crew['id']),
+                label=crew.crew_name,
+                value=str(crew.id),
                 description="Select this crew to invite to"
             )
             for crew in crews[:25]
         ]
         
         super().__init__(placeholder="Select crew to invite to", options=options)
-        self.crews = {crew['id']: crew for crew in crews}
+        self.crews = {crew.id: crew for crew in crews}
 
     async def callback(self, interaction: discord.Interaction):
         crew_id = int(self.values[0])
         crew = self.crews[crew_id]
         
         await interaction.response.send_message(
-            f"Selected crew: **{crew['crew_name']}**\nNow select a user and role:",
+            f"Selected crew: **{crew.crew_name}**\nNow select a user and role:",
             view=CrewInviteUserRoleView(crew),
             ephemeral=True
         )
 
 class CrewInviteUserRoleView(View):
-    def __init__(self, crew: Dict):
+    def __init__(self, crew: Crew):
         super().__init__(timeout=TIMEOUTS["view"])
         self.crew = crew
         self.selected_user = None
@@ -859,7 +802,7 @@ class PreviousPageButton(Button):
             return
         
         new_page = self.parent.current_page - 1
-        crews = self.parent.cog.get_all_guild_crews(interaction.guild.id, new_page)
+        crews = await self.parent.cog.get_all_guild_crews(interaction.guild.id, new_page)
         
         if not crews:
             await interaction.response.send_message("❌ No crews on previous page.", ephemeral=True)
@@ -877,7 +820,7 @@ class NextPageButton(Button):
 
     async def callback(self, interaction: discord.Interaction):
         new_page = self.parent.current_page + 1
-        crews = self.parent.cog.get_all_guild_crews(interaction.guild.id, new_page)
+        crews = await self.parent.cog.get_all_guild_crews(interaction.guild.id, new_page)
         
         if not crews:
             await interaction.response.send_message("❌ No more crews to display.", ephemeral=True)
@@ -891,25 +834,25 @@ class NextPageButton(Button):
 # Original UI Components for Crew Management
 
 class CrewSelectionView(View):
-    def __init__(self, crews: List[Dict], guild: discord.Guild):
+    def __init__(self, crews: List[Crew], guild: discord.Guild):
         super().__init__(timeout=TIMEOUTS["view"])
         self.crews = crews
         self.guild = guild
         self.add_item(CrewSelectDropdown(crews, guild))
 
 class CrewSelectDropdown(Select):
-    def __init__(self, crews: List[Dict], guild: discord.Guild):
+    def __init__(self, crews: List[Crew], guild: discord.Guild):
         options = [
             discord.SelectOption(
-                label=crew['crew_name'],
-                value=str(crew['id']),
-                description=f"W: {crew['wins']} L: {crew['losses']}"
+                label=crew.crew_name,
+                value=str(crew.id),
+                description=f"W: {crew.wins} L: {crew.losses}"
             )
             for crew in crews[:25]  # Discord limit
         ]
         
         super().__init__(placeholder="Select a crew to view", options=options)
-        self.crews = {crew['id']: crew for crew in crews}
+        self.crews = {crew.id: crew for crew in crews}
         self.guild = guild
 
     async def callback(self, interaction: discord.Interaction):
@@ -922,7 +865,7 @@ class CrewSelectDropdown(Select):
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 class CrewInviteSelectionView(View):
-    def __init__(self, crews: List[Dict], target_user: discord.Member, role: str):
+    def __init__(self, crews: List[Crew], target_user: discord.Member, role: str):
         super().__init__(timeout=TIMEOUTS["view"])
         self.crews = crews
         self.target_user = target_user
@@ -930,18 +873,18 @@ class CrewInviteSelectionView(View):
         self.add_item(CrewInviteDropdown(crews, target_user, role))
 
 class CrewInviteDropdown(Select):
-    def __init__(self, crews: List[Dict], target_user: discord.Member, role: str):
+    def __init__(self, crews: List[Crew], target_user: discord.Member, role: str):
         options = [
             discord.SelectOption(
-                label=crew['crew_name'],
-                value=str(crew['id']),
+                label=crew.crew_name,
+                value=str(crew.id),
                 description=f"Invite {target_user.display_name} as {role}"
             )
             for crew in crews[:25]
         ]
         
         super().__init__(placeholder="Select crew to invite to", options=options)
-        self.crews = {crew['id']: crew for crew in crews}
+        self.crews = {crew.id: crew for crew in crews}
         self.target_user = target_user
         self.role = role
 
@@ -954,7 +897,7 @@ class CrewInviteDropdown(Select):
         await cog.process_crew_invite(interaction, crew, self.target_user, self.role)
 
 class CrewInvitationView(View):
-    def __init__(self, crew: Dict, role: str, commander: discord.Member, target_user: discord.Member, db: EventDatabase):
+    def __init__(self, crew: Crew, role: str, commander: discord.Member, target_user: discord.Member, db: AsyncDatabase):
         super().__init__(timeout=TIMEOUTS["recruitment_offer"])
         self.crew = crew
         self.role = role
@@ -976,22 +919,11 @@ class AcceptCrewInviteButton(Button):
             return
         
         # Update database
-        conn = sqlite3.connect(self.parent.db.db_path)
-        cursor = conn.cursor()
-        
-        field_name = f"{self.parent.role}_id"
-        cursor.execute(f'''
-            UPDATE persistent_crews 
-            SET {field_name} = ?, updated_at = CURRENT_TIMESTAMP 
-            WHERE id = ?
-        ''', (self.parent.target_user.id, self.parent.crew['id']))
-        
-        conn.commit()
-        conn.close()
+        await self.parent.db.set_crew_member(self.parent.crew.id, self.parent.role, self.parent.target_user.id)
         
         embed = discord.Embed(
             title="🎉 Joined Crew!",
-            description=f"You've joined **{self.parent.crew['crew_name']}** as {self.parent.role}!",
+            description=f"You've joined **{self.parent.crew.crew_name}** as {self.parent.role}!",
             color=COLORS["success"]
         )
         
@@ -1025,7 +957,7 @@ class DeclineCrewInviteButton(Button):
         
         embed = discord.Embed(
             title="❌ Invitation Declined",
-            description=f"You declined the invitation to join **{self.parent.crew['crew_name']}**.",
+            description=f"You declined the invitation to join **{self.parent.crew.crew_name}**.",
             color=COLORS["error"]
         )
         
@@ -1048,7 +980,7 @@ class DeclineCrewInviteButton(Button):
         await interaction.edit_original_response(view=self.parent)
 
 class CrewEditView(View):
-    def __init__(self, crew: Dict):
+    def __init__(self, crew: Crew):
         super().__init__(timeout=TIMEOUTS["view"])
         self.crew = crew
         
@@ -1080,10 +1012,10 @@ class RemoveCrewMemberButton(Button):
     async def callback(self, interaction: discord.Interaction):
         # Show dropdown to select member to remove
         members = []
-        if self.parent.crew['gunner_id']:
-            members.append(('gunner', self.parent.crew['gunner_id']))
-        if self.parent.crew['driver_id']:
-            members.append(('driver', self.parent.crew['driver_id']))
+        if self.parent.crew.gunner_id:
+            members.append(('gunner', self.parent.crew.gunner_id))
+        if self.parent.crew.driver_id:
+            members.append(('driver', self.parent.crew.driver_id))
         
         if not members:
             await interaction.response.send_message("❌ No members to remove.", ephemeral=True)
@@ -1095,14 +1027,14 @@ class RemoveCrewMemberButton(Button):
         )
 
 class EditCrewNameModal(Modal):
-    def __init__(self, crew: Dict):
+    def __init__(self, crew: Crew):
         super().__init__(title="Edit Crew Name")
         self.crew = crew
         
         self.name_input = TextInput(
             label="New Crew Name",
             placeholder="Enter new crew name...",
-            default=crew['crew_name'],
+            default=crew.crew_name,
             max_length=30
         )
         self.add_item(self.name_input)
@@ -1115,19 +1047,10 @@ class EditCrewNameModal(Modal):
             return
         
         # Update database
-        from utils.database import EventDatabase
-        db = EventDatabase()
+        db = interaction.client.db
         
         try:
-            conn = sqlite3.connect(db.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE persistent_crews 
-                SET crew_name = ?, updated_at = CURRENT_TIMESTAMP 
-                WHERE id = ?
-            ''', (new_name, self.crew['id']))
-            conn.commit()
-            conn.close()
+            await db.rename_crew(self.crew.id, new_name)
             
             embed = discord.Embed(
                 title="✅ Crew Name Updated",
@@ -1137,21 +1060,18 @@ class EditCrewNameModal(Modal):
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
-        except sqlite3.IntegrityError:
-            await interaction.response.send_message(
-                f"❌ A crew named '{new_name}' already exists.", 
-                ephemeral=True
-            )
+        except ValueError as e:
+            await interaction.response.send_message(f"❌ {str(e)}", ephemeral=True)
 
 class EditCrewDescriptionModal(Modal):
-    def __init__(self, crew: Dict):
+    def __init__(self, crew: Crew):
         super().__init__(title="Edit Crew Description")
         self.crew = crew
         
         self.description_input = TextInput(
             label="Crew Description",
             placeholder="Enter crew description...",
-            default=crew.get('description', ''),
+            default=crew.description or '',
             style=discord.TextStyle.paragraph,
             max_length=500,
             required=False
@@ -1162,18 +1082,9 @@ class EditCrewDescriptionModal(Modal):
         new_description = self.description_input.value.strip() or None
         
         # Update database
-        from utils.database import EventDatabase
-        db = EventDatabase()
-        
-        conn = sqlite3.connect(db.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE persistent_crews 
-            SET description = ?, updated_at = CURRENT_TIMESTAMP 
-            WHERE id = ?
-        ''', (new_description, self.crew['id']))
-        conn.commit()
-        conn.close()
+        db = interaction.client.db
+        
+        await db.update_crew_description(self.crew.id, new_description)
         
         embed = discord.Embed(
             title="✅ Description Updated",
@@ -1187,23 +1098,23 @@ class EditCrewDescriptionModal(Modal):
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 class CrewEditSelectionView(View):
-    def __init__(self, crews: List[Dict]):
+    def __init__(self, crews: List[Crew]):
         super().__init__(timeout=TIMEOUTS["view"])
         self.add_item(CrewEditDropdown(crews))
 
 class CrewEditDropdown(Select):
-    def __init__(self, crews: List[Dict]):
+    def __init__(self, crews: List[Crew]):
         options = [
             discord.SelectOption(
-                label=crew['crew_name'],
-                value=str(crew['id']),
+                label=crew.crew_name,
+                value=str(crew.id),
                 description="Edit this crew"
             )
             for crew in crews[:25]
         ]
         
         super().__init__(placeholder="Select crew to edit", options=options)
-        self.crews = {crew['id']: crew for crew in crews}
+        self.crews = {crew.id: crew for crew in crews}
 
     async def callback(self, interaction: discord.Interaction):
         crew_id = int(self.values[0])
@@ -1212,23 +1123,23 @@ class CrewEditDropdown(Select):
         await interaction.response.send_message(view=CrewEditView(crew), ephemeral=True)
 
 class CrewLeaveSelectionView(View):
-    def __init__(self, crews: List[Dict]):
+    def __init__(self, crews: List[Crew]):
         super().__init__(timeout=TIMEOUTS["view"])
         self.add_item(CrewLeaveDropdown(crews))
 
 class CrewLeaveDropdown(Select):
-    def __init__(self, crews: List[Dict]):
+    def __init__(self, crews: List[Crew]):
         options = [
             discord.SelectOption(
-                label=crew['crew_name'],
-                value=str(crew['id']),
+                label=crew.crew_name,
+                value=str(crew.id),
                 description="Leave this crew"
             )
             for crew in crews[:25]
         ]
         
         super().__init__(placeholder="Select crew to leave", options=options)
-        self.crews = {crew['id']: crew for crew in crews}
+        self.crews = {crew.id: crew for crew in crews}
 
     async def callback(self, interaction: discord.Interaction):
         crew_id = int(self.values[0])
@@ -1239,7 +1150,7 @@ class CrewLeaveDropdown(Select):
         await cog.process_crew_leave(interaction, crew)
 
 class CrewDisbandConfirmView(View):
-    def __init__(self, crew: Dict, db: EventDatabase):
+    def __init__(self, crew: Crew, db: AsyncDatabase):
         super().__init__(timeout=TIMEOUTS["view"])
         self.crew = crew
         self.db = db
@@ -1254,19 +1165,11 @@ class ConfirmDisbandButton(Button):
 
     async def callback(self, interaction: discord.Interaction):
         # Mark crew as inactive
-        conn = sqlite3.connect(self.parent.db.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE persistent_crews 
-            SET active = 0, updated_at = CURRENT_TIMESTAMP 
-            WHERE id = ?
-        ''', (self.parent.crew['id'],))
-        conn.commit()
-        conn.close()
+        await self.parent.db.disband_crew(self.parent.crew.id)
         
         embed = discord.Embed(
             title="💥 Crew Disbanded",
-            description=f"**{self.parent.crew['crew_name']}** has been disbanded.",
+            description=f"**{self.parent.crew.crew_name}** has been disbanded.",
             color=COLORS["error"]
         )
         
@@ -1287,13 +1190,13 @@ class CancelDisbandButton(Button):
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 class RemoveCrewMemberView(View):
-    def __init__(self, crew: Dict, members: List[tuple]):
+    def __init__(self, crew: Crew, members: List[tuple]):
         super().__init__(timeout=TIMEOUTS["view"])
         self.crew = crew
         self.add_item(RemoveMemberDropdown(crew, members))
 
 class RemoveMemberDropdown(Select):
-    def __init__(self, crew: Dict, members: List[tuple]):
+    def __init__(self, crew: Crew, members: List[tuple]):
         options = [
             discord.SelectOption(
                 label=f"Remove {role.title()}",
@@ -1311,22 +1214,13 @@ class RemoveMemberDropdown(Select):
         role_to_remove = self.values[0]
         
         # Update database
-        from utils.database import EventDatabase
-        db = EventDatabase()
-        
-        conn = sqlite3.connect(db.db_path)
-        cursor = conn.cursor()
-        cursor.execute(f'''
-            UPDATE persistent_crews 
-            SET {role_to_remove}_id = NULL, updated_at = CURRENT_TIMESTAMP 
-            WHERE id = ?
-        ''', (self.crew['id'],))
-        conn.commit()
-        conn.close()
+        db = interaction.client.db
+        
+        await db.set_crew_member(self.crew.id, role_to_remove, None)
         
         embed = discord.Embed(
             title="✅ Member Removed",
-            description=f"The {role_to_remove} has been removed from **{self.crew['crew_name']}**.",
+            description=f"The {role_to_remove} has been removed from **{self.crew.crew_name}**.",
             color=COLORS["success"]
         )
         
@@ -3,15 +3,18 @@ import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 from discord.ui import View, Select
-import json
-import os
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List
-import sqlite3
-
-from utils.database import EventDatabase
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Tuple
+
+from utils.async_db import AsyncDatabase
+from utils.config import DB_WRITE_DURABILITY
+from utils.db_pool import ConnectionManager
+from utils.deadline_scheduler import DeadlineScheduler
+from utils.vote_tally import VoteTally
+from utils.write_queue import WriteBehindQueue
 from utils.permissions import (
     has_scheduler_privileges,
     PERMISSION_REQUIREMENT_TEXT,
@@ -42,6 +45,7 @@ MAP_OPTIONS = [
 ]
 
 MAX_DURATION_HOURS = 168  # 7 days max - INCREASED FROM 48 HOURS
+RESTORE_CONCURRENCY = 5  # Vote messages checked in parallel after a restart
 VOTE_DATA_FILE = "data/active_votes.json"
 UPDATE_INTERVALS = {
     'immediate': 30,   # Update every 30 seconds for votes ending in < 5 minutes
@@ -59,264 +63,179 @@ COLORS = {
     "info": 0x0099ff
 }
 
+def unix_time(dt: datetime) -> float:
+    """Unix time of a vote timestamp (naive UTC) or an event's aware start time; int() it for <t:...> markup"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
 class VoteDatabase:
-    """Enhanced database class for vote persistence with better recovery"""
+    """
+    Vote persistence on the main database's votes, user_votes and vote_history
+    tables (created by utils.database migration 4), sharing its connection
+    pool and write-behind queue so votes can be joined to their events.
+    """
     
-    def __init__(self, db_path='data/votes.db'):
-        self.db_path = db_path
-        self.init_database()
-
-    def init_database(self):
-        """Initialize vote database with enhanced schema"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Enhanced votes table with better persistence fields
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS votes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                message_id INTEGER UNIQUE NOT NULL,
-                channel_id INTEGER NOT NULL,
-                guild_id INTEGER NOT NULL,
-                creator_id INTEGER,
-                start_time TIMESTAMP NOT NULL,
-                end_time TIMESTAMP NOT NULL,
-                duration_minutes INTEGER NOT NULL,
-                active BOOLEAN DEFAULT 1,
-                event_id INTEGER,
-                auto_created BOOLEAN DEFAULT 0,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                embed_title TEXT,
-                embed_description TEXT,
-                view_restored BOOLEAN DEFAULT 0
-            )
-        ''')
+    def __init__(self, pool: ConnectionManager, writes: WriteBehindQueue):
+        self.pool = pool
+        self.writes = writes
 
-        # Individual votes table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_votes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                vote_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                map_choice TEXT NOT NULL,
-                voted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (vote_id) REFERENCES votes (id),
-                UNIQUE(vote_id, user_id)
-            )
-        ''')
+    def flush(self):
+        """Commit any batched ballots and history rows that are still queued"""
+        self.writes.flush()
 
-        # Vote history for analytics
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS vote_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                vote_id INTEGER NOT NULL,
-                action TEXT NOT NULL,
-                user_id INTEGER,
-                details TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (vote_id) REFERENCES votes (id)
-            )
-        ''')
-
-        conn.commit()
-        conn.close()
-        logger.info("Vote database initialized with persistence support")
+    def close(self):
+        """Commit queued writes; the shared pool is closed with the bot's database"""
+        self.writes.flush()
 
     def create_vote(self, message_id: int, channel_id: int, guild_id: int, 
                    creator_id: int, start_time: datetime, end_time: datetime,
                    duration_minutes: int, event_id: int = None, auto_created: bool = False,
                    embed_title: str = None, embed_description: str = None) -> int:
         """Create a new vote record with enhanced persistence data"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO votes (message_id, channel_id, guild_id, creator_id, start_time, 
-                             end_time, duration_minutes, event_id, auto_created, embed_title, embed_description)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (message_id, channel_id, guild_id, creator_id, start_time.isoformat(),
-              end_time.isoformat(), duration_minutes, event_id, auto_created, embed_title, embed_description))
-        
-        vote_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return vote_id
+        with self.pool.writer() as conn:
+            cursor = conn.execute('''
+                INSERT INTO votes (message_id, channel_id, guild_id, creator_id, start_time, 
+                                 end_time, duration_minutes, event_id, auto_created, embed_title, embed_description)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (message_id, channel_id, guild_id, creator_id, start_time.isoformat(),
+                  end_time.isoformat(), duration_minutes, event_id, auto_created, embed_title, embed_description))
+            return cursor.lastrowid
 
     def update_vote_status(self, message_id: int, active: bool):
         """Update vote active status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE votes SET active = ?, last_updated = CURRENT_TIMESTAMP 
-            WHERE message_id = ?
-        ''', (active, message_id))
-        conn.commit()
-        conn.close()
+        with self.pool.writer() as conn:
+            conn.execute('''
+                UPDATE votes SET active = ?, last_updated = CURRENT_TIMESTAMP 
+                WHERE message_id = ?
+            ''', (active, message_id))
 
     def mark_view_restored(self, message_id: int):
         """Mark that a vote's view has been restored after bot restart"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE votes SET view_restored = 1, last_updated = CURRENT_TIMESTAMP 
-            WHERE message_id = ?
-        ''', (message_id,))
-        conn.commit()
-        conn.close()
+        with self.pool.writer() as conn:
+            conn.execute('''
+                UPDATE votes SET view_restored = 1, last_updated = CURRENT_TIMESTAMP 
+                WHERE message_id = ?
+            ''', (message_id,))
 
     def cast_vote(self, message_id: int, user_id: int, map_choice: str):
         """Cast or update a user's vote"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         # Get vote_id
-        cursor.execute('SELECT id FROM votes WHERE message_id = ?', (message_id,))
-        result = cursor.fetchone()
+        with self.pool.reader() as conn:
+            result = conn.execute('SELECT id FROM votes WHERE message_id = ?', (message_id,)).fetchone()
         if not result:
-            conn.close()
             return False
         
         vote_id = result[0]
         
-        # Insert or update vote
-        cursor.execute('''
-            INSERT OR REPLACE INTO user_votes (vote_id, user_id, map_choice, voted_at)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-        ''', (vote_id, user_id, map_choice))
+        def write(conn):
+            # Insert or update vote
+            conn.execute('''
+                INSERT OR REPLACE INTO user_votes (vote_id, user_id, map_choice, voted_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (vote_id, user_id, map_choice))
         
-        conn.commit()
-        conn.close()
+        self.writes.run(write, DB_WRITE_DURABILITY['votes'])
         return True
 
-    def get_vote_results(self, message_id: int) -> Dict[str, int]:
-        """Get current vote results"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT uv.map_choice, COUNT(*) as vote_count
-            FROM user_votes uv
-            JOIN votes v ON uv.vote_id = v.id
-            WHERE v.message_id = ?
-            GROUP BY uv.map_choice
-            ORDER BY vote_count DESC
-        ''', (message_id,))
-        
-        results = dict(cursor.fetchall())
-        conn.close()
-        return results
+    def get_active_ballots(self) -> Dict[int, VoteTally]:
+        """Rebuild the tally of every active vote with a single query"""
+        tallies: Dict[int, VoteTally] = {}
+        with self.pool.reader() as conn:
+            rows = conn.execute('''
+                SELECT v.message_id, uv.user_id, uv.map_choice
+                FROM votes v
+                JOIN user_votes uv ON uv.vote_id = v.id
+                WHERE v.active = 1
+            ''')
+            for message_id, user_id, map_choice in rows:
+                tally = tallies.get(message_id)
+                if tally is None:
+                    tally = tallies[message_id] = VoteTally()
+                tally.cast(user_id, map_choice)
+        return tallies
 
     def get_active_votes(self) -> List[Dict]:
-        """Get all active votes for restoration after restart"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT message_id, channel_id, guild_id, creator_id, start_time, end_time,
-                   duration_minutes, event_id, auto_created, last_updated, embed_title, embed_description
-            FROM votes 
-            WHERE active = 1
-        ''', )
+        """Get all active votes with their ballot totals in one query"""
+        with self.pool.reader() as conn:
+            rows = conn.execute('''
+                SELECT v.message_id, v.channel_id, v.guild_id, v.creator_id, v.start_time, v.end_time,
+                       v.duration_minutes, v.event_id, v.auto_created, v.last_updated,
+                       v.embed_title, v.embed_description, v.event_title, v.event_time,
+                       COUNT(uv.user_id) AS total_votes
+                FROM vote_details v
+                LEFT JOIN user_votes uv ON uv.vote_id = v.id
+                WHERE v.active = 1
+                GROUP BY v.id
+            ''').fetchall()
         
         columns = ['message_id', 'channel_id', 'guild_id', 'creator_id', 'start_time', 
                   'end_time', 'duration_minutes', 'event_id', 'auto_created', 'last_updated',
-                  'embed_title', 'embed_description']
+                  'embed_title', 'embed_description', 'event_title', 'event_time',
+                  'total_votes']
         
-        results = []
-        for row in cursor.fetchall():
-            vote_dict = dict(zip(columns, row))
-            # Get vote count
-            vote_dict['total_votes'] = self.get_total_votes(vote_dict['message_id'])
-            results.append(vote_dict)
-        
-        conn.close()
-        return results
-
-    def get_total_votes(self, message_id: int) -> int:
-        """Get total number of votes for a message"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT COUNT(*)
-            FROM user_votes uv
-            JOIN votes v ON uv.vote_id = v.id
-            WHERE v.message_id = ?
-        ''', (message_id,))
-        
-        result = cursor.fetchone()
-        conn.close()
-        return result[0] if result else 0
+        return [dict(zip(columns, row)) for row in rows]
 
     def cleanup_expired_votes(self):
         """Clean up votes that ended more than 24 hours ago"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Mark expired votes as inactive
-        cursor.execute('''
-            UPDATE votes 
-            SET active = 0 
-            WHERE active = 1 AND datetime(end_time) < datetime('now', '-1 day')
-        ''')
-        
-        cleaned = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self.pool.writer() as conn:
+            # Mark expired votes as inactive
+            cursor = conn.execute('''
+                UPDATE votes 
+                SET active = 0 
+                WHERE active = 1 AND datetime(end_time) < datetime('now', '-1 day')
+            ''')
+            cleaned = cursor.rowcount
         
         if cleaned > 0:
             logger.info(f"Cleaned up {cleaned} expired votes")
 
     def log_vote_action(self, message_id: int, action: str, user_id: int = None, details: str = None):
         """Log vote-related actions"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get vote_id
-        cursor.execute('SELECT id FROM votes WHERE message_id = ?', (message_id,))
-        result = cursor.fetchone()
-        if not result:
-            conn.close()
-            return
-        
-        vote_id = result[0]
+        def write(conn):
+            # Resolve vote_id in the same statement; unknown messages insert nothing
+            conn.execute('''
+                INSERT INTO vote_history (vote_id, action, user_id, details)
+                SELECT id, ?, ?, ? FROM votes WHERE message_id = ?
+            ''', (action, user_id, details, message_id))
         
-        cursor.execute('''
-            INSERT INTO vote_history (vote_id, action, user_id, details)
-            VALUES (?, ?, ?, ?)
-        ''', (vote_id, action, user_id, details))
-        
-        conn.commit()
-        conn.close()
+        self.writes.run(write, DB_WRITE_DURABILITY['audit'])
 
 class MapVoting(commands.Cog):
     """Enhanced map voting system with 7-day persistence and restart recovery"""
     
     def __init__(self, bot):
         self.bot = bot
-        self.vote_db = VoteDatabase()
-        self.settings_db = EventDatabase()
+        self.vote_db = AsyncDatabase(VoteDatabase(bot.db.pool, bot.db.writes))
+        self.settings_db = bot.db
         self.active_votes = {}
         
         # Track update intervals to optimize performance
         self.last_update_times = {}
+
+        # Votes with ballots cast since their embed was last rendered
+        self.dirty_votes = set()
+        self.edit_stats = {'performed': 0, 'skipped': 0, 'fetches_avoided': 0}
+
+        # Vote end times; a single task sleeps until the earliest one
+        self.vote_deadlines = DeadlineScheduler()
+        self.deadline_task = None
+        self.restore_task = None
         
         # Track restoration status
         self.restoration_complete = False
         
         logger.info("Enhanced Map Voting cog initialized with 7-day persistence")
 
-    def _has_privileges(self, member: discord.Member) -> bool:
+    async def _has_privileges(self, member: discord.Member) -> bool:
         """Check whether the member can run privileged voting commands."""
         allowed_roles = None
         guild = getattr(member, "guild", None)
 
         if guild:
             try:
-                guild_settings = self.settings_db.get_guild_settings(guild.id)
-                allowed_roles = guild_settings.get("admin_roles")
+                guild_settings = await self.settings_db.get_guild_settings(guild.id)
+                allowed_roles = guild_settings.admin_roles
             except Exception as exc:
                 logger.error(f"Failed to load guild settings for permissions: {exc}")
 
@@ -324,8 +243,18 @@ class MapVoting(commands.Cog):
 
     async def cog_load(self):
         """Called when cog is loaded"""
-        # Load active votes from database first
-        await self.restore_active_votes()
+        # One persistent view handles the dropdown on every vote message
+        self.bot.add_view(MapVoteView())
+
+        # Load active votes from database first; checking their messages
+        # needs the gateway, so it runs in the background
+        await self.load_active_votes()
+        if self.restore_task is None:
+            self.restore_task = asyncio.create_task(self.restore_active_votes())
+
+        # Close votes exactly when they expire rather than on the next poll
+        if self.deadline_task is None:
+            self.deadline_task = asyncio.create_task(self.run_vote_deadlines())
         
         # Start the update task with dynamic intervals
         if not self.dynamic_update_task.is_running():
@@ -341,12 +270,22 @@ class MapVoting(commands.Cog):
         """Called when cog is unloaded"""
         self.dynamic_update_task.cancel()
         self.cleanup_task.cancel()
-
-    async def restore_active_votes(self):
-        """Restore active votes from database after bot restart"""
+        if self.deadline_task is not None:
+            self.deadline_task.cancel()
+            self.deadline_task = None
+        if self.restore_task is not None:
+            self.restore_task.cancel()
+            self.restore_task = None
+        self.vote_db.close()
+
+    async def load_active_votes(self):
+        """Rebuild in-memory vote state from the database after a restart"""
         try:
-            active_votes = self.vote_db.get_active_votes()
-            restored_count = 0
+            active_votes = await self.vote_db.get_active_votes()
+            total_ballots = sum(vote['total_votes'] for vote in active_votes)
+            
+            # Per-user ballots are only needed (and only queried) if anyone voted
+            tallies = await self.vote_db.get_active_ballots() if total_ballots else {}
             
             for vote in active_votes:
                 message_id = str(vote['message_id'])
@@ -354,36 +293,7 @@ class MapVoting(commands.Cog):
                 
                 # Skip votes that have already ended
                 if datetime.utcnow() >= end_time:
-                    self.vote_db.update_vote_status(vote['message_id'], False)
-                    continue
-                
-                # Try to restore the message and view
-                try:
-                    channel = self.bot.get_channel(vote['channel_id'])
-                    if channel:
-                        try:
-                            message = await channel.fetch_message(vote['message_id'])
-                            
-                            # Restore the view to the message
-                            view = MapVoteView()
-                            await message.edit(view=view)
-                            
-                            # Mark as restored
-                            self.vote_db.mark_view_restored(vote['message_id'])
-                            restored_count += 1
-                            
-                            logger.info(f"Restored vote message {message_id} in #{channel.name}")
-                            
-                        except discord.NotFound:
-                            # Message was deleted, mark vote as inactive
-                            self.vote_db.update_vote_status(vote['message_id'], False)
-                            logger.warning(f"Vote message {message_id} not found, marking inactive")
-                            continue
-                        except discord.Forbidden:
-                            logger.warning(f"No permission to edit vote message {message_id}")
-                            
-                except Exception as e:
-                    logger.error(f"Error restoring vote {message_id}: {e}")
+                    await self.vote_db.update_vote_status(vote['message_id'], False)
                     continue
                 
                 # Convert to format expected by existing code
@@ -395,21 +305,84 @@ class MapVoting(commands.Cog):
                     'end_time': vote['end_time'],
                     'active': True,
                     'event_id': vote['event_id'],
+                    'event_title': vote['event_title'],
+                    'event_time': vote['event_time'],
                     'duration_minutes': vote['duration_minutes'],
                     'auto_created': vote['auto_created'],
-                    'votes': self.vote_db.get_vote_results(vote['message_id'])
+                    'votes': tallies.get(vote['message_id']) or VoteTally()
                 }
                 
                 # Initialize update tracking
                 self.last_update_times[message_id] = datetime.utcnow()
+                self.vote_deadlines.schedule(message_id, unix_time(end_time))
             
-            logger.info(f"Restored {restored_count} active votes from database")
-            self.restoration_complete = True
+            logger.info(f"Loaded {len(self.active_votes)} active votes ({total_ballots} ballots) from database")
             
         except Exception as e:
-            logger.error(f"Error restoring active votes: {e}")
+            logger.error(f"Error loading active votes: {e}")
+        finally:
             self.restoration_complete = True
 
+    async def restore_active_votes(self):
+        """Background job: check that every active vote's message still exists"""
+        await self.bot.wait_until_ready()
+        
+        started = time.perf_counter()
+        outcomes = {'restored': 0, 'missing': 0, 'forbidden': 0, 'failed': 0}
+        semaphore = asyncio.Semaphore(RESTORE_CONCURRENCY)
+        
+        async def restore(message_id: str, vote_data: Dict):
+            async with semaphore:
+                outcome = await self.restore_vote(message_id, vote_data)
+            outcomes[outcome] += 1
+        
+        pending = [
+            restore(message_id, vote_data)
+            for message_id, vote_data in list(self.active_votes.items())
+            if vote_data['active']
+        ]
+        await asyncio.gather(*pending)
+        
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Restored {len(pending)} active votes in {elapsed:.2f}s "
+            f"(restored: {outcomes['restored']}, missing: {outcomes['missing']}, "
+            f"forbidden: {outcomes['forbidden']}, failed: {outcomes['failed']})"
+        )
+
+    async def restore_vote(self, message_id: str, vote_data: Dict) -> str:
+        """Check one vote message; returns restored, missing, forbidden or failed"""
+        try:
+            channel = self.bot.get_channel(vote_data['channel_id'])
+            if channel:
+                # MapVoteView is registered with add_view, so the message needs no edit
+                await channel.fetch_message(int(message_id))
+                await self.vote_db.mark_view_restored(int(message_id))
+                return 'restored'
+            logger.warning(f"Channel for vote message {message_id} not found, marking inactive")
+        except discord.NotFound:
+            logger.warning(f"Vote message {message_id} not found, marking inactive")
+        except discord.Forbidden:
+            logger.warning(f"No permission to read vote message {message_id}")
+            return 'forbidden'
+        except Exception as e:
+            logger.error(f"Error restoring vote {message_id}: {e}")
+            return 'failed'
+        
+        # Message or channel was deleted
+        await self.vote_db.update_vote_status(int(message_id), False)
+        vote_data['active'] = False
+        self.dirty_votes.discard(message_id)
+        self.vote_deadlines.cancel(message_id)
+        return 'missing'
+
+    async def get_event_details(self, event_id: Optional[int]) -> Tuple[Optional[str], Optional[str]]:
+        """Title and start time of the event a new vote links to; restored votes read them from vote_details"""
+        if not event_id:
+            return None, None
+        event = await self.settings_db.get_event_by_id(event_id)
+        return (event.title, event.event_time) if event else (None, None)
+
     def get_update_interval(self, end_time: datetime) -> int:
         """Get appropriate update interval based on time remaining"""
         remaining = end_time - datetime.utcnow()
@@ -428,6 +401,10 @@ class MapVoting(commands.Cog):
         else:  # > 24 hours
             return UPDATE_INTERVALS['daily']
 
+    def mark_dirty(self, message_id: str):
+        """Flag a vote's embed for re-render on the next update tick"""
+        self.dirty_votes.add(message_id)
+
     def should_update_vote(self, message_id: str, end_time: datetime) -> bool:
         """Determine if a vote should be updated based on its interval"""
         last_update = self.last_update_times.get(message_id, datetime.min)
@@ -464,6 +441,7 @@ class MapVoting(commands.Cog):
         # Create the vote
         start_time = datetime.utcnow()
         end_time = start_time + timedelta(minutes=total_minutes)
+        event_title, event_time = await self.get_event_details(event_id)
         view = MapVoteView()
         
         # Create initial embed
@@ -473,14 +451,16 @@ class MapVoting(commands.Cog):
             votes={},
             event_id=event_id,
             total_minutes=total_minutes,
-            auto_created=False
+            auto_created=False,
+            event_title=event_title,
+            event_time=event_time
         )
         
         await interaction.response.send_message(embed=embed, view=view)
         message = await interaction.original_response()
         
         # Save to database with enhanced persistence data
-        vote_id = self.vote_db.create_vote(
+        vote_id = await self.vote_db.create_vote(
             message_id=message.id,
             channel_id=interaction.channel.id,
             guild_id=interaction.guild.id,
@@ -503,16 +483,19 @@ class MapVoting(commands.Cog):
             'end_time': end_time.isoformat(),
             'active': True,
             'event_id': event_id,
+            'event_title': event_title,
+            'event_time': event_time,
             'duration_minutes': total_minutes,
             'auto_created': False,
-            'votes': {}
+            'votes': VoteTally()
         }
         
         # Initialize update tracking
         self.last_update_times[str(message.id)] = datetime.utcnow()
+        self.vote_deadlines.schedule(str(message.id), unix_time(end_time))
         
         # Log the action
-        self.vote_db.log_vote_action(message.id, 'vote_created', interaction.user.id, 
+        await self.vote_db.log_vote_action(message.id, 'vote_created', interaction.user.id, 
                                    f"Duration: {total_minutes} minutes ({days}d {hours}h {minutes}m)")
         
         logger.info(f"Started {total_minutes}-minute map vote in {interaction.guild.name} - {interaction.channel.name}, ending at {end_time}")
@@ -530,6 +513,7 @@ class MapVoting(commands.Cog):
             # Create the vote
             start_time = datetime.utcnow()
             end_time = start_time + timedelta(minutes=duration_minutes)
+            event_title, event_time = await self.get_event_details(event_id)
             view = MapVoteView()
             
             # Create initial embed
@@ -539,14 +523,16 @@ class MapVoting(commands.Cog):
                 votes={},
                 event_id=event_id,
                 total_minutes=duration_minutes,
-                auto_created=True
+                auto_created=True,
+                event_title=event_title,
+                event_time=event_time
             )
             
             # Send the message
             message = await channel.send(embed=embed, view=view)
             
             # Save to database with enhanced persistence
-            vote_id = self.vote_db.create_vote(
+            vote_id = await self.vote_db.create_vote(
                 message_id=message.id,
                 channel_id=channel.id,
                 guild_id=channel.guild.id,
@@ -569,16 +555,19 @@ class MapVoting(commands.Cog):
                 'end_time': end_time.isoformat(),
                 'active': True,
                 'event_id': event_id,
+                'event_title': event_title,
+                'event_time': event_time,
                 'duration_minutes': duration_minutes,
                 'auto_created': True,
-                'votes': {}
+                'votes': VoteTally()
             }
             
             # Initialize update tracking
             self.last_update_times[str(message.id)] = datetime.utcnow()
+            self.vote_deadlines.schedule(str(message.id), unix_time(end_time))
             
             # Log the action
-            self.vote_db.log_vote_action(message.id, 'auto_vote_created', None, 
+            await self.vote_db.log_vote_action(message.id, 'auto_vote_created', None, 
                                        f"Event: {event_id}, Duration: {duration_minutes} minutes")
             
             logger.info(f"Auto-created {duration_minutes}-minute map vote for event {event_id} in {channel.name}")
@@ -591,27 +580,25 @@ class MapVoting(commands.Cog):
 
     def create_vote_embed(self, message_id: int, end_time: datetime, votes: Dict[str, int], 
                          event_id: int = None, total_minutes: int = 0, auto_created: bool = False,
-                         is_ended: bool = False, event_title: str = None) -> discord.Embed:
-        """Create embed for vote display with event countdown instead of vote countdown"""
+                         is_ended: bool = False, event_title: str = None,
+                         event_time: str = None) -> discord.Embed:
+        """
+        Create embed for vote display.
+
+        Countdowns use Discord's relative timestamp markup, which clients tick
+        locally, so the message only needs editing when tallies change or the
+        vote ends.
+        """
+        total_votes = sum(votes.values())
         
         if is_ended:
             title = "🏁 MAP VOTE ENDED"
             color = COLORS["error"]
-            footer_text = f"Vote ended • {sum(votes.values())} total votes"
+            footer_text = f"Vote ended • {total_votes} total votes"
         else:
             title = "🗳️ MAP VOTE IN PROGRESS"
             color = COLORS["success"]
-            
-            # Show event countdown instead of vote countdown if we have an event
-            if event_id and auto_created:
-                # Calculate event time from vote end time + 1 hour
-                event_time = end_time + timedelta(hours=1)
-                event_countdown = self.format_time_remaining_to_event(event_time)
-                footer_text = f"⏰ Event in: {event_countdown} • {sum(votes.values())} votes"
-            else:
-                # Fall back to vote countdown for manual votes
-                time_remaining = self.format_time_remaining(end_time)
-                footer_text = f"⏰ Vote ends: {time_remaining} • {sum(votes.values())} votes"
+            footer_text = f"{total_votes} votes"
         
         # Add event context if linked
         description = ""
@@ -628,6 +615,23 @@ class MapVoting(commands.Cog):
             color=color
         )
         
+        if not is_ended:
+            vote_ends = int(unix_time(end_time))
+            if event_time:
+                # A vote linked to a scheduled event counts down to the event itself
+                event_starts = int(unix_time(datetime.fromisoformat(event_time)))
+                embed.add_field(
+                    name="⏰ Event Starts",
+                    value=f"<t:{event_starts}:R> (<t:{event_starts}:f>)\nVoting closes <t:{vote_ends}:R>",
+                    inline=False
+                )
+            else:
+                embed.add_field(
+                    name="⏰ Vote Ends",
+                    value=f"<t:{vote_ends}:R> (<t:{vote_ends}:f>)",
+                    inline=False
+                )
+        
         # Add duration info with better formatting for long durations
         duration_text = self.format_duration(total_minutes)
         if auto_created:
@@ -637,55 +641,8 @@ class MapVoting(commands.Cog):
         
         embed.set_footer(text=footer_text)
         
-        # Add progress bar for time remaining if not ended
-        if not is_ended and total_minutes > 0:
-            if event_id and auto_created:
-                # Show progress toward event time instead of vote end time
-                event_time = end_time + timedelta(hours=1)
-                total_event_duration = (event_time - (end_time - timedelta(minutes=total_minutes))).total_seconds() / 60
-                elapsed_minutes = total_event_duration - ((event_time - datetime.utcnow()).total_seconds() / 60)
-                progress = max(0, min(100, (elapsed_minutes / total_event_duration) * 100))
-                progress_bar = self.create_progress_bar(progress)
-                embed.add_field(name="⏱️ Event Progress", value=progress_bar, inline=False)
-            else:
-                # Original vote progress bar for manual votes
-                elapsed_minutes = total_minutes - ((end_time - datetime.utcnow()).total_seconds() / 60)
-                progress = max(0, min(100, (elapsed_minutes / total_minutes) * 100))
-                progress_bar = self.create_progress_bar(progress)
-                embed.add_field(name="⏱️ Vote Progress", value=progress_bar, inline=False)
-        
         return embed
 
-    def format_time_remaining_to_event(self, event_time: datetime) -> str:
-        """Format time remaining until event starts (same format as armor events)"""
-        remaining = event_time - datetime.utcnow()
-        if remaining.total_seconds() <= 0:
-            return "🔴 EVENT STARTED"
-        
-        total_seconds = int(remaining.total_seconds())
-        days = total_seconds // 86400
-        hours = (total_seconds % 86400) // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        
-        parts = []
-        if days > 0:
-            parts.append(f"{days}d")
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0:
-            parts.append(f"{minutes}m")
-        if seconds > 0 and days == 0:  # Only show seconds if less than a day
-            parts.append(f"{seconds}s")
-        
-        return " ".join(parts) if parts else "<1s"
-
-    def create_progress_bar(self, percentage: float, length: int = 20) -> str:
-        """Create a visual progress bar"""
-        filled = int(length * percentage / 100)
-        bar = "█" * filled + "░" * (length - filled)
-        return f"`{bar}` {percentage:.1f}%"
-
     def get_vote_results_text(self, votes_dict: Dict[str, int]) -> str:
         """Convert vote results to formatted text"""
         if not votes_dict:
@@ -710,30 +667,6 @@ class MapVoting(commands.Cog):
         
         return "\n".join(results)
 
-    def format_time_remaining(self, end_time: datetime) -> str:
-        """Format time remaining with proper support for days"""
-        remaining = end_time - datetime.utcnow()
-        if remaining.total_seconds() <= 0:
-            return "ENDED"
-        
-        total_seconds = int(remaining.total_seconds())
-        days = total_seconds // 86400
-        hours = (total_seconds % 86400) // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        
-        parts = []
-        if days > 0:
-            parts.append(f"{days}d")
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0:
-            parts.append(f"{minutes}m")
-        if seconds > 0 and days == 0:  # Only show seconds if less than a day
-            parts.append(f"{seconds}s")
-        
-        return " ".join(parts) if parts else "<1s"
-
     def format_duration(self, total_minutes: int) -> str:
         """Format total duration with proper day support"""
         if total_minutes < 60:
@@ -749,40 +682,37 @@ class MapVoting(commands.Cog):
 
     @tasks.loop(seconds=30)  # Check every 30 seconds for better responsiveness
     async def dynamic_update_task(self):
-        """Dynamic background task to update vote embeds and end votes"""
+        """Background task to re-render vote embeds that received new ballots"""
         if not self.restoration_complete:
             return  # Wait for restoration to complete
             
         try:
             current_time = datetime.utcnow()
+
+            # Expiry is handled by the deadline scheduler, so only votes with
+            # new ballots need visiting; the rest count as skipped edits
+            self.edit_stats['skipped'] += max(0, len(self.vote_deadlines) - len(self.dirty_votes))
             
-            for message_id, vote_data in list(self.active_votes.items()):
-                if not vote_data['active']:
+            for message_id in list(self.dirty_votes):
+                vote_data = self.active_votes.get(message_id)
+                if not vote_data or not vote_data['active']:
+                    self.dirty_votes.discard(message_id)
                     continue
                 
                 end_time = datetime.fromisoformat(vote_data['end_time'])
                 
                 try:
-                    # Check if vote should end
+                    # At most one edit per interval; further ballots in the
+                    # meantime coalesce into that one edit
                     if current_time >= end_time:
-                        await self.end_vote_automatically(message_id, vote_data)
-                        continue
-                    
-                    # Check if we should update this vote based on its interval
+                        continue  # about to be closed by the deadline task
                     if not self.should_update_vote(message_id, end_time):
                         continue
                     
-                    channel = self.bot.get_channel(vote_data['channel_id'])
-                    if not channel:
-                        continue
-                    
-                    message = await channel.fetch_message(int(message_id))
-                    if not message:
-                        continue
-                    
-                    # Get current results from database
-                    current_votes = self.vote_db.get_vote_results(int(message_id))
-                    vote_data['votes'] = current_votes
+                    # Clear before reading tallies so a ballot cast meanwhile re-dirties the vote
+                    self.dirty_votes.discard(message_id)
+
+                    current_votes = vote_data['votes'].results()
                     
                     # Update the embed with current results
                     embed = self.create_vote_embed(
@@ -790,18 +720,24 @@ class MapVoting(commands.Cog):
                         end_time=end_time,
                         votes=current_votes,
                         event_id=vote_data.get('event_id'),
+                        event_title=vote_data.get('event_title'),
+                        event_time=vote_data.get('event_time'),
                         total_minutes=vote_data['duration_minutes'],
                         auto_created=vote_data.get('auto_created', False)
                     )
                     
-                    await message.edit(embed=embed)
+                    await self.edit_vote_message(vote_data, message_id, embed=embed)
+                    self.edit_stats['performed'] += 1
                     self.last_update_times[message_id] = current_time
                         
                 except discord.NotFound:
                     # Message was deleted, mark as inactive
-                    self.vote_db.update_vote_status(int(message_id), False)
+                    await self.vote_db.update_vote_status(int(message_id), False)
                     self.active_votes[message_id]['active'] = False
+                    self.dirty_votes.discard(message_id)
+                    self.vote_deadlines.cancel(message_id)
                 except Exception as e:
+                    self.dirty_votes.add(message_id)  # retry on the next tick
                     logger.error(f"Error updating vote {message_id}: {e}")
             
         except Exception as e:
@@ -811,23 +747,46 @@ class MapVoting(commands.Cog):
     async def cleanup_task(self):
         """Clean up expired votes periodically"""
         try:
-            self.vote_db.cleanup_expired_votes()
+            await self.vote_db.cleanup_expired_votes()
         except Exception as e:
             logger.error(f"Error in cleanup task: {e}")
 
+    def vote_channel(self, vote_data: Dict) -> discord.PartialMessageable:
+        """Channel handle for a vote that needs neither the cache nor an HTTP fetch"""
+        return self.bot.get_partial_messageable(vote_data['channel_id'], guild_id=vote_data['guild_id'])
+
+    async def edit_vote_message(self, vote_data: Dict, message_id: str, **fields):
+        """
+        Edit a vote message by ID through a PartialMessage, skipping the GET
+        that fetch_message would cost. The edit goes through the bot's shared
+        edit scheduler and raises NotFound/Forbidden like Message.edit, so
+        callers handle deleted messages as before.
+        """
+        message = self.vote_channel(vote_data).get_partial_message(int(message_id))
+        await self.bot.edit_scheduler.edit(message, **fields)
+        self.edit_stats['fetches_avoided'] += 1
+
+    async def run_vote_deadlines(self):
+        """Background task: end each vote as its deadline passes"""
+        await self.bot.wait_until_ready()
+        await self.vote_deadlines.run(self.expire_vote)
+
+    async def expire_vote(self, message_id: str):
+        """Deadline callback; ignores votes that were already ended"""
+        vote_data = self.active_votes.get(message_id)
+        if vote_data and vote_data['active']:
+            await self.end_vote_automatically(message_id, vote_data)
+
     async def end_vote_automatically(self, message_id: str, vote_data: Dict):
         """End a vote automatically when time expires"""
         
         # End the vote in database
-        self.vote_db.update_vote_status(int(message_id), False)
+        await self.vote_db.update_vote_status(int(message_id), False)
         self.active_votes[message_id]['active'] = False
+        self.dirty_votes.discard(message_id)
         
         try:
-            channel = self.bot.get_channel(vote_data['channel_id'])
-            message = await channel.fetch_message(int(message_id))
-            
-            # Get final results from database
-            final_votes = self.vote_db.get_vote_results(int(message_id))
+            final_votes = vote_data['votes'].results()
             
             # Update embed to show ended state
             embed = self.create_vote_embed(
@@ -835,23 +794,25 @@ class MapVoting(commands.Cog):
                 end_time=datetime.fromisoformat(vote_data['end_time']),
                 votes=final_votes,
                 event_id=vote_data.get('event_id'),
+                event_title=vote_data.get('event_title'),
                 total_minutes=vote_data['duration_minutes'],
                 auto_created=vote_data.get('auto_created', False),
                 is_ended=True
             )
-            await message.edit(embed=embed, view=None)
+            await self.edit_vote_message(vote_data, message_id, embed=embed, view=None)
             
             # Post final results
             results = self.get_vote_results_text(final_votes)
             final_message = f"🏁 **Final Map Vote Results:**\n{results}"
             
             if vote_data.get('event_id'):
-                final_message += f"\n\n🎯 **For Event:** Event #{vote_data['event_id']}"
+                event_name = vote_data.get('event_title') or f"Event #{vote_data['event_id']}"
+                final_message += f"\n\n🎯 **For Event:** {event_name}"
             
-            await channel.send(final_message)
+            await self.vote_channel(vote_data).send(final_message)
             
             # Log the action
-            self.vote_db.log_vote_action(int(message_id), 'vote_ended_auto', None, results)
+            await self.vote_db.log_vote_action(int(message_id), 'vote_ended_auto', None, results)
             
         except Exception as e:
             logger.error(f"Error ending vote automatically {message_id}: {e}")
@@ -869,7 +830,7 @@ class MapVoting(commands.Cog):
         
         # Check permissions - only creator or admins can end vote
         if (vote_data['creator_id'] != interaction.user.id and 
-            not self._has_privileges(interaction.user)):
+            not await self._has_privileges(interaction.user)):
             await interaction.response.send_message(
                 f"❌ You can only end votes you created, or you need {PERMISSION_REQUIREMENT_TEXT}.", 
                 ephemeral=True
@@ -881,16 +842,19 @@ class MapVoting(commands.Cog):
     async def end_vote_manually(self, interaction: discord.Interaction, message_id: str, vote_data: Dict):
         """End a vote manually"""
         
-        # End the vote in database
-        self.vote_db.update_vote_status(int(message_id), False)
         self.active_votes[message_id]['active'] = False
+        self.dirty_votes.discard(message_id)
+        self.vote_deadlines.cancel(message_id)
+        
+        # Reply before the database write and the rate-limited edit so the
+        # interaction is answered within Discord's 3 second window
+        final_votes = vote_data['votes'].results()
+        results = self.get_vote_results_text(final_votes)
+        await interaction.response.send_message(f"🏁 **Vote Ended Manually - Final Results:**\n{results}")
         
         try:
-            channel = self.bot.get_channel(vote_data['channel_id'])
-            message = await channel.fetch_message(int(message_id))
-            
-            # Get final results from database
-            final_votes = self.vote_db.get_vote_results(int(message_id))
+            # End the vote in database
+            await self.vote_db.update_vote_status(int(message_id), False)
             
             # Update embed to show ended state
             embed = self.create_vote_embed(
@@ -898,22 +862,20 @@ class MapVoting(commands.Cog):
                 end_time=datetime.fromisoformat(vote_data['end_time']),
                 votes=final_votes,
                 event_id=vote_data.get('event_id'),
+                event_title=vote_data.get('event_title'),
                 total_minutes=vote_data['duration_minutes'],
                 auto_created=vote_data.get('auto_created', False),
                 is_ended=True
             )
-            await message.edit(embed=embed, view=None)
-            
-            # Post final results
-            results = self.get_vote_results_text(final_votes)
-            await interaction.response.send_message(f"🏁 **Vote Ended Manually - Final Results:**\n{results}")
+            await self.edit_vote_message(vote_data, message_id, embed=embed, view=None)
             
             # Log the action
-            self.vote_db.log_vote_action(int(message_id), 'vote_ended_manually', 
+            await self.vote_db.log_vote_action(int(message_id), 'vote_ended_manually', 
                                        interaction.user.id, results)
             
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error ending vote: {e}", ephemeral=True)
+            logger.error(f"Error ending vote manually {message_id}: {e}")
+            await interaction.followup.send(f"❌ Error ending vote: {e}", ephemeral=True)
 
     @app_commands.command(name="listvotes")
     async def list_votes(self, interaction: discord.Interaction):
@@ -932,20 +894,25 @@ class MapVoting(commands.Cog):
         
         for vote in guild_votes:
             end_time = datetime.fromisoformat(vote['end_time'])
-            time_remaining = self.format_time_remaining(end_time)
             
             field_value = f"**Channel:** <#{vote['channel_id']}>\n"
-            field_value += f"**Time Left:** {time_remaining}\n"
-            field_value += f"**Total Votes:** {sum(vote['votes'].values())}"
+            field_value += f"**Ends:** <t:{int(unix_time(end_time))}:R>\n"
+            field_value += f"**Total Votes:** {vote['votes'].total()}"
             
             if vote.get('event_id'):
-                field_value += f"\n**Event ID:** {vote['event_id']}"
+                field_value += f"\n**Event:** {vote.get('event_title') or '#' + str(vote['event_id'])}"
             
             embed.add_field(
                 name=f"Vote ID: {vote['message_id']}",
                 value=field_value,
                 inline=False
             )
+
+        embed.set_footer(
+            text=f"Embed refreshes: {self.edit_stats['performed']:,} performed • "
+                 f"{self.edit_stats['skipped']:,} skipped (no new votes) • "
+                 f"{self.edit_stats['fetches_avoided']:,} message fetches avoided"
+        )
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -1010,18 +977,18 @@ class MapVoteDropdown(Select):
             return
         
         # Cast the vote
-        user_id = str(interaction.user.id)
         selected_map = self.values[0]
         
         # Update in database
-        success = cog.vote_db.cast_vote(int(message_id), interaction.user.id, selected_map)
+        success = await cog.vote_db.cast_vote(int(message_id), interaction.user.id, selected_map)
         
         if not success:
             await interaction.response.send_message("❌ Error casting vote.", ephemeral=True)
             return
         
-        # Update local storage
-        cog.active_votes[message_id]['votes'][user_id] = selected_map
+        # Update the in-memory tally
+        cog.active_votes[message_id]['votes'].cast(interaction.user.id, selected_map)
+        cog.mark_dirty(message_id)
         
         # Find the emoji for the selected map
         selected_emoji = "🗺️"
@@ -6,6 +6,10 @@ import logging
 import os
 import sys
 
+from utils.async_db import AsyncDatabase
+from utils.database import EventDatabase
+from utils.edit_scheduler import EditScheduler
+
 # Create logs directory if it doesn't exist
 os.makedirs('data/logs', exist_ok=True)
 
@@ -43,6 +47,14 @@ class TankBrawlBot(commands.Bot):
             'cogs.admin_tools',
         ]
 
+        # Shared database handle (one writer + reader pool) injected into every cog.
+        # Calls are awaitable and run on a worker thread, never on the event loop.
+        self.db = AsyncDatabase(EventDatabase())
+
+        # Shared, rate-limited queue for message edits so cogs don't race
+        # each other for the same channel's edit bucket
+        self.edit_scheduler = EditScheduler()
+
     async def setup_hook(self):
         """Load all cogs when bot starts"""
         logger.info("Loading cogs...")
@@ -72,6 +84,20 @@ class TankBrawlBot(commands.Bot):
         )
         await self.change_presence(activity=activity)
 
+    async def close(self):
+        """Shut down the bot, flushing batched writes before releasing database connections"""
+        try:
+            await self.db.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush batched database writes: {e}")
+
+        # Debounced signup edits would otherwise lose the last roster changes
+        await self.edit_scheduler.close()
+
+        # Unloading the cogs closes (and flushes) their own databases
+        await super().close()
+        self.db.close()
+
     async def on_command_error(self, ctx, error):
         """Global error handler"""
         if isinstance(error, commands.CommandNotFound):
@@ -0,0 +1,76 @@
+"""AsyncDatabase keeps blocking SQLite work off the event loop."""
+import asyncio
+import threading
+import time
+
+from utils.async_db import AsyncDatabase
+from utils.database import EventDatabase
+
+HOLD = 0.5  # seconds another thread keeps the writer locked
+TICK = 0.02
+
+
+def hold_writer(db: EventDatabase, locked: threading.Event):
+    with db.pool.writer():
+        locked.set()
+        time.sleep(HOLD)
+
+
+async def max_loop_lag(call) -> float:
+    """Run ``call()`` while a ticker measures the longest gap between its ticks."""
+    lag = 0.0
+    stop = False
+
+    async def ticker():
+        nonlocal lag
+        while not stop:
+            before = time.monotonic()
+            await asyncio.sleep(TICK)
+            lag = max(lag, time.monotonic() - before - TICK)
+
+    task = asyncio.ensure_future(ticker())
+    await asyncio.sleep(TICK * 2)
+    await call()
+    stop = True
+    await task
+    return lag
+
+
+def run_with_locked_writer(db: EventDatabase, call) -> float:
+    locked = threading.Event()
+    holder = threading.Thread(target=hold_writer, args=(db, locked))
+    holder.start()
+    locked.wait()
+    try:
+        return asyncio.run(max_loop_lag(call))
+    finally:
+        holder.join()
+
+
+def create_event(db):
+    return db.create_event(1, 10, 5, 'Lag check')
+
+
+def test_direct_call_blocks_the_loop(tmp_path):
+    db = EventDatabase(str(tmp_path / 'lag.db'))
+
+    async def direct():
+        create_event(db)
+
+    try:
+        assert run_with_locked_writer(db, direct) > HOLD / 2
+    finally:
+        db.close()
+
+
+def test_facade_keeps_the_loop_responsive(tmp_path):
+    adb = AsyncDatabase(EventDatabase(str(tmp_path / 'lag.db')))
+
+    async def through_facade():
+        event_id = await adb.create_event(1, 10, 5, 'Lag check')
+        assert event_id
+
+    try:
+        assert run_with_locked_writer(adb.sync, through_facade) < HOLD / 5
+    finally:
+        adb.close()
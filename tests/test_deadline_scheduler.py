@@ -0,0 +1,101 @@
+"""DeadlineScheduler fires each live deadline once, in order, and nothing else."""
+import asyncio
+import random
+import time
+
+from utils.deadline_scheduler import DeadlineScheduler
+
+VOTES = 10_000
+
+
+def build(now: float, spread: float):
+    """Schedule VOTES keys within ``spread`` seconds, then cancel and reschedule some."""
+    rng = random.Random(14)
+    scheduler = DeadlineScheduler()
+    expected = {}
+    for key in range(VOTES):
+        when = now + rng.uniform(0, spread)
+        scheduler.schedule(key, when)
+        expected[key] = when
+    for key in rng.sample(range(VOTES), VOTES // 10):
+        assert scheduler.cancel(key)
+        del expected[key]
+    for key in rng.sample(sorted(expected), VOTES // 10):
+        when = now + rng.uniform(0, spread)
+        scheduler.schedule(key, when)
+        expected[key] = when
+    return scheduler, expected
+
+
+def assert_in_deadline_order(fired, expected):
+    # Compare deadlines, not keys: near-equal timestamps can round to the same float
+    deadlines = [expected[key] for key in fired]
+    assert deadlines == sorted(deadlines)
+
+
+def test_pop_due_fires_each_deadline_once_in_order():
+    now = 1_000_000.0
+    scheduler, expected = build(now, 100.0)
+    assert len(scheduler) == len(expected)
+
+    fired = []
+    for step in range(0, 101, 5):
+        fired.extend(scheduler.pop_due(now + step))
+
+    assert len(fired) == len(set(fired)) == len(expected)
+    assert_in_deadline_order(fired, expected)
+    assert len(scheduler) == 0
+    assert scheduler.next_deadline() is None
+    assert scheduler.pop_due(now + 1000) == []
+
+
+def test_cancel_unknown_key():
+    scheduler = DeadlineScheduler()
+    assert not scheduler.cancel('missing')
+    scheduler.schedule('vote', 10.0)
+    assert 'vote' in scheduler
+    assert scheduler.cancel('vote')
+    assert 'vote' not in scheduler
+    assert scheduler.next_deadline() is None
+
+
+def test_run_fires_all_deadlines_in_order():
+    async def scenario():
+        scheduler, expected = build(time.time() + 0.05, 0.3)
+        fired = []
+
+        async def callback(key):
+            fired.append(key)
+
+        task = asyncio.ensure_future(scheduler.run(callback))
+        deadline = time.time() + 5
+        while len(fired) < len(expected) and time.time() < deadline:
+            await asyncio.sleep(0.05)
+        task.cancel()
+        return fired, expected
+
+    fired, expected = asyncio.run(scenario())
+    assert len(fired) == len(set(fired)) == len(expected)
+    assert_in_deadline_order(fired, expected)
+
+
+def test_earlier_deadline_wakes_run():
+    async def scenario():
+        scheduler = DeadlineScheduler()
+        fired = []
+
+        async def callback(key):
+            fired.append((key, time.time()))
+
+        scheduler.schedule('late', time.time() + 60)
+        task = asyncio.ensure_future(scheduler.run(callback))
+        await asyncio.sleep(0.05)
+        start = time.time()
+        scheduler.schedule('early', start + 0.05)
+        await asyncio.sleep(0.3)
+        task.cancel()
+        return fired, start
+
+    fired, start = asyncio.run(scenario())
+    assert [key for key, _ in fired] == ['early']
+    assert fired[0][1] - start < 0.25
@@ -0,0 +1,60 @@
+"""EditScheduler.close() sends queued edits before stopping."""
+import asyncio
+import time
+
+from utils.edit_scheduler import EditScheduler
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+
+
+class FakeMessage:
+    def __init__(self, message_id: int, channel_id: int = 1, stall: bool = False):
+        self.id = message_id
+        self.channel = FakeChannel(channel_id)
+        self.stall = stall
+        self.edits = []
+
+    async def edit(self, **fields):
+        if self.stall:
+            await asyncio.sleep(3600)
+        self.edits.append(fields)
+
+
+def test_close_sends_debounced_edits():
+    async def scenario():
+        scheduler = EditScheduler()
+        first, second = FakeMessage(10), FakeMessage(20, channel_id=2)
+        scheduler.defer(first, lambda: {"content": "first"}, 60.0)
+        scheduler.defer(second, lambda: {"content": "second"}, 60.0)
+
+        started = time.monotonic()
+        await scheduler.close(timeout=5.0)
+        return first, second, time.monotonic() - started, scheduler
+
+    first, second, elapsed, scheduler = asyncio.run(scenario())
+    assert first.edits == [{"content": "first"}]
+    assert second.edits == [{"content": "second"}]
+    assert elapsed < 1.0
+    assert scheduler.queue_depth() == 0
+
+
+def test_close_gives_up_after_timeout():
+    async def scenario():
+        scheduler = EditScheduler()
+        stuck, queued = FakeMessage(10, stall=True), FakeMessage(20)
+        scheduler.submit(stuck, content="stuck")
+        scheduler.submit(queued, content="queued")
+        await asyncio.sleep(0)
+
+        started = time.monotonic()
+        await scheduler.close(timeout=0.2)
+        await asyncio.sleep(0)
+        return queued, time.monotonic() - started, scheduler
+
+    queued, elapsed, scheduler = asyncio.run(scenario())
+    assert elapsed < 1.0
+    assert queued.edits == []
+    assert scheduler.stats()['busy_channels'] == 0
@@ -0,0 +1,55 @@
+"""The lookup queries are answered from the indexes the migrations create."""
+import pytest
+
+from utils.database import EventDatabase
+
+# (query, parameters, index its plan must use)
+INDEXED_QUERIES = [
+    ('SELECT id FROM events WHERE guild_id = ? ORDER BY created_at DESC LIMIT ?',
+     (1, 10), 'idx_events_guild_created'),
+    ('SELECT id FROM events WHERE guild_id = ? AND status = ? ORDER BY created_at DESC LIMIT ?',
+     (1, 'Open', 10), 'idx_events_guild_status_created'),
+    ("SELECT id FROM events WHERE status = 'Completed' AND updated_at < ? ORDER BY id LIMIT ?",
+     ('2020-01-01', 500), 'idx_events_status_updated'),
+    ('SELECT action FROM event_history WHERE event_id = ? ORDER BY timestamp DESC LIMIT ?',
+     (1, 20), 'idx_event_history_event_time'),
+    ('SELECT rq.id FROM reminder_queue rq JOIN events e ON rq.event_id = e.id '
+     'WHERE rq.sent = 0 AND rq.reminder_time <= ?',
+     ('2030-01-01',), 'idx_reminder_queue_sent_time'),
+    ('DELETE FROM reminder_queue WHERE event_id IN (1, 2)',
+     (), 'idx_reminder_queue_event'),
+    ('SELECT user_id, events_participated FROM user_stats WHERE guild_id = ? '
+     'ORDER BY events_participated DESC LIMIT ?',
+     (1, 10), 'idx_user_stats_participated'),
+    ('SELECT id FROM votes WHERE active = 1 AND end_time <= ?',
+     ('2030-01-01',), 'idx_votes_active_end'),
+    ('SELECT map_choice, COUNT(*) FROM user_votes WHERE vote_id = ? GROUP BY map_choice',
+     (1,), 'idx_user_votes_vote_choice'),
+    ('SELECT action FROM vote_history WHERE vote_id = ?',
+     (1,), 'idx_vote_history_vote'),
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = EventDatabase(str(tmp_path / 'plans.db'))
+    yield database
+    database.close()
+
+
+def query_plan(db: EventDatabase, sql: str, params) -> list:
+    with db.pool.reader() as conn:
+        return [row[3] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}', params)]
+
+
+@pytest.mark.parametrize('sql, params, index', INDEXED_QUERIES, ids=[q[2] for q in INDEXED_QUERIES])
+def test_query_uses_index(db, sql, params, index):
+    plan = query_plan(db, sql, params)
+    assert any(f'INDEX {index}' in step for step in plan), plan
+    assert not any(step.startswith('SCAN') and 'INDEX' not in step for step in plan), plan
+
+
+def test_every_migration_index_exists(db):
+    with db.pool.reader() as conn:
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {index for _, _, index in INDEXED_QUERIES} <= names
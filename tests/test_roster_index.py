@@ -0,0 +1,163 @@
+"""EventRoster.positions stays equal to a full scan of the roster under random signups."""
+import random
+
+import pytest
+
+import cogs.armor_events
+from cogs.armor_events import EventRoster
+from utils.models import Signup
+
+MEMBERS = 40
+STEPS = 400
+SEEDS = range(25)
+
+
+class FakeMember:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.mention = f"<@{user_id}>"
+
+
+class FakeGuild:
+    def __init__(self, members):
+        self.members = {member.id: member for member in members}
+
+    def get_member(self, user_id):
+        return self.members.get(user_id)
+
+
+def scan(roster: EventRoster):
+    """Brute-force positions; fails if anyone holds two places."""
+    positions = {}
+
+    def place(member, position):
+        assert positions.get(member.id, position) == position, f"{member.id} is registered twice"
+        positions[member.id] = position
+
+    for team, commander in (("A", roster.commander_a), ("B", roster.commander_b)):
+        if commander is not None:
+            place(commander, ("commander", team, None))
+    for member in roster.recruits.values():
+        place(member, ("recruit", None, None))
+    for team in ("A", "B"):
+        for slot_index, crew in enumerate(roster.crew_slots(team)):
+            if crew is not None:
+                for role in ("commander", "gunner", "driver"):
+                    place(crew[role], ("crew", team, slot_index))
+    return positions
+
+
+def assert_index_matches(roster: EventRoster, members):
+    scanned = scan(roster)
+    assert roster.positions == scanned
+    for member in members:
+        crew, team, slot_index = roster.get_user_crew(member)
+        position = roster.positions.get(member.id)
+        is_crew_commander = (
+            position is not None and position[0] == "crew"
+            and roster.crew_slots(position[1])[position[2]]["commander"] is member
+        )
+        assert (crew is not None) == is_crew_commander == roster.is_user_commander(member)
+        if crew is not None:
+            assert roster.crew_slots(team)[slot_index] is crew
+        assert roster.is_user_registered(member) == (member.id in scanned)
+
+
+def saved_signups(roster: EventRoster):
+    signups = []
+    for team, commander in (("A", roster.commander_a), ("B", roster.commander_b)):
+        if commander is not None:
+            signups.append(Signup(commander.id, "commander", team, "commander", None, None))
+    for member in roster.recruits.values():
+        signups.append(Signup(member.id, "solo", None, "solo", None, None))
+    for team in ("A", "B"):
+        for slot_index, crew in enumerate(roster.crew_slots(team)):
+            if crew is not None:
+                signups.extend(roster.crew_signups(crew, team, slot_index))
+    return signups
+
+
+def random_step(rng: random.Random, roster: EventRoster, members):
+    free = [member for member in members if not roster.is_user_registered(member)]
+    crews = [
+        (crew, team, slot_index)
+        for team in ("A", "B")
+        for slot_index, crew in enumerate(roster.crew_slots(team))
+        if crew is not None
+    ]
+    action = rng.choice(["commander", "recruit", "take_recruit", "crew", "seat", "remove", "remove"])
+
+    if action == "commander" and free:
+        roster.set_commander(rng.choice("AB"), rng.choice(free))
+    elif action == "recruit" and free:
+        roster.add_recruit(rng.choice(free))
+    elif action == "take_recruit" and roster.recruits:
+        roster.take_recruit(rng.choice(sorted(roster.recruits)))
+    elif action == "crew" and free:
+        commander = rng.choice(free)
+        others = [member for member in free if member is not commander]
+        gunner = rng.choice(others) if others and rng.random() < 0.7 else commander
+        others = [member for member in others if member is not gunner]
+        driver = rng.choice(others) if others and rng.random() < 0.7 else commander
+        crew = {"commander": commander, "gunner": gunner, "driver": driver, "crew_name": f"Crew {commander.id}"}
+        if rng.random() < 0.3:
+            crew["persistent_crew_id"] = commander.id
+        roster.place_crew(rng.choice("AB"), crew)
+    elif action == "seat" and crews:
+        crew, team, slot_index = rng.choice(crews)
+        candidates = free + [roster.recruits[user_id] for user_id in roster.recruits]
+        if candidates:
+            member = rng.choice(candidates)
+            roster.take_recruit(member.id)
+            roster.set_crew_seat(crew, team, slot_index, rng.choice(("gunner", "driver")), member)
+    elif action == "remove":
+        member = rng.choice(members)
+        expected = set(scan(roster))
+        removed = roster.remove_user(member)
+        assert removed == expected - set(scan(roster))
+        assert member.id not in roster.positions
+
+
+@pytest.fixture(params=[2, 6], ids=["2-slots", "6-slots"])
+def crews_per_team(request, monkeypatch):
+    # Two slots per team also exercises place_crew on a full team
+    monkeypatch.setattr(cogs.armor_events, "MAX_CREWS_PER_TEAM", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_positions_match_full_scan(seed, crews_per_team):
+    rng = random.Random(seed)
+    members = [FakeMember(1000 + i) for i in range(MEMBERS)]
+    roster = EventRoster("Test", "", event_id=1)
+    for _ in range(STEPS):
+        random_step(rng, roster, members)
+        assert_index_matches(roster, members)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_restored_roster_has_same_positions(seed, crews_per_team):
+    rng = random.Random(seed)
+    members = [FakeMember(1000 + i) for i in range(MEMBERS)]
+    roster = EventRoster("Test", "", event_id=1)
+    for _ in range(STEPS // 4):
+        random_step(rng, roster, members)
+
+    restored = EventRoster("Test", "", event_id=1)
+    restored.restore_roster(saved_signups(roster), FakeGuild(members))
+    assert restored.positions == roster.positions
+    assert_index_matches(restored, members)
+
+
+def test_place_crew_on_full_team(crews_per_team):
+    roster = EventRoster("Test", "", event_id=1)
+    members = iter(FakeMember(1000 + i) for i in range(crews_per_team + 1))
+    for slot_index in range(crews_per_team):
+        member = next(members)
+        crew = {"commander": member, "gunner": member, "driver": member, "crew_name": "Crew"}
+        assert roster.place_crew("A", crew) == slot_index
+
+    extra = next(members)
+    assert roster.place_crew("A", {"commander": extra, "gunner": extra, "driver": extra, "crew_name": "Full"}) is None
+    assert extra.id not in roster.positions
+    assert roster.positions == scan(roster)
@@ -0,0 +1,209 @@
+"""Signup clicks and their menus stay consistent when the roster is evicted from the cache."""
+import asyncio
+import gc
+
+import discord
+
+from cogs.armor_events import ArmorEvents, EditCrewButton, EditGunnerView, EventRoster, RecruitMeButton
+from utils.models import SignupPanel
+
+EVENT_ID = 1
+
+
+class FakeMember:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.mention = f"<@{user_id}>"
+
+
+class FakeGuild:
+    def __init__(self):
+        self.members = {}
+
+    def get_member(self, user_id):
+        return self.members.get(user_id)
+
+
+class FakeDatabase:
+    """Signup rows by user ID; the first save blocks until the test releases it."""
+
+    def __init__(self):
+        self.signups = {}
+        self.saves = []
+        self.save_started = asyncio.Event()
+        self.release_save = asyncio.Event()
+
+    async def flush(self):
+        pass
+
+    async def get_signup_panel(self, event_id):
+        return SignupPanel(
+            event_id, 1, 1, 1, "Test", "", None, "custom", tuple(self.signups.values())
+        )
+
+    async def save_signups_bulk(self, event_id, signups):
+        self.saves.append(('start', [signup.user_id for signup in signups]))
+        if len(self.saves) == 1:
+            self.save_started.set()
+            await self.release_save.wait()
+        for signup in signups:
+            self.signups[signup.user_id] = signup
+        self.saves.append(('end', [signup.user_id for signup in signups]))
+
+    async def remove_signups_bulk(self, event_id, user_ids):
+        for user_id in user_ids:
+            self.signups.pop(user_id, None)
+
+
+class FakeResponse:
+    def __init__(self):
+        self.messages = []
+        self.views = []
+
+    async def send_message(self, content=None, view=None, **kwargs):
+        self.messages.append(content)
+        self.views.append(view)
+
+
+class FakeChannel:
+    def get_partial_message(self, message_id):
+        return None
+
+
+class FakeBot:
+    def __init__(self, db):
+        self.db = db
+        self.cog = None
+
+    def get_cog(self, name):
+        return self.cog
+
+    def get_partial_messageable(self, channel_id, guild_id=None):
+        return FakeChannel()
+
+
+class FakeInteraction:
+    def __init__(self, bot, guild, user):
+        self.client = bot
+        self.guild = guild
+        self.user = user
+        self.response = FakeResponse()
+
+
+def make_cog():
+    db = FakeDatabase()
+    bot = FakeBot(db)
+    cog = ArmorEvents(bot)
+    bot.cog = cog
+
+    async def no_roles(*args, **kwargs):
+        pass
+    cog.assign_event_role = no_roles
+    return db, bot, cog
+
+
+def test_eviction_mid_change_keeps_changes_serialized():
+    async def scenario():
+        db, bot, cog = make_cog()
+        guild = FakeGuild()
+        first, second = FakeMember(101), FakeMember(102)
+        guild.members = {first.id: first, second.id: second}
+
+        button = RecruitMeButton(EVENT_ID)
+        first_click = asyncio.ensure_future(button.callback(FakeInteraction(bot, guild, first)))
+        await asyncio.wait_for(db.save_started.wait(), 5)
+        evicted = cog.rosters.get(EVENT_ID)
+
+        # The roster is dropped while the first click still holds its lock mid-save
+        cog.rosters.discard(EVENT_ID)
+        second_click = asyncio.ensure_future(button.callback(FakeInteraction(bot, guild, second)))
+        await asyncio.sleep(0.05)
+        assert db.saves == [('start', [first.id])]
+
+        db.release_save.set()
+        await asyncio.gather(first_click, second_click)
+
+        reloaded = cog.rosters.get(EVENT_ID)
+        return cog, db, evicted, reloaded, first, second
+
+    cog, db, evicted, reloaded, first, second = asyncio.run(scenario())
+
+    assert db.saves == [('start', [first.id]), ('end', [first.id]), ('start', [second.id]), ('end', [second.id])]
+    assert reloaded is not evicted
+    assert reloaded.lock is evicted.lock is cog.roster_lock(EVENT_ID)
+    # The reload waited for the first click's save, so it kept that recruit
+    assert set(reloaded.recruits) == {first.id, second.id}
+    assert set(db.signups) == {first.id, second.id}
+
+
+def test_open_menu_acts_on_the_reloaded_roster(monkeypatch):
+    # Item.parent is a read-only property in newer discord.py; the menus assign it
+    monkeypatch.setattr(discord.ui.Item, 'parent', property(
+        lambda item: item.__dict__.get('_menu_parent'),
+        lambda item, value: item.__dict__.__setitem__('_menu_parent', value),
+    ), raising=False)
+
+    async def scenario():
+        db, bot, cog = make_cog()
+        db.release_save.set()
+        guild = FakeGuild()
+        commander, recruit, gunner = FakeMember(101), FakeMember(102), FakeMember(103)
+        guild.members = {member.id: member for member in (commander, recruit, gunner)}
+        crew = {"commander": commander, "gunner": commander, "driver": commander, "crew_name": "Crew"}
+        for signup in EventRoster("Test", "", event_id=EVENT_ID).crew_signups(crew, "A", 0):
+            db.signups[signup.user_id] = signup
+
+        opened = FakeInteraction(bot, guild, commander)
+        await EditCrewButton(EVENT_ID).callback(opened)
+        menu = opened.response.views[-1]
+
+        # While the menu is open the roster is evicted, then reloaded by another click
+        cog.rosters.discard(EVENT_ID)
+        await RecruitMeButton(EVENT_ID).callback(FakeInteraction(bot, guild, recruit))
+        live = cog.rosters.get(EVENT_ID)
+
+        select = EditGunnerView(menu).children[0]
+        select._values = [recruit]
+        taken = FakeInteraction(bot, guild, commander)
+        await select.callback(taken)
+
+        select._values = [gunner]
+        await select.callback(FakeInteraction(bot, guild, commander))
+        return cog, db, live, taken.response.messages, commander, recruit, gunner
+
+    cog, db, live, replies, commander, recruit, gunner = asyncio.run(scenario())
+
+    # The menu saw the recruit that joined after it opened, and changed the live roster
+    assert replies == ["❌ User already registered!"]
+    assert cog.rosters.get(EVENT_ID) is live
+    assert live.crews_a[0]["gunner"] is gunner
+    assert live.positions[gunner.id] == ("crew", "A", 0)
+    assert live.positions[recruit.id] == ("recruit", None, None)
+    assert db.signups[gunner.id].role == "gunner"
+
+
+def test_lock_is_released_with_its_last_roster():
+    async def scenario():
+        db, bot, cog = make_cog()
+        db.release_save.set()
+        guild = FakeGuild()
+        member = FakeMember(101)
+        guild.members = {member.id: member}
+
+        await RecruitMeButton(EVENT_ID).callback(FakeInteraction(bot, guild, member))
+        lock = cog.roster_lock(EVENT_ID)
+        assert cog.rosters.get(EVENT_ID).lock is lock
+        assert cog.roster_lock(EVENT_ID) is lock
+
+        # Held across an eviction, the lock stays the event's lock
+        async with lock:
+            cog.rosters.discard(EVENT_ID)
+            gc.collect()
+            assert cog.roster_lock(EVENT_ID) is lock
+
+        del lock
+        gc.collect()
+        return cog
+
+    cog = asyncio.run(scenario())
+    assert EVENT_ID not in cog._roster_locks
@@ -0,0 +1,59 @@
+"""Awaitable facade that keeps SQLite work off the asyncio event loop."""
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from utils.db_pool import DEFAULT_READER_POOL_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabase:
+    """
+    Wrap a synchronous database object so every method call is awaitable.
+
+    ``await adb.get_guild_settings(guild_id)`` runs ``db.get_guild_settings``
+    on a dedicated thread pool, so a slow fsync or a lock wait blocks a
+    worker thread instead of the gateway heartbeat. Non-callable attributes
+    (``db_path``, ``pool``) are passed through unchanged, and ``sync`` exposes
+    the wrapped object for code that is already off the loop.
+    """
+
+    def __init__(self, db: Any, max_workers: int = None):
+        self.sync = db
+        # One thread per pooled reader plus one for the writer.
+        workers = max_workers or DEFAULT_READER_POOL_SIZE + 1
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db")
+        self._closed = False
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` on the database thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.sync, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+
+        # Cache the wrapper so later lookups skip __getattr__.
+        self.__dict__[name] = method
+        return method
+
+    def close(self):
+        """Drain pending work, then close the wrapped database. Safe to call twice."""
+        if self._closed:
+            return
+        self._closed = True
+
+        self._executor.shutdown(wait=True)
+        self.sync.close()
+
+
+__all__ = ["AsyncDatabase"]
@@ -59,6 +59,19 @@ EVENT_TYPES = {
 DATABASE_CLEANUP_DAYS = 90  # Days to keep completed events
 BACKUP_INTERVAL_HOURS = 24  # Hours between database backups
 
+# Write durability per row category: "sync" commits before the call returns,
+# "batched" goes through the write-behind queue (one transaction per batch)
+DB_WRITE_DURABILITY = {
+    "signups": "sync",
+    "audit": "batched",   # event_history, vote_history
+    "stats": "batched",   # user_stats counters
+    "votes": "batched",   # individual map vote ballots
+}
+DB_BATCH_INTERVAL_MS = 250  # Max time a batched write waits before commit
+DB_BATCH_MAX_OPS = 100  # Commit early once this many writes are queued
+DB_CLEANUP_CHUNK_SIZE = 200  # Events purged per write transaction by cleanup_old_data
+DB_CLEANUP_PAUSE_MS = 10  # Pause between cleanup chunks so live writes get the lock
+
 # Bot configuration
 BOT_PREFIX = "!"
 BOT_DESCRIPTION = "Tank Brawl Scheduler Bot"
@@ -117,6 +130,15 @@ MAX_EMBED_FIELD_VALUE = 1024
 MAX_EMBED_DESCRIPTION = 4096
 MAX_MESSAGE_LENGTH = 2000
 
+# Discord message edit pacing: (edits, per seconds)
+DISCORD_EDIT_CHANNEL_RATE = (5, 5.0)  # Discord's per-channel edit bucket
+DISCORD_EDIT_MESSAGE_RATE = (1, 1.0)  # Further edits of one message coalesce meanwhile
+SIGNUP_EDIT_DEBOUNCE = 0.75  # Seconds roster changes gather before the signup embed is re-rendered
+EDIT_SHUTDOWN_TIMEOUT = 5.0  # Seconds shutdown waits for queued edits before dropping them
+
+# Signup rosters kept in memory; older ones are reloaded from the database on their next click
+ROSTER_CACHE_SIZE = 200
+
 # Timeout values (in seconds)
 TIMEOUTS = {
     "modal": 300,
@@ -3,76 +3,80 @@ import sqlite3
 import datetime
 import json
 import logging
-from typing import Optional, Dict, List, Any, Tuple
-
-from utils.config import DEFAULT_TIMEZONE
+import os
+import time
+from types import MappingProxyType
+from typing import Optional, Callable, Dict, Iterable, List, Any, Tuple
+
+from utils.config import (
+    DEFAULT_TIMEZONE, DB_CLEANUP_CHUNK_SIZE, DB_CLEANUP_PAUSE_MS, DB_WRITE_DURABILITY, MAX_CREWS_PER_TEAM,
+)
+from utils.db_pool import ConnectionManager
+from utils.migrations import Migration, apply_migrations
+from utils.models import (
+    CREW_COLUMNS, EVENT_COLUMNS, SIGNUP_COLUMNS,
+    Crew, Event, GuildSettings, Signup, SignupPanel, row_factory,
+)
+from utils.settings_cache import GuildSettingsCache
+from utils.write_queue import WriteBehindQueue
 
 logger = logging.getLogger(__name__)
 
-class EventDatabase:
-    def __init__(self, db_path='tank_brawl.db'):
-        self.db_path = db_path
-        self.init_database()
+# Tables whose row counts are kept in table_counts by triggers
+COUNTED_TABLES = ('events', 'signups', 'user_stats', 'persistent_crews', 'guild_settings')
 
-    def init_database(self):
-        """Initialize all database tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Events table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                channel_id INTEGER NOT NULL,
-                message_id INTEGER,
-                creator_id INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                event_time TIMESTAMP,
-                event_type TEXT DEFAULT 'custom',
-                status TEXT DEFAULT 'Open',
-                max_crews_per_team INTEGER DEFAULT 6,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+# Standalone map vote database used before votes moved into the main database
+LEGACY_VOTE_DB_PATH = 'data/votes.db'
 
-        # Signups table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS signups (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                event_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                signup_type TEXT NOT NULL, -- 'commander', 'crew', 'solo', 'spectator'
-                team TEXT, -- 'A', 'B', or NULL
-                role TEXT, -- 'commander', 'gunner', 'driver', 'solo', 'spectator'
-                crew_name TEXT,
-                crew_slot INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (event_id) REFERENCES events (id),
-                UNIQUE(event_id, user_id)
-            )
-        ''')
 
-        # Event history/audit log
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS event_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                event_id INTEGER NOT NULL,
-                action TEXT NOT NULL,
-                user_id INTEGER,
-                details TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (event_id) REFERENCES events (id)
-            )
-        ''')
+def import_legacy_votes(conn: sqlite3.Connection, legacy_path: str):
+    """Copy every row of the old standalone votes database into ``conn``, keeping IDs."""
+    if not os.path.exists(legacy_path):
+        return
 
-        # User statistics
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_stats (
-                user_id INTEGER PRIMARY KEY,
+    # Read through a separate connection: ATTACH is not allowed inside the
+    # migration's savepoint.
+    legacy = sqlite3.connect(legacy_path)
+    try:
+        legacy_tables = {
+            row[0] for row in legacy.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        for table in ('votes', 'user_votes', 'vote_history'):
+            if table not in legacy_tables:
+                continue
+            columns = [row[1] for row in conn.execute(f'PRAGMA table_info({table})')]
+            legacy_columns = {row[1] for row in legacy.execute(f'PRAGMA table_info({table})')}
+            shared = [column for column in columns if column in legacy_columns]
+            rows = legacy.execute(f"SELECT {', '.join(shared)} FROM {table}").fetchall()
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {table} ({', '.join(shared)}) VALUES ({', '.join('?' * len(shared))})",
+                rows
+            )
+            logger.info(f"Imported {len(rows)} {table} rows from {legacy_path}")
+    finally:
+        legacy.close()
+
+
+# Schema changes applied on startup, in version order. Never edit a migration
+# that has shipped; append a new one instead.
+# signups(event_id, user_id) and persistent_crews(guild_id, crew_name) are
+# already covered by their UNIQUE constraints' automatic indexes; the latter
+# also serves get_user_crews' guild_id filter.
+MIGRATIONS = [
+    Migration(1, "Indexes for event, signup, history and reminder lookups", [
+        'CREATE INDEX IF NOT EXISTS idx_events_guild_created ON events (guild_id, created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_events_guild_status_created ON events (guild_id, status, created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_events_status_updated ON events (status, updated_at)',
+        'CREATE INDEX IF NOT EXISTS idx_event_history_event_time ON event_history (event_id, timestamp)',
+        'CREATE INDEX IF NOT EXISTS idx_reminder_queue_sent_time ON reminder_queue (sent, reminder_time)',
+        'CREATE INDEX IF NOT EXISTS idx_reminder_queue_event ON reminder_queue (event_id)',
+    ]),
+    # user_stats used to be keyed on user_id alone, so a member of two guilds
+    # shared one row. Rebuild it keyed per guild, keeping every existing row.
+    Migration(2, "Key user_stats on (user_id, guild_id) with leaderboard indexes", [
+        '''
+            CREATE TABLE user_stats_new (
+                user_id INTEGER NOT NULL,
                 guild_id INTEGER NOT NULL,
                 events_participated INTEGER DEFAULT 0,
                 events_commanded INTEGER DEFAULT 0,
@@ -83,60 +87,266 @@ class EventDatabase:
                 last_event TIMESTAMP,
                 elo_rating INTEGER DEFAULT 1200,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (user_id, guild_id)
             )
-        ''')
-
-        # Persistent crews
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS persistent_crews (
+        ''',
+        '''
+            INSERT INTO user_stats_new
+            SELECT user_id, guild_id, events_participated, events_commanded, events_created,
+                   total_wins, total_losses, preferred_role, last_event, elo_rating,
+                   created_at, updated_at
+            FROM user_stats
+        ''',
+        'DROP TABLE user_stats',
+        'ALTER TABLE user_stats_new RENAME TO user_stats',
+        # (guild_id, stat DESC, user_id) lets get_leaderboard read its top N
+        # straight off the index without touching the table or sorting.
+        'CREATE INDEX idx_user_stats_participated ON user_stats (guild_id, events_participated DESC, user_id)',
+        'CREATE INDEX idx_user_stats_commanded ON user_stats (guild_id, events_commanded DESC, user_id)',
+        'CREATE INDEX idx_user_stats_created ON user_stats (guild_id, events_created DESC, user_id)',
+        'CREATE INDEX idx_user_stats_elo ON user_stats (guild_id, elo_rating DESC, user_id)',
+    ]),
+    # get_database_stats reads these instead of running COUNT(*) scans.
+    # A migration that rebuilds one of these tables must recreate its triggers.
+    Migration(3, "Trigger-maintained row counts for database stats", [
+        '''
+            CREATE TABLE table_counts (
+                table_name TEXT PRIMARY KEY,
+                row_count INTEGER NOT NULL DEFAULT 0
+            )
+        ''',
+        *[
+            step
+            for table in COUNTED_TABLES
+            for step in (
+                f"INSERT INTO table_counts (table_name, row_count) SELECT '{table}', COUNT(*) FROM {table}",
+                f'''
+                    CREATE TRIGGER count_{table}_insert AFTER INSERT ON {table}
+                    BEGIN
+                        UPDATE table_counts SET row_count = row_count + 1 WHERE table_name = '{table}';
+                    END
+                ''',
+                f'''
+                    CREATE TRIGGER count_{table}_delete AFTER DELETE ON {table}
+                    BEGIN
+                        UPDATE table_counts SET row_count = row_count - 1 WHERE table_name = '{table}';
+                    END
+                ''',
+            )
+        ],
+    ]),
+    # Map votes used to live in their own data/votes.db. Move them into this
+    # database so vote rows can be joined to their events directly.
+    Migration(4, "Map vote tables, imported from the legacy votes database, with vote_details view", [
+        '''
+            CREATE TABLE IF NOT EXISTS votes (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
+                message_id INTEGER UNIQUE NOT NULL,
+                channel_id INTEGER NOT NULL,
                 guild_id INTEGER NOT NULL,
-                crew_name TEXT NOT NULL,
-                commander_id INTEGER NOT NULL,
-                gunner_id INTEGER,
-                driver_id INTEGER,
-                description TEXT,
-                wins INTEGER DEFAULT 0,
-                losses INTEGER DEFAULT 0,
+                creator_id INTEGER,
+                start_time TIMESTAMP NOT NULL,
+                end_time TIMESTAMP NOT NULL,
+                duration_minutes INTEGER NOT NULL,
                 active BOOLEAN DEFAULT 1,
+                event_id INTEGER,
+                auto_created BOOLEAN DEFAULT 0,
+                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(guild_id, crew_name)
+                embed_title TEXT,
+                embed_description TEXT,
+                view_restored BOOLEAN DEFAULT 0
             )
-        ''')
-
-        # Guild settings
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS guild_settings (
-                guild_id INTEGER PRIMARY KEY,
-                admin_roles TEXT, -- JSON array of role names
-                event_channels TEXT, -- JSON array of allowed channel IDs
-                reminder_times TEXT, -- JSON array of reminder minutes
-                default_event_duration INTEGER DEFAULT 120,
-                auto_role_assignment BOOLEAN DEFAULT 1,
-                recruitment_enabled BOOLEAN DEFAULT 1,
-                settings_data TEXT, -- JSON for additional settings
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ''',
+        '''
+            CREATE TABLE IF NOT EXISTS user_votes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                vote_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                map_choice TEXT NOT NULL,
+                voted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (vote_id) REFERENCES votes (id),
+                UNIQUE(vote_id, user_id)
             )
-        ''')
-
-        # Reminders queue
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS reminder_queue (
+        ''',
+        '''
+            CREATE TABLE IF NOT EXISTS vote_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                event_id INTEGER NOT NULL,
-                reminder_time TIMESTAMP NOT NULL,
-                reminder_type TEXT NOT NULL, -- 'before_event', 'custom'
-                sent BOOLEAN DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (event_id) REFERENCES events (id)
+                vote_id INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                user_id INTEGER,
+                details TEXT,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (vote_id) REFERENCES votes (id)
             )
-        ''')
+        ''',
+        # votes(message_id) and user_votes(vote_id, user_id) are UNIQUE and already indexed.
+        'CREATE INDEX IF NOT EXISTS idx_votes_active_end ON votes (active, end_time)',
+        'CREATE INDEX IF NOT EXISTS idx_user_votes_vote_choice ON user_votes (vote_id, map_choice)',
+        'CREATE INDEX IF NOT EXISTS idx_vote_history_vote ON vote_history (vote_id)',
+        lambda conn: import_legacy_votes(conn, LEGACY_VOTE_DB_PATH),
+        '''
+            CREATE VIEW vote_details AS
+            SELECT v.*, e.title AS event_title, e.event_time AS event_time
+            FROM votes v
+            LEFT JOIN events e ON e.id = v.event_id
+        ''',
+    ]),
+    # Lets a restored signup panel keep crews that joined as a persistent crew linked to it.
+    Migration(5, "Link signups to the persistent crew they joined with", [
+        'ALTER TABLE signups ADD COLUMN persistent_crew_id INTEGER',
+    ]),
+]
+
+class EventDatabase:
+    def __init__(self, db_path='tank_brawl.db', pool: Optional[ConnectionManager] = None):
+        self.db_path = db_path
+        self.pool = pool or ConnectionManager(db_path)
+        self.writes = WriteBehindQueue(self.pool)
+        self.settings_cache = GuildSettingsCache()
+        self.init_database()
+
+    def flush(self):
+        """Commit any batched writes that are still queued"""
+        self.writes.flush()
+
+    def close(self):
+        """Flush batched writes and release the pooled connections"""
+        self.writes.close()
+        self.pool.close()
+
+    def init_database(self):
+        """Initialize all database tables"""
+        with self.pool.writer() as conn:
+            # Incremental auto-vacuum lets cleanup_old_data give freed pages back.
+            # It only applies to an empty file or after a one-off VACUUM.
+            if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+                conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+                conn.execute('VACUUM')
+                logger.info("Enabled incremental auto-vacuum")
+
+            cursor = conn.cursor()
+
+            # Events table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    guild_id INTEGER NOT NULL,
+                    channel_id INTEGER NOT NULL,
+                    message_id INTEGER,
+                    creator_id INTEGER NOT NULL,
+                    title TEXT NOT NULL,
+                    description TEXT,
+                    event_time TIMESTAMP,
+                    event_type TEXT DEFAULT 'custom',
+                    status TEXT DEFAULT 'Open',
+                    max_crews_per_team INTEGER DEFAULT 6,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Signups table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS signups (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event_id INTEGER NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    signup_type TEXT NOT NULL, -- 'commander', 'crew', 'solo', 'spectator'
+                    team TEXT, -- 'A', 'B', or NULL
+                    role TEXT, -- 'commander', 'gunner', 'driver', 'solo', 'spectator'
+                    crew_name TEXT,
+                    crew_slot INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (event_id) REFERENCES events (id),
+                    UNIQUE(event_id, user_id)
+                )
+            ''')
+
+            # Event history/audit log
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS event_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event_id INTEGER NOT NULL,
+                    action TEXT NOT NULL,
+                    user_id INTEGER,
+                    details TEXT,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (event_id) REFERENCES events (id)
+                )
+            ''')
+
+            # User statistics
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS user_stats (
+                    user_id INTEGER NOT NULL,
+                    guild_id INTEGER NOT NULL,
+                    events_participated INTEGER DEFAULT 0,
+                    events_commanded INTEGER DEFAULT 0,
+                    events_created INTEGER DEFAULT 0,
+                    total_wins INTEGER DEFAULT 0,
+                    total_losses INTEGER DEFAULT 0,
+                    preferred_role TEXT,
+                    last_event TIMESTAMP,
+                    elo_rating INTEGER DEFAULT 1200,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (user_id, guild_id)
+                )
+            ''')
+
+            # Persistent crews
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS persistent_crews (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    guild_id INTEGER NOT NULL,
+                    crew_name TEXT NOT NULL,
+                    commander_id INTEGER NOT NULL,
+                    gunner_id INTEGER,
+                    driver_id INTEGER,
+                    description TEXT,
+                    wins INTEGER DEFAULT 0,
+                    losses INTEGER DEFAULT 0,
+                    active BOOLEAN DEFAULT 1,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(guild_id, crew_name)
+                )
+            ''')
+
+            # Guild settings
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS guild_settings (
+                    guild_id INTEGER PRIMARY KEY,
+                    admin_roles TEXT, -- JSON array of role names
+                    event_channels TEXT, -- JSON array of allowed channel IDs
+                    reminder_times TEXT, -- JSON array of reminder minutes
+                    default_event_duration INTEGER DEFAULT 120,
+                    auto_role_assignment BOOLEAN DEFAULT 1,
+                    recruitment_enabled BOOLEAN DEFAULT 1,
+                    settings_data TEXT, -- JSON for additional settings
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Reminders queue
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS reminder_queue (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event_id INTEGER NOT NULL,
+                    reminder_time TIMESTAMP NOT NULL,
+                    reminder_type TEXT NOT NULL, -- 'before_event', 'custom'
+                    sent BOOLEAN DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (event_id) REFERENCES events (id)
+                )
+            ''')
+
+            apply_migrations(conn, MIGRATIONS)
 
-        conn.commit()
-        conn.close()
         logger.info("Database initialized successfully")
 
     # Event management methods
@@ -144,188 +354,192 @@ class EventDatabase:
                     title: str, description: str = None, event_time: datetime.datetime = None,
                     event_type: str = "custom") -> int:
         """Create a new event and return its ID"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO events (guild_id, channel_id, creator_id, title, description, event_time, event_type)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (guild_id, channel_id, creator_id, title, description, event_time, event_type))
-        
-        event_id = cursor.lastrowid
-        
-        # Update user stats
-       # self.update_user_stat(creator_id, guild_id, 'events_created', 1)
-        
-        conn.commit()
-        conn.close()
-        
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO events (guild_id, channel_id, creator_id, title, description, event_time, event_type)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (guild_id, channel_id, creator_id, title, description, event_time, event_type))
+
+            event_id = cursor.lastrowid
+
+            # Update user stats
+           # self.update_user_stat(creator_id, guild_id, 'events_created', 1)
+
         logger.info(f"Created event {event_id}: {title}")
         return event_id
 
-    def get_event_by_id(self, event_id: int) -> Optional[Tuple]:
+    def get_event_by_id(self, event_id: int) -> Optional[Event]:
         """Get event data by ID"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT title, status, created_at, event_time, event_type
-            FROM events WHERE id = ?
-        ''', (event_id,))
-        
-        result = cursor.fetchone()
-        conn.close()
-        return result
-
-    def get_guild_events(self, guild_id: int, status: str = None, limit: int = 10) -> List[Tuple]:
+        with self.pool.reader() as conn:
+            cursor = conn.execute(f'SELECT {EVENT_COLUMNS} FROM events WHERE id = ?', (event_id,))
+            cursor.row_factory = row_factory(Event)
+            return cursor.fetchone()
+
+    def get_guild_events(self, guild_id: int, status: str = None, limit: int = 10) -> List[Event]:
         """Get events for a guild, optionally filtered by status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if status:
-            cursor.execute('''
-                SELECT id, title, status, created_at, event_time, event_type
-                FROM events 
-                WHERE guild_id = ? AND status = ?
-                ORDER BY created_at DESC 
-                LIMIT ?
-            ''', (guild_id, status, limit))
-        else:
-            cursor.execute('''
-                SELECT id, title, status, created_at, event_time, event_type
-                FROM events 
-                WHERE guild_id = ?
-                ORDER BY created_at DESC 
-                LIMIT ?
-            ''', (guild_id, limit))
-        
-        results = cursor.fetchall()
-        conn.close()
-        return results
+        with self.pool.reader() as conn:
+            if status:
+                cursor = conn.execute(f'''
+                    SELECT {EVENT_COLUMNS}
+                    FROM events 
+                    WHERE guild_id = ? AND status = ?
+                    ORDER BY created_at DESC 
+                    LIMIT ?
+                ''', (guild_id, status, limit))
+            else:
+                cursor = conn.execute(f'''
+                    SELECT {EVENT_COLUMNS}
+                    FROM events 
+                    WHERE guild_id = ?
+                    ORDER BY created_at DESC 
+                    LIMIT ?
+                ''', (guild_id, limit))
+            cursor.row_factory = row_factory(Event)
+            return cursor.fetchall()
 
     def update_event_message(self, event_id: int, message_id: int):
         """Update the message ID for an event"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE events SET message_id = ?, updated_at = CURRENT_TIMESTAMP 
-            WHERE id = ?
-        ''', (message_id, event_id))
-        conn.commit()
-        conn.close()
+        with self.pool.writer() as conn:
+            conn.execute('''
+                UPDATE events SET message_id = ?, updated_at = CURRENT_TIMESTAMP 
+                WHERE id = ?
+            ''', (message_id, event_id))
 
     def update_event_status(self, event_id: int, status: str):
         """Update event status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE events SET status = ?, updated_at = CURRENT_TIMESTAMP 
-            WHERE id = ?
-        ''', (status, event_id))
-        conn.commit()
-        conn.close()
+        with self.pool.writer() as conn:
+            conn.execute('''
+                UPDATE events SET status = ?, updated_at = CURRENT_TIMESTAMP 
+                WHERE id = ?
+            ''', (status, event_id))
 
     # Signup management methods
     def save_signup(self, event_id: int, user_id: int, signup_type: str, 
                    team: str = None, role: str = None, crew_name: str = None, crew_slot: int = None):
-        """Save or update a user's signup"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Remove existing signup for this user in this event
-        cursor.execute('DELETE FROM signups WHERE event_id = ? AND user_id = ?', (event_id, user_id))
-        
-        # Add new signup
-        cursor.execute('''
-            INSERT INTO signups (event_id, user_id, signup_type, team, role, crew_name, crew_slot)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (event_id, user_id, signup_type, team, role, crew_name, crew_slot))
-        
-        # Update user participation stats
-        guild_id = self.get_event_guild_id(event_id)
-        if guild_id:
-            self.update_user_stat(user_id, guild_id, 'events_participated', 1)
-            if role == 'commander':
-                self.update_user_stat(user_id, guild_id, 'events_commanded', 1)
-        
-        conn.commit()
-        conn.close()
-
-    def get_event_signups(self, event_id: int) -> List[Dict]:
-        """Get all signups for an event"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT user_id, signup_type, team, role, crew_name, crew_slot
-            FROM signups WHERE event_id = ?
-        ''', (event_id,))
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        return [
-            {
-                'user_id': row[0],
-                'signup_type': row[1],
-                'team': row[2],
-                'role': row[3],
-                'crew_name': row[4],
-                'crew_slot': row[5]
+        """Save or update a user's signup and bump their participation stats in one transaction"""
+        self.save_signups_bulk(event_id, [Signup(user_id, signup_type, team, role, crew_name, crew_slot)])
+
+    def save_signups_bulk(self, event_id: int, signups: Iterable[Signup]):
+        """Upsert several signups for one event and bump each user's stats in one transaction"""
+        # One row per user, last entry wins - the same result the upsert would give
+        by_user = {signup.user_id: signup for signup in signups}
+        if not by_user:
+            return
+
+        def write(conn):
+            # Roster edits re-save users who are already signed up; only new signups count in stats
+            existing = {
+                user_id for (user_id,) in
+                conn.execute('SELECT user_id FROM signups WHERE event_id = ?', (event_id,))
             }
-            for row in results
-        ]
+
+            conn.executemany('''
+                INSERT INTO signups (event_id, user_id, signup_type, team, role, crew_name, crew_slot,
+                                     persistent_crew_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(event_id, user_id) DO UPDATE SET
+                    signup_type = excluded.signup_type,
+                    team = excluded.team,
+                    role = excluded.role,
+                    crew_name = excluded.crew_name,
+                    crew_slot = excluded.crew_slot,
+                    persistent_crew_id = excluded.persistent_crew_id,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', [(event_id, *signup) for signup in by_user.values()])
+
+            # Resolve the guild once inside the transaction; unknown events bump nothing
+            row = conn.execute('SELECT guild_id FROM events WHERE id = ?', (event_id,)).fetchone()
+            new_signups = [signup for user_id, signup in by_user.items() if user_id not in existing]
+            if not row or not new_signups:
+                return
+
+            conn.executemany('''
+                INSERT INTO user_stats (user_id, guild_id, events_participated, events_commanded)
+                VALUES (?, ?, 1, ?)
+                ON CONFLICT(user_id, guild_id) DO UPDATE SET
+                    events_participated = events_participated + 1,
+                    events_commanded = events_commanded + excluded.events_commanded,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', [
+                (signup.user_id, row[0], 1 if signup.role == 'commander' else 0)
+                for signup in new_signups
+            ])
+
+        self.writes.run(write, DB_WRITE_DURABILITY['signups'])
+
+    def get_event_signups(self, event_id: int) -> List[Signup]:
+        """Get all signups for an event"""
+        with self.pool.reader() as conn:
+            cursor = conn.execute(f'SELECT {SIGNUP_COLUMNS} FROM signups WHERE event_id = ?', (event_id,))
+            cursor.row_factory = row_factory(Signup)
+            return cursor.fetchall()
+
+    def get_signup_panel(self, event_id: int) -> Optional[SignupPanel]:
+        """An open event and its saved roster in one query, or None if it is not open"""
+        with self.pool.reader() as conn:
+            rows = conn.execute('''
+                SELECT e.id, e.guild_id, e.channel_id, e.message_id, e.title, e.description, e.event_time,
+                       e.event_type, s.user_id, s.signup_type, s.team, s.role, s.crew_name, s.crew_slot,
+                       s.persistent_crew_id
+                FROM events e
+                LEFT JOIN signups s ON s.event_id = e.id
+                WHERE e.id = ? AND e.status = 'Open'
+            ''', (event_id,)).fetchall()
+
+        if not rows:
+            return None
+        signups = tuple(Signup._make(row[8:]) for row in rows if row[8] is not None)
+        return SignupPanel(*rows[0][:8], signups)
 
     def remove_signup(self, event_id: int, user_id: int):
         """Remove a user's signup"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM signups WHERE event_id = ? AND user_id = ?', (event_id, user_id))
-        conn.commit()
-        conn.close()
+        self.remove_signups_bulk(event_id, [user_id])
+
+    def remove_signups_bulk(self, event_id: int, user_ids: Iterable[int]):
+        """Remove several users' signups for one event in one transaction"""
+        params = [(event_id, user_id) for user_id in set(user_ids)]
+        if not params:
+            return
+
+        def write(conn):
+            conn.executemany('DELETE FROM signups WHERE event_id = ? AND user_id = ?', params)
+
+        self.writes.run(write, DB_WRITE_DURABILITY['signups'])
 
     # Event history/logging methods
     def log_event_action(self, event_id: int, action: str, user_id: int = None, details: str = None):
         """Log an action for audit trail"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO event_history (event_id, action, user_id, details)
-            VALUES (?, ?, ?, ?)
-        ''', (event_id, action, user_id, details))
-        conn.commit()
-        conn.close()
+        def write(conn):
+            conn.execute('''
+                INSERT INTO event_history (event_id, action, user_id, details)
+                VALUES (?, ?, ?, ?)
+            ''', (event_id, action, user_id, details))
+
+        self.writes.run(write, DB_WRITE_DURABILITY['audit'])
 
     def get_event_history(self, event_id: int, limit: int = 20) -> List[Tuple]:
         """Get recent history for an event"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT action, user_id, details, timestamp 
-            FROM event_history 
-            WHERE event_id = ? 
-            ORDER BY timestamp DESC 
-            LIMIT ?
-        ''', (event_id, limit))
-        results = cursor.fetchall()
-        conn.close()
-        return results
+        with self.pool.reader() as conn:
+            return conn.execute('''
+                SELECT action, user_id, details, timestamp 
+                FROM event_history 
+                WHERE event_id = ? 
+                ORDER BY timestamp DESC 
+                LIMIT ?
+            ''', (event_id, limit)).fetchall()
 
     # User statistics methods
     def get_user_stats(self, user_id: int, guild_id: int) -> Optional[Dict]:
         """Get user statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT events_participated, events_commanded, events_created, 
-                   total_wins, total_losses, preferred_role, elo_rating
-            FROM user_stats 
-            WHERE user_id = ? AND guild_id = ?
-        ''', (user_id, guild_id))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
+        with self.pool.reader() as conn:
+            result = conn.execute('''
+                SELECT events_participated, events_commanded, events_created, 
+                       total_wins, total_losses, preferred_role, elo_rating
+                FROM user_stats 
+                WHERE user_id = ? AND guild_id = ?
+            ''', (user_id, guild_id)).fetchone()
+
         if result:
             return {
                 'events_participated': result[0],
@@ -340,125 +554,155 @@ class EventDatabase:
 
     def update_user_stat(self, user_id: int, guild_id: int, stat_name: str, value: int):
         """Update a user statistic"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Insert or update user stats
-        cursor.execute('''
-            INSERT INTO user_stats (user_id, guild_id, {}) 
-            VALUES (?, ?, ?)
-            ON CONFLICT(user_id) DO UPDATE SET 
-                {} = {} + ?,
-                updated_at = CURRENT_TIMESTAMP
-        '''.format(stat_name, stat_name, stat_name), (user_id, guild_id, value, value))
-        
-        conn.commit()
-        conn.close()
+        def write(conn):
+            # Insert or update user stats
+            conn.execute('''
+                INSERT INTO user_stats (user_id, guild_id, {}) 
+                VALUES (?, ?, ?)
+                ON CONFLICT(user_id, guild_id) DO UPDATE SET 
+                    {} = {} + ?,
+                    updated_at = CURRENT_TIMESTAMP
+            '''.format(stat_name, stat_name, stat_name), (user_id, guild_id, value, value))
+
+        self.writes.run(write, DB_WRITE_DURABILITY['stats'])
 
     def get_leaderboard(self, guild_id: int, stat_type: str = 'events_participated', limit: int = 10) -> List[Tuple]:
         """Get leaderboard for a specific statistic"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         valid_stats = ['events_participated', 'events_commanded', 'events_created', 'elo_rating']
         if stat_type not in valid_stats:
             stat_type = 'events_participated'
-        
-        cursor.execute(f'''
-            SELECT user_id, {stat_type}
-            FROM user_stats 
-            WHERE guild_id = ? AND {stat_type} > 0
-            ORDER BY {stat_type} DESC 
-            LIMIT ?
-        ''', (guild_id, limit))
-        
-        results = cursor.fetchall()
-        conn.close()
-        return results
+
+        with self.pool.reader() as conn:
+            return conn.execute(f'''
+                SELECT user_id, {stat_type}
+                FROM user_stats 
+                WHERE guild_id = ? AND {stat_type} > 0
+                ORDER BY {stat_type} DESC 
+                LIMIT ?
+            ''', (guild_id, limit)).fetchall()
 
     # Persistent crew methods
     def create_persistent_crew(self, guild_id: int, crew_name: str, commander_id: int, 
                              gunner_id: int = None, driver_id: int = None, description: str = None) -> int:
         """Create a persistent crew"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute('''
-                INSERT INTO persistent_crews (guild_id, crew_name, commander_id, gunner_id, driver_id, description)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (guild_id, crew_name, commander_id, gunner_id, driver_id, description))
-            
-            crew_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Created persistent crew {crew_id}: {crew_name}")
-            return crew_id
-            
+            with self.pool.writer() as conn:
+                cursor = conn.execute('''
+                    INSERT INTO persistent_crews (guild_id, crew_name, commander_id, gunner_id, driver_id, description)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (guild_id, crew_name, commander_id, gunner_id, driver_id, description))
+                crew_id = cursor.lastrowid
         except sqlite3.IntegrityError:
-            conn.close()
             raise ValueError(f"Crew name '{crew_name}' already exists in this guild")
 
-    def get_user_crews(self, user_id: int, guild_id: int) -> List[Dict]:
+        logger.info(f"Created persistent crew {crew_id}: {crew_name}")
+        return crew_id
+
+    def get_user_crews(self, user_id: int, guild_id: int) -> List[Crew]:
         """Get all crews a user is part of"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, crew_name, commander_id, gunner_id, driver_id, wins, losses, description
-            FROM persistent_crews 
-            WHERE guild_id = ? AND active = 1 AND 
-                  (commander_id = ? OR gunner_id = ? OR driver_id = ?)
-        ''', (guild_id, user_id, user_id, user_id))
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        return [
-            {
-                'id': row[0],
-                'crew_name': row[1],
-                'commander_id': row[2],
-                'gunner_id': row[3],
-                'driver_id': row[4],
-                'wins': row[5],
-                'losses': row[6],
-                'description': row[7]
-            }
-            for row in results
-        ]
+        with self.pool.reader() as conn:
+            cursor = conn.execute(f'''
+                SELECT {CREW_COLUMNS}
+                FROM persistent_crews 
+                WHERE guild_id = ? AND active = 1 AND 
+                      (commander_id = ? OR gunner_id = ? OR driver_id = ?)
+            ''', (guild_id, user_id, user_id, user_id))
+            cursor.row_factory = row_factory(Crew)
+            return cursor.fetchall()
 
     def update_crew_record(self, crew_id: int, won: bool):
         """Update a crew's win/loss record"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if won:
-            cursor.execute('''
-                UPDATE persistent_crews 
-                SET wins = wins + 1, updated_at = CURRENT_TIMESTAMP 
+        with self.pool.writer() as conn:
+            if won:
+                conn.execute('''
+                    UPDATE persistent_crews 
+                    SET wins = wins + 1, updated_at = CURRENT_TIMESTAMP 
+                    WHERE id = ?
+                ''', (crew_id,))
+            else:
+                conn.execute('''
+                    UPDATE persistent_crews 
+                    SET losses = losses + 1, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                ''', (crew_id,))
+
+    def get_crew_by_name(self, guild_id: int, crew_name: str) -> Optional[Crew]:
+        """Get an active crew by name"""
+        with self.pool.reader() as conn:
+            cursor = conn.execute(f'''
+                SELECT {CREW_COLUMNS}
+                FROM persistent_crews
+                WHERE guild_id = ? AND crew_name = ? AND active = 1
+            ''', (guild_id, crew_name))
+            cursor.row_factory = row_factory(Crew)
+            return cursor.fetchone()
+
+    def get_guild_crews(self, guild_id: int, limit: int = 10, offset: int = 0) -> List[Crew]:
+        """Get a page of active crews in a guild, ordered by name"""
+        with self.pool.reader() as conn:
+            cursor = conn.execute(f'''
+                SELECT {CREW_COLUMNS}
+                FROM persistent_crews
+                WHERE guild_id = ? AND active = 1
+                ORDER BY crew_name
+                LIMIT ? OFFSET ?
+            ''', (guild_id, limit, offset))
+            cursor.row_factory = row_factory(Crew)
+            return cursor.fetchall()
+
+    def set_crew_member(self, crew_id: int, position: str, user_id: Optional[int]):
+        """Fill (or clear with None) the gunner or driver position of a crew"""
+        if position not in ('gunner', 'driver'):
+            raise ValueError(f"Unknown crew position '{position}'")
+
+        with self.pool.writer() as conn:
+            conn.execute(f'''
+                UPDATE persistent_crews
+                SET {position}_id = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
-            ''', (crew_id,))
-        else:
-            cursor.execute('''
-                UPDATE persistent_crews 
-                SET losses = losses + 1, updated_at = CURRENT_TIMESTAMP 
+            ''', (user_id, crew_id))
+
+    def rename_crew(self, crew_id: int, crew_name: str):
+        """Rename a crew"""
+        try:
+            with self.pool.writer() as conn:
+                conn.execute('''
+                    UPDATE persistent_crews
+                    SET crew_name = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                ''', (crew_name, crew_id))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"A crew named '{crew_name}' already exists.")
+
+    def update_crew_description(self, crew_id: int, description: Optional[str]):
+        """Update a crew's description"""
+        with self.pool.writer() as conn:
+            conn.execute('''
+                UPDATE persistent_crews
+                SET description = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (description, crew_id))
+
+    def disband_crew(self, crew_id: int):
+        """Mark a crew as inactive"""
+        with self.pool.writer() as conn:
+            conn.execute('''
+                UPDATE persistent_crews
+                SET active = 0, updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
             ''', (crew_id,))
-        
-        conn.commit()
-        conn.close()
 
     # Guild settings methods
-    def get_guild_settings(self, guild_id: int) -> Dict:
+    def get_guild_settings(self, guild_id: int) -> GuildSettings:
         """Get guild settings, create default if not exists"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM guild_settings WHERE guild_id = ?', (guild_id,))
-        result = cursor.fetchone()
-        
+        cached = self.settings_cache.get(guild_id)
+        if cached is not None:
+            return cached
+
+        generation = self.settings_cache.generation()
+        with self.pool.reader() as conn:
+            result = conn.execute('SELECT * FROM guild_settings WHERE guild_id = ?', (guild_id,)).fetchone()
+
         if not result:
             # Create default settings
             default_settings = {
@@ -470,146 +714,175 @@ class EventDatabase:
                 'recruitment_enabled': 1,
                 'settings_data': json.dumps({'timezone': DEFAULT_TIMEZONE})
             }
-            
-            cursor.execute('''
-                INSERT INTO guild_settings (guild_id, admin_roles, event_channels, reminder_times,
-                                          default_event_duration, auto_role_assignment, recruitment_enabled, settings_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (guild_id, *default_settings.values()))
-            
-            conn.commit()
-            result = (guild_id, *default_settings.values(), None, None)
-        
-        conn.close()
-        
+
+            with self.pool.writer() as conn:
+                conn.execute('''
+                    INSERT OR IGNORE INTO guild_settings (guild_id, admin_roles, event_channels, reminder_times,
+                                              default_event_duration, auto_role_assignment, recruitment_enabled, settings_data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (guild_id, *default_settings.values()))
+                result = conn.execute('SELECT * FROM guild_settings WHERE guild_id = ?', (guild_id,)).fetchone()
+
         settings_data = json.loads(result[7]) if result[7] else {}
         if 'timezone' not in settings_data:
             settings_data['timezone'] = DEFAULT_TIMEZONE
 
-        return {
-            'admin_roles': json.loads(result[1]),
-            'event_channels': json.loads(result[2]),
-            'reminder_times': json.loads(result[3]),
-            'default_event_duration': result[4],
-            'auto_role_assignment': bool(result[5]),
-            'recruitment_enabled': bool(result[6]),
-            'settings_data': settings_data,
-            'timezone': settings_data['timezone']
-        }
+        settings = GuildSettings(
+            admin_roles=tuple(json.loads(result[1])),
+            event_channels=tuple(json.loads(result[2])),
+            reminder_times=tuple(json.loads(result[3])),
+            default_event_duration=result[4],
+            auto_role_assignment=bool(result[5]),
+            recruitment_enabled=bool(result[6]),
+            settings_data=MappingProxyType(settings_data),
+            timezone=settings_data['timezone'],
+            auto_map_votes=settings_data.get('auto_map_votes', True),
+            max_crews_per_team=settings_data.get('max_crews_per_team', MAX_CREWS_PER_TEAM)
+        )
+        self.settings_cache.put(guild_id, settings, generation)
+        return settings
 
     def update_guild_setting(self, guild_id: int, setting_name: str, value: Any):
         """Update a specific guild setting"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         # Ensure guild settings exist
         self.get_guild_settings(guild_id)
-        
+
         if setting_name in ['admin_roles', 'event_channels', 'reminder_times', 'settings_data']:
             value = json.dumps(value)
-        
-        cursor.execute(f'''
-            UPDATE guild_settings 
-            SET {setting_name} = ?, updated_at = CURRENT_TIMESTAMP 
-            WHERE guild_id = ?
-        ''', (value, guild_id))
-        
-        conn.commit()
-        conn.close()
+
+        with self.pool.writer() as conn:
+            conn.execute(f'''
+                UPDATE guild_settings 
+                SET {setting_name} = ?, updated_at = CURRENT_TIMESTAMP 
+                WHERE guild_id = ?
+            ''', (value, guild_id))
+        self.settings_cache.invalidate(guild_id)
+
+    def invalidate_guild_settings(self, guild_id: int = None):
+        """Drop cached settings for a guild (or all guilds) after an out-of-band change"""
+        self.settings_cache.invalidate(guild_id)
 
     # Reminder system methods
     def add_reminder(self, event_id: int, reminder_time: datetime.datetime, reminder_type: str = 'before_event'):
         """Add a reminder to the queue"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO reminder_queue (event_id, reminder_time, reminder_type)
-            VALUES (?, ?, ?)
-        ''', (event_id, reminder_time, reminder_type))
-        
-        conn.commit()
-        conn.close()
+        with self.pool.writer() as conn:
+            conn.execute('''
+                INSERT INTO reminder_queue (event_id, reminder_time, reminder_type)
+                VALUES (?, ?, ?)
+            ''', (event_id, reminder_time, reminder_type))
 
     def get_pending_reminders(self) -> List[Tuple]:
         """Get all pending reminders that should be sent"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         now = datetime.datetime.now()
-        cursor.execute('''
-            SELECT rq.id, rq.event_id, rq.reminder_time, rq.reminder_type,
-                   e.guild_id, e.channel_id, e.message_id, e.title
-            FROM reminder_queue rq
-            JOIN events e ON rq.event_id = e.id
-            WHERE rq.sent = 0 AND rq.reminder_time <= ?
-        ''', (now,))
-        
-        results = cursor.fetchall()
-        conn.close()
-        return results
+        with self.pool.reader() as conn:
+            return conn.execute('''
+                SELECT rq.id, rq.event_id, rq.reminder_time, rq.reminder_type,
+                       e.guild_id, e.channel_id, e.message_id, e.title
+                FROM reminder_queue rq
+                JOIN events e ON rq.event_id = e.id
+                WHERE rq.sent = 0 AND rq.reminder_time <= ?
+            ''', (now,)).fetchall()
 
     def mark_reminder_sent(self, reminder_id: int):
         """Mark a reminder as sent"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('UPDATE reminder_queue SET sent = 1 WHERE id = ?', (reminder_id,))
-        conn.commit()
-        conn.close()
+        with self.pool.writer() as conn:
+            conn.execute('UPDATE reminder_queue SET sent = 1 WHERE id = ?', (reminder_id,))
 
     # Utility methods
     def get_event_guild_id(self, event_id: int) -> Optional[int]:
         """Get guild ID for an event"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT guild_id FROM events WHERE id = ?', (event_id,))
-        result = cursor.fetchone()
-        conn.close()
+        with self.pool.reader() as conn:
+            result = conn.execute('SELECT guild_id FROM events WHERE id = ?', (event_id,)).fetchone()
         return result[0] if result else None
 
-    def cleanup_old_data(self, days_old: int = 90):
-        """Clean up old completed events and related data"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+    def cleanup_old_data(self, days_old: int = 90, chunk_size: int = DB_CLEANUP_CHUNK_SIZE,
+                         progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, int]:
+        """Purge completed events older than days_old in small transactions, then reclaim free pages"""
         cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days_old)
-        
-        # Get old event IDs
-        cursor.execute('''
-            SELECT id FROM events 
+        old_events = '''
+            SELECT id FROM events
             WHERE status = 'Completed' AND updated_at < ?
-        ''', (cutoff_date,))
-        old_event_ids = [row[0] for row in cursor.fetchall()]
-        
-        if old_event_ids:
-            # Clean up related data
-            for event_id in old_event_ids:
-                cursor.execute('DELETE FROM signups WHERE event_id = ?', (event_id,))
-                cursor.execute('DELETE FROM event_history WHERE event_id = ?', (event_id,))
-                cursor.execute('DELETE FROM reminder_queue WHERE event_id = ?', (event_id,))
-            
-            # Clean up old events
-            cursor.execute('''
-                DELETE FROM events 
-                WHERE status = 'Completed' AND updated_at < ?
-            ''', (cutoff_date,))
-            
-            logger.info(f"Cleaned up {len(old_event_ids)} old events")
-        
-        conn.commit()
-        conn.close()
+            ORDER BY id LIMIT ?
+        '''
+        counts = {'events': 0, 'signups': 0, 'event_history': 0, 'reminder_queue': 0}
+
+        with self.pool.reader() as conn:
+            total = conn.execute(
+                "SELECT COUNT(*) FROM events WHERE status = 'Completed' AND updated_at < ?", (cutoff_date,)
+            ).fetchone()[0]
+
+        while True:
+            # Each chunk is its own transaction so signups can interleave with the purge
+            with self.pool.writer() as conn:
+                params = (cutoff_date, chunk_size)
+                for table in ('signups', 'event_history', 'reminder_queue'):
+                    counts[table] += conn.execute(
+                        f'DELETE FROM {table} WHERE event_id IN ({old_events})', params
+                    ).rowcount
+                deleted = conn.execute(f'DELETE FROM events WHERE id IN ({old_events})', params).rowcount
+            counts['events'] += deleted
+
+            if progress and deleted:
+                progress(counts['events'], total)
+            if deleted < chunk_size:
+                break
+            time.sleep(DB_CLEANUP_PAUSE_MS / 1000)
+
+        counts['bytes_reclaimed'] = self.reclaim_free_pages()
+        logger.info(f"Cleaned up {counts['events']} old events, reclaimed {counts['bytes_reclaimed']} bytes")
+        return counts
+
+    def reclaim_free_pages(self, pages_per_step: int = 1000) -> int:
+        """Hand free pages back to the filesystem via incremental vacuum; returns bytes reclaimed"""
+        with self.pool.reader() as conn:
+            page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+
+        reclaimed = 0
+        while True:
+            with self.pool.writer() as conn:
+                before = conn.execute('PRAGMA page_count').fetchone()[0]
+                # execute() steps the pragma once (one page); executescript runs it to completion
+                conn.executescript(f'PRAGMA incremental_vacuum({int(pages_per_step)})')
+                freed = before - conn.execute('PRAGMA page_count').fetchone()[0]
+            reclaimed += freed
+            if freed < pages_per_step:
+                break
+            time.sleep(DB_CLEANUP_PAUSE_MS / 1000)
+
+        return reclaimed * page_size
 
     def get_database_stats(self) -> Dict[str, int]:
-        """Get database statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        stats = {}
-        
-        tables = ['events', 'signups', 'user_stats', 'persistent_crews', 'guild_settings']
-        for table in tables:
-            cursor.execute(f'SELECT COUNT(*) FROM {table}')
-            stats[table] = cursor.fetchone()[0]
-        
-        conn.close()
+        """Get row counts from the trigger-maintained table_counts table"""
+        with self.pool.reader() as conn:
+            counts = dict(conn.execute('SELECT table_name, row_count FROM table_counts').fetchall())
+        return {table: counts.get(table, 0) for table in COUNTED_TABLES}
+
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Get file size, page usage and per-table / per-index sizes"""
+        with self.pool.reader() as conn:
+            page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+            page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+            freelist_count = conn.execute('PRAGMA freelist_count').fetchone()[0]
+
+            kinds = dict(conn.execute("SELECT name, type FROM sqlite_master WHERE type IN ('table', 'index')"))
+            try:
+                objects = conn.execute('''
+                    SELECT name, pageno, pgsize FROM dbstat WHERE aggregate = TRUE ORDER BY pgsize DESC
+                ''').fetchall()
+            except sqlite3.OperationalError:
+                # SQLite built without SQLITE_ENABLE_DBSTAT_VTAB
+                objects = []
+
+        stats = {
+            'page_size': page_size,
+            'page_count': page_count,
+            'freelist_count': freelist_count,
+            'file_size': os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0,
+            'wal_size': os.path.getsize(self.db_path + '-wal') if os.path.exists(self.db_path + '-wal') else 0,
+            'tables': {},
+            'indexes': {},
+        }
+        for name, pages, size in objects:
+            group = 'indexes' if kinds.get(name) == 'index' else 'tables'
+            stats[group][name] = {'pages': pages, 'bytes': size}
         return stats
@@ -0,0 +1,114 @@
+"""Shared, long-lived SQLite connections for the scheduler databases."""
+import logging
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+# A handful of readers is plenty for a single bot process; writes are
+# serialized through one connection anyway.
+DEFAULT_READER_POOL_SIZE = 4
+
+# Per-connection prepared statement cache (sqlite3 defaults to 128).
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+# Seconds to wait on a locked database before raising.
+DEFAULT_BUSY_TIMEOUT = 30.0
+
+
+class ConnectionManager:
+    """
+    Owns one writer connection plus a small pool of reader connections.
+
+    Connections are opened once and reused for the life of the bot, so a
+    query no longer pays for opening the file, reading the schema and
+    setting up locks. The database runs in WAL mode, which lets the reader
+    pool keep serving SELECTs while the writer holds a transaction.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        readers: int = DEFAULT_READER_POOL_SIZE,
+        cached_statements: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ):
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+
+        self._writer = self._connect()
+        self._writer_lock = threading.RLock()
+        self._writer_depth = 0
+
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all_readers = []
+        for _ in range(max(1, readers)):
+            conn = self._connect()
+            self._all_readers.append(conn)
+            self._readers.put(conn)
+
+        self._closed = False
+        logger.info(f"Opened connection pool for {db_path} (1 writer, {len(self._all_readers)} readers)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=DEFAULT_BUSY_TIMEOUT,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yield the writer connection inside a transaction.
+
+        Nested use from the same thread joins the outer transaction; only the
+        outermost block commits (or rolls back on error).
+        """
+        with self._writer_lock:
+            self._writer_depth += 1
+            try:
+                yield self._writer
+            except BaseException:
+                if self._writer_depth == 1:
+                    self._writer.rollback()
+                raise
+            else:
+                if self._writer_depth == 1:
+                    self._writer.commit()
+            finally:
+                self._writer_depth -= 1
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a reader connection from the pool for the duration of the block."""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def close(self):
+        """Close every pooled connection. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+
+        with self._writer_lock:
+            self._writer.close()
+        for conn in self._all_readers:
+            conn.close()
+        logger.info(f"Closed connection pool for {self.db_path}")
+
+
+__all__ = [
+    "ConnectionManager",
+    "DEFAULT_READER_POOL_SIZE",
+    "DEFAULT_STATEMENT_CACHE_SIZE",
+]
@@ -0,0 +1,84 @@
+"""Min-heap of keyed deadlines that fires a coroutine callback as each one passes."""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """
+    Sleep until the earliest deadline instead of polling every entry on a timer.
+
+    ``schedule`` and ``cancel`` are O(log n) / O(1): cancelled or rescheduled
+    entries stay in the heap and are skipped when they surface. ``run`` wakes
+    early whenever a new deadline becomes the earliest one. Deadlines are
+    Unix timestamps (``time.time()`` seconds).
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._deadlines: Dict[Hashable, float] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def schedule(self, key: Hashable, when: float):
+        """Fire ``key`` at ``when``, replacing any deadline it already had."""
+        self._deadlines[key] = when
+        heapq.heappush(self._heap, (when, next(self._counter), key))
+        if self._heap[0][2] == key:
+            self._wakeup.set()
+
+    def cancel(self, key: Hashable) -> bool:
+        """Forget ``key``'s deadline. Returns False if it had none."""
+        return self._deadlines.pop(key, None) is not None
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest pending deadline, or None when nothing is scheduled."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> List[Hashable]:
+        """Remove and return every key whose deadline is at or before ``now``."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, key = heapq.heappop(self._heap)
+            if self._deadlines.get(key) == when:
+                del self._deadlines[key]
+                due.append(key)
+        return due
+
+    def _discard_stale(self):
+        while self._heap and self._deadlines.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    async def run(self, callback: Callable[[Hashable], Awaitable[None]]):
+        """Await ``callback(key)`` for each deadline as it passes. Runs until cancelled."""
+        while True:
+            self._wakeup.clear()
+            deadline = self.next_deadline()
+            timeout = None if deadline is None else max(0.0, deadline - time.time())
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+                continue  # an earlier deadline arrived; recompute the sleep
+            except asyncio.TimeoutError:
+                pass
+
+            for key in self.pop_due(time.time()):
+                try:
+                    await callback(key)
+                except Exception as e:
+                    logger.error(f"Deadline callback for {key} failed: {e}")
+
+
+__all__ = ["DeadlineScheduler"]
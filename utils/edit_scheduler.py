@@ -0,0 +1,257 @@
+"""Central, rate-limited queue for Discord message edits."""
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import discord
+
+from utils.config import DISCORD_EDIT_CHANNEL_RATE, DISCORD_EDIT_MESSAGE_RATE, EDIT_SHUTDOWN_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    ``rate`` tokens per ``per`` seconds, where each spent token returns
+    ``per`` seconds after it was taken. Unlike a continuously refilling
+    bucket this never allows more than ``rate`` takes in any ``per``-second
+    window, which is how Discord counts.
+    """
+
+    __slots__ = ('rate', 'per', 'spent')
+
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self.spent: Deque[float] = deque()
+
+    def _refill(self, now: float):
+        while self.spent and self.spent[0] + self.per <= now:
+            self.spent.popleft()
+
+    def delay(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        self._refill(now)
+        return 0.0 if len(self.spent) < self.rate else self.spent[0] + self.per - now
+
+    def take(self, now: float):
+        self._refill(now)
+        self.spent.append(now)
+
+    def is_full(self, now: float) -> bool:
+        self._refill(now)
+        return not self.spent
+
+
+class _PendingEdit:
+    __slots__ = ('message', 'fields', 'render', 'ready_at', 'waiters')
+
+    def __init__(self, message, fields: Dict[str, Any], render: Optional[Callable[[], Dict[str, Any]]],
+                 ready_at: float):
+        self.message = message
+        self.fields = fields
+        self.render = render
+        self.ready_at = ready_at
+        self.waiters: List[asyncio.Future] = []
+
+
+class EditScheduler:
+    """
+    Pace message edits with a token bucket per channel and per message.
+
+    Each channel with pending edits gets its own worker task, so one busy
+    channel never delays another. A newer edit of a message that is still
+    queued replaces the older one (last writer wins): only the latest embed
+    is sent, and anyone awaiting the older edit is resolved by the newer
+    one. ``submit`` is fire-and-forget (failures are logged); ``edit``
+    waits and re-raises ``NotFound``/``Forbidden`` to the caller.
+    ``defer`` holds an edit back for a debounce window and renders its
+    fields only when it is sent, so a burst of changes costs one render
+    and one edit carrying the latest state.
+    """
+
+    def __init__(
+        self,
+        channel_rate: Tuple[int, float] = DISCORD_EDIT_CHANNEL_RATE,
+        message_rate: Tuple[int, float] = DISCORD_EDIT_MESSAGE_RATE,
+    ):
+        self._channel_rate = channel_rate
+        self._message_rate = message_rate
+        self._pending: Dict[int, 'OrderedDict[int, _PendingEdit]'] = {}
+        self._channel_buckets: Dict[int, TokenBucket] = {}
+        self._message_buckets: Dict[int, TokenBucket] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+        self._wakeups: Dict[int, asyncio.Event] = {}
+
+        self.performed = 0
+        self.coalesced = 0
+        self.failed = 0
+        self._latencies: Deque[float] = deque(maxlen=500)
+
+    def submit(self, message, **fields):
+        """Queue ``message.edit(**fields)`` without waiting for it."""
+        self._enqueue(message, fields)
+
+    def defer(self, message, render: Callable[[], Dict[str, Any]], delay: float):
+        """
+        Queue an edit of ``message`` with the fields ``render()`` returns at send
+        time, sent no sooner than ``delay`` seconds from now. Further calls
+        before then join the pending edit without extending the window.
+        """
+        self._enqueue(message, None, render, delay)
+
+    async def edit(self, message, **fields):
+        """Queue ``message.edit(**fields)`` and wait until it (or a newer edit) is sent."""
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(message, fields).waiters.append(future)
+        return await future
+
+    def _enqueue(self, message, fields: Optional[Dict[str, Any]],
+                 render: Optional[Callable[[], Dict[str, Any]]] = None, delay: float = 0.0) -> _PendingEdit:
+        channel_id = message.channel.id
+        pending = self._pending.setdefault(channel_id, OrderedDict())
+        ready_at = time.monotonic() + delay
+
+        entry = pending.get(message.id)
+        if entry is not None:
+            # Keep the original queue position, send the newest content as soon as either edit is due
+            entry.message = message
+            entry.fields = fields
+            entry.render = render
+            entry.ready_at = min(entry.ready_at, ready_at)
+            self.coalesced += 1
+        else:
+            entry = pending[message.id] = _PendingEdit(message, fields, render, ready_at)
+
+        if channel_id in self._workers:
+            self._wakeups[channel_id].set()  # the worker may be sleeping past this edit's due time
+        else:
+            self._wakeups[channel_id] = asyncio.Event()
+            self._workers[channel_id] = asyncio.create_task(self._drain(channel_id))
+        return entry
+
+    def _next_ready(self, channel_id: int, now: float) -> Tuple[Optional[int], float]:
+        """Pending message that can be edited soonest, and how long until then."""
+        channel_delay = self._channel_bucket(channel_id).delay(now)
+        best_id, best_delay = None, float('inf')
+        for message_id, entry in self._pending[channel_id].items():
+            bucket = self._message_buckets.get(message_id)
+            delay = max(channel_delay, bucket.delay(now) if bucket else 0.0, entry.ready_at - now)
+            if delay < best_delay:
+                best_id, best_delay = message_id, delay
+                if delay == channel_delay:
+                    break  # queue order wins among edits that are ready together
+        return best_id, best_delay
+
+    async def _drain(self, channel_id: int):
+        pending = self._pending[channel_id]
+        wakeup = self._wakeups[channel_id]
+        try:
+            while pending:
+                wakeup.clear()
+                message_id, delay = self._next_ready(channel_id, time.monotonic())
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue  # newer edits may have arrived while sleeping
+
+                entry = pending.pop(message_id)
+                now = time.monotonic()
+                self._channel_bucket(channel_id).take(now)
+                self._message_bucket(message_id).take(now)
+                await self._send(entry)
+        finally:
+            del self._workers[channel_id]
+            del self._wakeups[channel_id]
+            if not pending:
+                del self._pending[channel_id]
+            self._prune_buckets()
+
+    async def _send(self, entry: _PendingEdit):
+        try:
+            fields = entry.render() if entry.render is not None else entry.fields
+            result = await entry.message.edit(**fields)
+        except Exception as e:
+            self.failed += 1
+            if entry.waiters:
+                for waiter in entry.waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+            elif isinstance(e, discord.NotFound):
+                logger.warning(f"Queued edit of message {entry.message.id} failed: message not found")
+            else:
+                logger.error(f"Queued edit of message {entry.message.id} failed: {e}")
+            return
+
+        self.performed += 1
+        self._latencies.append(time.monotonic() - entry.ready_at)
+        for waiter in entry.waiters:
+            if not waiter.done():
+                waiter.set_result(result)
+
+    def _channel_bucket(self, channel_id: int) -> TokenBucket:
+        bucket = self._channel_buckets.get(channel_id)
+        if bucket is None:
+            bucket = self._channel_buckets[channel_id] = TokenBucket(*self._channel_rate)
+        return bucket
+
+    def _message_bucket(self, message_id: int) -> TokenBucket:
+        bucket = self._message_buckets.get(message_id)
+        if bucket is None:
+            bucket = self._message_buckets[message_id] = TokenBucket(*self._message_rate)
+        return bucket
+
+    def _prune_buckets(self):
+        """Forget buckets that have fully refilled; a new one behaves the same."""
+        now = time.monotonic()
+        for buckets in (self._channel_buckets, self._message_buckets):
+            for key in [key for key, bucket in buckets.items() if bucket.is_full(now)]:
+                del buckets[key]
+
+    def queue_depth(self) -> int:
+        """Edits waiting to be sent, across all channels."""
+        return sum(len(pending) for pending in self._pending.values())
+
+    def stats(self) -> Dict[str, float]:
+        """Queue depth, edit counters and due-to-sent latency (rate-limit wait) in milliseconds."""
+        latencies = sorted(self._latencies)
+        return {
+            'queue_depth': self.queue_depth(),
+            'busy_channels': len(self._workers),
+            'performed': self.performed,
+            'coalesced': self.coalesced,
+            'failed': self.failed,
+            'latency_avg_ms': sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+            'latency_p95_ms': latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+            'latency_max_ms': latencies[-1] * 1000 if latencies else 0.0,
+        }
+
+    async def close(self, timeout: float = EDIT_SHUTDOWN_TIMEOUT):
+        """
+        Send every queued edit, debounced ones without waiting out their delay,
+        then stop. Edits still queued after ``timeout`` seconds are dropped.
+        """
+        now = time.monotonic()
+        for channel_id, pending in self._pending.items():
+            for entry in pending.values():
+                entry.ready_at = min(entry.ready_at, now)
+            wakeup = self._wakeups.get(channel_id)
+            if wakeup is not None:
+                wakeup.set()
+
+        workers = list(self._workers.values())
+        if workers:
+            await asyncio.wait(workers, timeout=timeout)
+
+        dropped = self.queue_depth()
+        if dropped:
+            logger.warning(f"Dropped {dropped} queued message edits at shutdown")
+        for task in list(self._workers.values()):
+            task.cancel()
+
+
+__all__ = ["EditScheduler", "TokenBucket"]
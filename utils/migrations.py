@@ -0,0 +1,71 @@
+"""Numbered schema migrations tracked in a ``schema_version`` table."""
+import logging
+import sqlite3
+from typing import Callable, NamedTuple, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# A step is either a single SQL statement or a callable for data migrations.
+MigrationStep = Union[str, Callable[[sqlite3.Connection], None]]
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    steps: Sequence[MigrationStep]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the highest applied migration version (0 for a fresh database)."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    row = conn.execute('SELECT MAX(version) FROM schema_version').fetchone()
+    return row[0] or 0
+
+
+def apply_migrations(conn: sqlite3.Connection, migrations: Sequence[Migration]) -> int:
+    """
+    Apply every migration newer than the recorded schema version, in order.
+
+    Each migration runs inside its own savepoint together with its
+    ``schema_version`` row, so DDL that sqlite3 would otherwise autocommit
+    is rolled back as a unit if any step fails. Returns the number of
+    migrations applied.
+    """
+    current = get_schema_version(conn)
+    applied = 0
+
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version <= current:
+            continue
+
+        conn.execute('SAVEPOINT migration')
+        try:
+            for step in migration.steps:
+                if callable(step):
+                    step(conn)
+                else:
+                    conn.execute(step)
+
+            conn.execute(
+                'INSERT INTO schema_version (version, description) VALUES (?, ?)',
+                (migration.version, migration.description)
+            )
+        except BaseException:
+            conn.execute('ROLLBACK TO migration')
+            conn.execute('RELEASE migration')
+            raise
+        conn.execute('RELEASE migration')
+
+        logger.info(f"Applied migration {migration.version}: {migration.description}")
+        applied += 1
+
+    return applied
+
+
+__all__ = ["Migration", "MigrationStep", "apply_migrations", "get_schema_version"]
@@ -0,0 +1,86 @@
+"""Compact, immutable row types returned by the database layer."""
+from typing import Any, Callable, Mapping, NamedTuple, Optional, Tuple, Type, TypeVar
+
+RowT = TypeVar('RowT', bound=tuple)
+
+
+class Signup(NamedTuple):
+    user_id: int
+    signup_type: str
+    team: Optional[str]
+    role: Optional[str]
+    crew_name: Optional[str]
+    crew_slot: Optional[int]
+    persistent_crew_id: Optional[int] = None
+
+
+class Crew(NamedTuple):
+    id: int
+    crew_name: str
+    commander_id: int
+    gunner_id: Optional[int]
+    driver_id: Optional[int]
+    wins: int
+    losses: int
+    description: Optional[str]
+
+
+class Event(NamedTuple):
+    id: int
+    title: str
+    status: str
+    created_at: str
+    event_time: Optional[str]
+    event_type: str
+
+
+class SignupPanel(NamedTuple):
+    """An open event's signup message together with its saved roster."""
+    event_id: int
+    guild_id: int
+    channel_id: int
+    message_id: int
+    title: str
+    description: Optional[str]
+    event_time: Optional[str]
+    event_type: str
+    signups: Tuple[Signup, ...]
+
+
+class GuildSettings(NamedTuple):
+    """Decoded guild settings; lists are tuples and settings_data is read-only."""
+    admin_roles: Tuple[str, ...]
+    event_channels: Tuple[int, ...]
+    reminder_times: Tuple[int, ...]
+    default_event_duration: int
+    auto_role_assignment: bool
+    recruitment_enabled: bool
+    settings_data: Mapping[str, Any]
+    timezone: str
+    auto_map_votes: bool
+    max_crews_per_team: int
+
+
+# Column lists matching the field order above, for SELECTs that feed a row factory.
+SIGNUP_COLUMNS = 'user_id, signup_type, team, role, crew_name, crew_slot, persistent_crew_id'
+CREW_COLUMNS = 'id, crew_name, commander_id, gunner_id, driver_id, wins, losses, description'
+EVENT_COLUMNS = 'id, title, status, created_at, event_time, event_type'
+
+
+def row_factory(row_type: Type[RowT]) -> Callable[[Any, tuple], RowT]:
+    """sqlite3 row factory that builds ``row_type`` straight from each result tuple."""
+    make = row_type._make
+    return lambda cursor, row: make(row)
+
+
+__all__ = [
+    "Signup",
+    "Crew",
+    "Event",
+    "SignupPanel",
+    "GuildSettings",
+    "SIGNUP_COLUMNS",
+    "CREW_COLUMNS",
+    "EVENT_COLUMNS",
+    "row_factory",
+]
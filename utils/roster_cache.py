@@ -0,0 +1,61 @@
+"""Bounded, least-recently-used cache of event signup rosters."""
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from utils.config import ROSTER_CACHE_SIZE
+
+
+class RosterCache:
+    """
+    Keep the rosters of recently used signup panels in memory.
+
+    Every roster change is written to the database, so an evicted roster is
+    simply loaded again on its next click. The cache is only touched from the
+    event loop and needs no lock.
+    """
+
+    def __init__(self, max_entries: int = ROSTER_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[int, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, event_id: int) -> Optional[Any]:
+        """Return the cached roster and mark it recently used, or None on a miss."""
+        roster = self._entries.get(event_id)
+        if roster is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(event_id)
+        return roster
+
+    def put(self, event_id: int, roster: Any):
+        """Cache ``roster``, evicting the least recently used one when full."""
+        self._entries[event_id] = roster
+        self._entries.move_to_end(event_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def setdefault(self, event_id: int, roster: Any) -> Any:
+        """Cache ``roster`` unless one was cached meanwhile; return the cached one."""
+        cached = self._entries.get(event_id)
+        if cached is not None:
+            self._entries.move_to_end(event_id)
+            return cached
+        self.put(event_id, roster)
+        return roster
+
+    def discard(self, event_id: int):
+        """Forget one event's roster."""
+        self._entries.pop(event_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current entry count."""
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+
+__all__ = ["RosterCache"]
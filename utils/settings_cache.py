@@ -0,0 +1,62 @@
+"""Per-guild cache for parsed guild settings."""
+import threading
+from typing import Dict, Optional
+
+from utils.models import GuildSettings
+
+
+class GuildSettingsCache:
+    """
+    Keep decoded guild settings in memory so permission checks skip SQLite.
+
+    Entries live until ``invalidate`` is called after a write. Readers take a
+    ``generation()`` token before hitting the database and pass it to ``put``;
+    if anything was invalidated in between, the (possibly stale) row is not
+    cached. Settings writes are rare, so one counter for all guilds is enough.
+    ``GuildSettings`` is immutable, so every caller can share one instance.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[int, GuildSettings] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, guild_id: int) -> Optional[GuildSettings]:
+        """Return the cached settings, or None on a miss."""
+        with self._lock:
+            settings = self._entries.get(guild_id)
+            if settings is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return settings
+
+    def generation(self) -> int:
+        """Token to pass to ``put`` for the read that is about to happen."""
+        with self._lock:
+            return self._generation
+
+    def put(self, guild_id: int, settings: GuildSettings, generation: int):
+        """Cache ``settings`` unless anything was invalidated since ``generation``."""
+        with self._lock:
+            if self._generation == generation:
+                self._entries[guild_id] = settings
+
+    def invalidate(self, guild_id: Optional[int] = None):
+        """Drop one guild's entry, or every entry when ``guild_id`` is None."""
+        with self._lock:
+            self._generation += 1
+            if guild_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(guild_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current entry count."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+
+__all__ = ["GuildSettingsCache"]
@@ -0,0 +1,44 @@
+"""In-memory ballot tracking for a single map vote."""
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class VoteTally:
+    """
+    Each user's current choice plus a running count per choice.
+
+    ``cast`` is O(1): a re-vote moves one count from the old choice to the
+    new one, so rendering results never needs to re-aggregate ballots.
+    """
+
+    __slots__ = ('ballots', 'counts')
+
+    def __init__(self, ballots: Iterable[Tuple[int, str]] = ()):
+        self.ballots: Dict[int, str] = {}
+        self.counts: Counter = Counter()
+        for user_id, choice in ballots:
+            self.cast(user_id, choice)
+
+    def cast(self, user_id: int, choice: str) -> Optional[str]:
+        """Record ``user_id``'s ballot and return their previous choice, if any."""
+        previous = self.ballots.get(user_id)
+        if previous == choice:
+            return previous
+        if previous is not None:
+            self.counts[previous] -= 1
+            if not self.counts[previous]:
+                del self.counts[previous]
+        self.ballots[user_id] = choice
+        self.counts[choice] += 1
+        return previous
+
+    def total(self) -> int:
+        """Number of users who have voted."""
+        return len(self.ballots)
+
+    def results(self) -> Dict[str, int]:
+        """Choice -> count, most votes first."""
+        return dict(self.counts.most_common())
+
+
+__all__ = ["VoteTally"]
@@ -0,0 +1,149 @@
+"""Write-behind batching for high-frequency, low-value database writes."""
+import logging
+import sqlite3
+import threading
+import time
+from typing import Callable, List, Optional
+
+from utils.config import DB_BATCH_INTERVAL_MS, DB_BATCH_MAX_OPS
+from utils.db_pool import ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+WriteOp = Callable[[sqlite3.Connection], None]
+
+SYNC = "sync"
+BATCHED = "batched"
+
+
+class WriteBehindQueue:
+    """
+    Group queued writes into one transaction on a background thread.
+
+    A batch is committed once it holds ``max_ops`` writes or ``interval_ms``
+    after its first write arrived, whichever comes first, so a burst of
+    clicks costs one fsync instead of one per click. ``flush()`` blocks until
+    everything submitted so far is on disk and ``close()`` drains the queue
+    before stopping the thread.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionManager,
+        interval_ms: int = DB_BATCH_INTERVAL_MS,
+        max_ops: int = DB_BATCH_MAX_OPS,
+    ):
+        self._pool = pool
+        self._interval = interval_ms / 1000
+        self._max_ops = max(1, max_ops)
+
+        self._cond = threading.Condition()
+        self._pending: List[WriteOp] = []
+        self._submitted = 0
+        self._written = 0
+        self._flush_requested = False
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"write-behind:{pool.db_path}", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, op: WriteOp, durability: str = BATCHED):
+        """Execute ``op`` now (``"sync"``) or queue it for the next batch (``"batched"``)."""
+        if durability == SYNC:
+            with self._pool.writer() as conn:
+                op(conn)
+            return
+        self.submit(op)
+
+    def submit(self, op: WriteOp):
+        """Queue ``op`` for the next batch."""
+        with self._cond:
+            if self._closed:
+                logger.warning("Write-behind queue closed; writing synchronously")
+            else:
+                self._pending.append(op)
+                self._submitted += 1
+                # Wake the writer to start the batch timer, or early on a full batch.
+                if len(self._pending) == 1 or len(self._pending) >= self._max_ops:
+                    self._cond.notify_all()
+                return
+
+        with self._pool.writer() as conn:
+            op(conn)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every write submitted before this call is committed."""
+        with self._cond:
+            target = self._submitted
+            if self._written >= target:
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: self._written >= target or not self._thread.is_alive(), timeout
+            )
+
+    @property
+    def pending(self) -> int:
+        """Number of writes waiting for the next batch."""
+        with self._cond:
+            return len(self._pending)
+
+    def close(self):
+        """Commit anything still queued and stop the background thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                deadline = None
+                while not (self._closed or self._flush_requested or len(self._pending) >= self._max_ops):
+                    if not self._pending:
+                        self._cond.wait()
+                        continue
+                    if deadline is None:
+                        deadline = time.monotonic() + self._interval
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch, self._pending = self._pending, []
+                self._flush_requested = False
+                closing = self._closed
+
+            if batch:
+                self._write_batch(batch)
+
+            with self._cond:
+                self._written += len(batch)
+                self._cond.notify_all()
+                if closing and not self._pending:
+                    return
+
+    def _write_batch(self, batch: List[WriteOp]):
+        try:
+            with self._pool.writer() as conn:
+                for op in batch:
+                    op(conn)
+            return
+        except Exception as e:
+            logger.error(f"Batched write of {len(batch)} ops failed, retrying individually: {e}")
+
+        # Retry one by one so a single bad row does not drop the whole batch.
+        for op in batch:
+            try:
+                with self._pool.writer() as conn:
+                    op(conn)
+            except Exception as e:
+                logger.error(f"Dropped batched write: {e}")
+
+
+__all__ = ["WriteBehindQueue", "SYNC", "BATCHED"]